@@ -0,0 +1,213 @@
+"""Content-addressed on-disk cache of cubes.
+
+The cached cubes are stored as NetCDF files with a name that is computed
+from a key describing how the cube was created. When the total size of the
+cache exceeds its maximum size, the least recently used files are removed.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import dask
+import iris
+from iris.cube import Cube
+
+logger = logging.getLogger(__name__)
+
+
+def get_file_fingerprint(path: Path | str) -> tuple[str, int, int]:
+    """Get a fingerprint of a file that changes when the file changes.
+
+    Parameters
+    ----------
+    path:
+        Path to the file.
+
+    Returns
+    -------
+    tuple[str, int, int]
+        The absolute path, size, and modification time of the file.
+    """
+    path = Path(path).absolute()
+    stat = path.stat()
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def get_source_fingerprint(objects: Iterable[Any]) -> str:
+    """Get a fingerprint of the source code defining some objects.
+
+    The source files of the classes of the objects and all their base classes
+    are taken into account, so the fingerprint changes when e.g. a fix is
+    modified.
+    """
+    files = set()
+    for obj in objects:
+        for cls in type(obj).__mro__:
+            try:
+                files.add(inspect.getsourcefile(cls))
+            except TypeError:
+                # Built-in classes
+                pass
+    hasher = hashlib.sha256()
+    for file in sorted(f for f in files if f is not None):
+        hasher.update(file.encode())
+        hasher.update(Path(file).read_bytes())
+    return hasher.hexdigest()
+
+
+def _normalize(item: Any) -> Any:
+    """Convert an item to a representation that does not vary between runs.
+
+    Objects that have a ``_get_fingerprint`` method are replaced by the
+    result of that method and dictionaries are sorted by key.
+    """
+    if hasattr(item, '_get_fingerprint'):
+        return item._get_fingerprint()
+    if isinstance(item, dict):
+        return tuple(
+            sorted(((k, _normalize(v)) for k, v in item.items()),
+                   key=lambda kv: repr(kv[0])))
+    if isinstance(item, (list, tuple)):
+        return tuple(_normalize(i) for i in item)
+    if isinstance(item, (set, frozenset)):
+        return tuple(sorted((_normalize(i) for i in item), key=repr))
+    if isinstance(item, Path):
+        return str(item)
+    return item
+
+
+def get_key(*items: Any) -> str:
+    """Compute a cache key from the representation of some items.
+
+    Objects that have a ``_get_fingerprint`` method, e.g.
+    :class:`esmvalcore.dataset.Dataset`, are represented by the result of
+    that method.
+    """
+    return hashlib.sha256(repr(_normalize(items)).encode()).hexdigest()
+
+
+class DataCache:
+    """On-disk cache of cubes with least recently used eviction.
+
+    Parameters
+    ----------
+    directory:
+        Directory where the cached cubes are stored.
+    max_size:
+        Maximum size of the cache in bytes. If it is exceeded after saving a
+        cube, the least recently used cubes are removed.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        max_size: Optional[float] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def path(self, key: str) -> Path:
+        """Get the path to the file that stores the cube for a key."""
+        return self.directory / f'{key}.nc'
+
+    def load(self, key: str) -> Optional[Cube]:
+        """Load a cube from the cache.
+
+        Parameters
+        ----------
+        key:
+            Cache key.
+
+        Returns
+        -------
+        iris.cube.Cube or None
+            The cube with lazy data, or ``None`` if it is not in the cache.
+        """
+        path = self.path(key)
+        try:
+            # Mark the file as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        logger.debug("Loading cached data from %s", path)
+        return iris.load_cube(str(path))
+
+    def save(
+        self,
+        key: str,
+        cube: Cube,
+        delayeds: Iterable[Any] = (),
+    ) -> Cube:
+        """Save a cube to the cache.
+
+        Parameters
+        ----------
+        key:
+            Cache key.
+        cube:
+            The cube to save.
+        delayeds:
+            Dask collections that are computed together with the data of the
+            cube, e.g. checks of the data values. The cube is not added to
+            the cache if computing them fails.
+
+        Returns
+        -------
+        iris.cube.Cube
+            The cube loaded from the cache, so its data does not need to be
+            computed again.
+        """
+        from esmvalcore.preprocessor import save
+
+        path = self.path(key)
+        # Write to a temporary file first, so other processes never read a
+        # partially written file.
+        tmp_path = path.with_name(f'.{path.stem}.{uuid.uuid4()}.nc')
+        logger.debug("Saving data to cache %s", path)
+        delayeds = list(delayeds)
+        try:
+            if delayeds:
+                dask.compute(save([cube], str(tmp_path), compute=False),
+                             *delayeds)
+            else:
+                save([cube], str(tmp_path))
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        tmp_path.replace(path)
+        self.evict(keep=path)
+        return iris.load_cube(str(path))
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Remove the least recently used files if the cache is too large.
+
+        Parameters
+        ----------
+        keep:
+            Never remove this file.
+        """
+        if self.max_size is None:
+            return
+        files = []
+        for path in self.directory.glob('*.nc'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            logger.debug("Removing %s from cache", path)
+            path.unlink(missing_ok=True)
+            total_size -= size
@@ -0,0 +1,254 @@
+"""Index of files on the local filesystem.
+
+Searching for files with :func:`glob.glob` is slow on large (parallel)
+filesystems, because many directories need to be listed for every dataset.
+The :class:`LocalIndex` stores the paths of all files below the configured
+root paths in an SQLite database, so file searches can be answered by the
+database instead. The index is updated incrementally: only directories that
+were modified since the previous update are listed again.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER
+);
+CREATE INDEX IF NOT EXISTS directories_parent ON directories (parent);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    directory TEXT,
+    start_date TEXT,
+    end_date TEXT
+);
+CREATE INDEX IF NOT EXISTS files_directory ON files (directory);
+"""
+
+
+def _match(path: str, pattern: str) -> bool:
+    """Check if a path matches a glob pattern like :func:`glob.glob` does.
+
+    Unlike the SQLite ``GLOB`` operator, wildcards do not match the
+    directory separator or a leading ``.`` of a file or directory name.
+    """
+    parts = path.split(os.sep)
+    pattern_parts = pattern.split(os.sep)
+    if len(parts) != len(pattern_parts):
+        return False
+    for part, pattern_part in zip(parts, pattern_parts):
+        if part.startswith('.') and not pattern_part.startswith('.'):
+            return False
+        if not fnmatchcase(part, pattern_part):
+            return False
+    return True
+
+
+def _subtree(path: str) -> tuple[str, str]:
+    """Get the range of paths below a directory for use in a query."""
+    # The character after os.sep in the ASCII table
+    return path + os.sep, path + chr(ord(os.sep) + 1)
+
+
+class LocalIndex:
+    """Index of files on the local filesystem.
+
+    Parameters
+    ----------
+    path:
+        Path to the SQLite database file that stores the index.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path).expanduser()
+        self._roots: Optional[list[str]] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database."""
+        connection = sqlite3.connect(self.path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def roots(self) -> list[str]:
+        """Get the root directories that are indexed."""
+        if self._roots is None:
+            if self.path.exists():
+                with closing(self._connect()) as connection:
+                    rows = connection.execute("SELECT path FROM roots")
+                    self._roots = [row[0] for row in rows]
+            else:
+                self._roots = []
+        return self._roots
+
+    def covers(self, pattern: Path | str) -> bool:
+        """Check if the files matching a glob pattern are in the index."""
+        pattern = os.path.abspath(pattern)
+        return any(
+            pattern.startswith(root + os.sep) for root in self.roots())
+
+    def update(self, rootpaths: Iterable[Path | str]) -> None:
+        """Add root directories to the index or update them.
+
+        Parameters
+        ----------
+        rootpaths:
+            Root directories to index. Root directories that were indexed
+            before, but are not in this list, are kept in the index.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._roots = None
+        with closing(self._connect()) as connection:
+            for rootpath in rootpaths:
+                rootpath = os.path.abspath(rootpath)
+                logger.info("Indexing files in %s", rootpath)
+                with connection:
+                    connection.execute(
+                        "INSERT OR IGNORE INTO roots VALUES (?)", (rootpath, ))
+                    n_dirs = self._update_tree(connection, rootpath)
+                logger.info("Checked %s directories in %s", n_dirs, rootpath)
+
+    def _update_tree(self, connection: sqlite3.Connection,
+                     rootpath: str) -> int:
+        """Update the index for all directories below ``rootpath``."""
+        n_dirs = 0
+        stack: list[tuple[str, Optional[str]]] = [(rootpath, None)]
+        while stack:
+            path, parent = stack.pop()
+            n_dirs += 1
+            subdirs = self._update_directory(connection, path, parent)
+            stack.extend((subdir, path) for subdir in subdirs)
+        return n_dirs
+
+    def _update_directory(
+        self,
+        connection: sqlite3.Connection,
+        path: str,
+        parent: Optional[str],
+    ) -> list[str]:
+        """Update the index for a single directory.
+
+        Returns
+        -------
+        list[str]
+            The subdirectories of the directory.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._remove_tree(connection, path)
+            return []
+
+        row = connection.execute(
+            "SELECT mtime_ns FROM directories WHERE path = ?",
+            (path, )).fetchone()
+        old_subdirs = {
+            subdir
+            for subdir, in connection.execute(
+                "SELECT path FROM directories WHERE parent = ?", (path, ))
+        }
+        if row is not None and row[0] == mtime:
+            # The content of the directory did not change.
+            return sorted(old_subdirs)
+
+        # Import here to avoid a circular import.
+        from .local import _get_start_end_date_from_filename
+
+        files = []
+        subdirs = []
+        realpath = os.path.realpath(path)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if not is_dir:
+                    files.append(entry.path)
+                elif entry.is_symlink() and (realpath + os.sep).startswith(
+                        os.path.realpath(entry.path) + os.sep):
+                    logger.debug("Skipping link to parent directory %s",
+                                 entry.path)
+                else:
+                    subdirs.append(entry.path)
+
+        for subdir in old_subdirs - set(subdirs):
+            self._remove_tree(connection, subdir)
+        connection.execute("DELETE FROM files WHERE directory = ?", (path, ))
+        connection.executemany(
+            "INSERT INTO files VALUES (?, ?, ?, ?)",
+            ((file, path, *_get_start_end_date_from_filename(file))
+             for file in files),
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+            (path, parent, mtime),
+        )
+        return subdirs
+
+    @staticmethod
+    def _remove_tree(connection: sqlite3.Connection, path: str) -> None:
+        """Remove a directory and everything below it from the index."""
+        start, end = _subtree(path)
+        for table in ('directories', 'files'):
+            connection.execute(
+                f"DELETE FROM {table} WHERE path = ? "
+                "OR (path >= ? AND path < ?)",
+                (path, start, end),
+            )
+
+    def glob(self, pattern: Path | str) -> list[Path]:
+        """Find the files matching a glob pattern.
+
+        Parameters
+        ----------
+        pattern:
+            Glob pattern, as used by :func:`glob.glob`.
+
+        Returns
+        -------
+        list[pathlib.Path]
+            The files that match the pattern.
+        """
+        return list(self.glob_with_dates(pattern))
+
+    def glob_with_dates(
+        self,
+        pattern: Path | str,
+    ) -> dict[Path, tuple[Optional[str], Optional[str]]]:
+        """Find the files matching a glob pattern and their dates.
+
+        Parameters
+        ----------
+        pattern:
+            Glob pattern, as used by :func:`glob.glob`.
+
+        Returns
+        -------
+        dict[pathlib.Path, tuple[str | None, str | None]]
+            The files that match the pattern and the start and end date
+            parsed from their file name, or ``None`` if the file name does not
+            contain dates.
+        """
+        pattern = os.path.abspath(pattern)
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT path, start_date, end_date FROM files "
+                "WHERE path GLOB ?", (pattern, ))
+            return {
+                Path(path): (start_date, end_date)
+                for path, start_date, end_date in rows
+                if _match(path, pattern)
+            }
@@ -94,8 +94,11 @@ def process_recipe(recipe_file: Path, session):
     logger.info("PLOTDIR    = %s", session.plot_dir)
     logger.info(70 * "-")
 
-    n_processes = session['max_parallel_tasks'] or os.cpu_count()
-    logger.info("Running tasks using at most %s processes", n_processes)
+    if session['task_scheduler'] == 'distributed':
+        logger.info("Running tasks on a Dask distributed cluster")
+    else:
+        n_processes = session['max_parallel_tasks'] or os.cpu_count()
+        logger.info("Running tasks using at most %s processes", n_processes)
 
     logger.info(
         "If your system hangs during execution, it may not have enough "
@@ -277,6 +280,53 @@ class Recipes():
         print(installed_recipe.read_text(encoding='utf-8'))
 
 
+class Data():
+    """Manage the index of input data on the local filesystem.
+
+    This group contains utilities to maintain the index that is used to find
+    input data more quickly, see the ``local_file_index`` option in the user
+    configuration file.
+    """
+
+    @staticmethod
+    def index(config_file=None, project=None):
+        """Create or update the index of the files in the rootpaths.
+
+        Only directories that were modified since the previous run are listed
+        again, so updating an existing index is much faster than creating it.
+
+        Parameters
+        ----------
+        config_file: str, optional
+            Configuration file to use. If not provided the file
+            ${HOME}/.esmvaltool/config-user.yml will be used.
+        project: str, optional
+            Only index the rootpaths of this project. If not provided, the
+            rootpaths of all projects are indexed.
+        """
+        from ._local_index import LocalIndex
+        from .config import CFG
+        from .config._logging import configure_logging
+        configure_logging(console_log_level='info')
+        CFG.load_from_file(config_file)
+        if CFG['local_file_index'] is None:
+            logger.error(
+                "Please set 'local_file_index' in the configuration file to "
+                "the path where the index should be stored.")
+            return
+
+        rootpath = CFG['rootpath']
+        if project is None:
+            rootpaths = [p for paths in rootpath.values() for p in paths]
+        else:
+            rootpaths = rootpath.get(project, rootpath.get('default', []))
+        rootpaths = [p for p in dict.fromkeys(rootpaths) if p.is_dir()]
+
+        index = LocalIndex(CFG['local_file_index'])
+        index.update(rootpaths)
+        logger.info("Updated index %s", index.path)
+
+
 class ESMValTool():
     """A community tool for routine evaluation of Earth system models.
 
@@ -308,6 +358,12 @@ class ESMValTool():
                              entry_point.name)
                 continue
             self.__setattr__(entry_point.name, entry_point.load()())
+        # ESMValTool also provides a 'data' command, so add the index command
+        # to it if it is installed.
+        if not hasattr(self, 'data'):
+            self.data = Data()
+        elif not hasattr(self.data, 'index'):
+            self.data.index = Data.index
 
     def version(self):
         """Show versions of all packages that conform ESMValTool.
@@ -332,6 +388,7 @@ class ESMValTool():
             search_esgf=None,
             diagnostics=None,
             check_level=None,
+            refresh_esgf_cache=None,
             **kwargs):
         """Execute an ESMValTool recipe.
 
@@ -381,6 +438,9 @@ class ESMValTool():
             `relaxed` (only fail if there are critical errors),
             default (fail if there are any errors),
             strict (fail if there are any warnings).
+        refresh_esgf_cache: bool, optional
+            If True, search ESGF again instead of using search results
+            stored by previous runs.
         """
         from .config import CFG
 
@@ -402,6 +462,8 @@ class ESMValTool():
             session['search_esgf'] = search_esgf
         if skip_nonexistent is not None:
             session['skip_nonexistent'] = skip_nonexistent
+        if refresh_esgf_cache is not None:
+            session['refresh_esgf_cache'] = refresh_esgf_cache
         session['resume_from'] = parse_resume(resume_from, recipe)
         session.update(kwargs)
 
@@ -442,6 +504,9 @@ class ESMValTool():
         if session['search_esgf'] != 'never':
             from .esgf._logon import logon
             logon()
+            if session['refresh_esgf_cache']:
+                from .esgf._search import expire_search_cache
+                expire_search_cache()
 
         # configure resource logger and run program
         from ._task import resource_usage_logger
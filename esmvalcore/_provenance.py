@@ -257,6 +257,12 @@ class TrackedFile:
             for key, value in attributes.items():
                 setattr(dataset, key, value)
 
+    @staticmethod
+    def _include_provenance_zarr(filename, attributes):
+        import zarr  # pylint: disable=import-outside-toplevel
+        group = zarr.open_group(str(filename), mode='r+')
+        group.attrs.update(attributes)
+
     @staticmethod
     def _include_provenance_png(filename, attributes):
         pnginfo = PngInfo()
@@ -14,11 +14,12 @@ import yamale
 
 from esmvalcore.exceptions import InputFilesNotFound, RecipeError
 from esmvalcore.local import _get_start_end_year, _parse_period
-from esmvalcore.preprocessor import TIME_PREPROCESSORS, PreprocessingTask
-from esmvalcore.preprocessor._multimodel import STATISTIC_MAPPING
-from esmvalcore.preprocessor._supplementary_vars import (
-    PREPROCESSOR_SUPPLEMENTARIES,
+from esmvalcore.preprocessor import (
+    TIME_PREPROCESSORS,
+    PreprocessingTask,
+    _get_supplementaries,
 )
+from esmvalcore.preprocessor._multimodel import STATISTIC_MAPPING
 
 logger = logging.getLogger(__name__)
 
@@ -186,11 +187,11 @@ def data_availability(dataset, log=True):
 
 def preprocessor_supplementaries(dataset, settings):
     """Check that the required supplementary variables have been added."""
-    steps = [step for step in settings if step in PREPROCESSOR_SUPPLEMENTARIES]
+    steps = [step for step in settings if _get_supplementaries(step)]
     supplementaries = {d.facets['short_name'] for d in dataset.supplementaries}
 
     for step in steps:
-        ancs = PREPROCESSOR_SUPPLEMENTARIES[step]
+        ancs = _get_supplementaries(step)
         for short_name in ancs['variables']:
             if short_name in supplementaries:
                 break
@@ -4,6 +4,7 @@ from __future__ import annotations
 import fnmatch
 import logging
 import os
+import threading
 import warnings
 from collections import defaultdict
 from copy import deepcopy
@@ -16,12 +17,13 @@ import yaml
 
 from esmvalcore import __version__, esgf
 from esmvalcore._provenance import get_recipe_provenance
-from esmvalcore._task import DiagnosticTask, ResumeTask, TaskSet
+from esmvalcore._task import BaseTask, DiagnosticTask, ResumeTask, TaskSet
 from esmvalcore.cmor.table import CMOR_TABLES, _update_cmor_facets
 from esmvalcore.config import CFG
 from esmvalcore.config._config import TASKSEP, get_project_config
 from esmvalcore.config._diagnostics import TAGS
 from esmvalcore.dataset import Dataset
+from esmvalcore.esgf._download import DownloadError
 from esmvalcore.exceptions import (
     ESMValCoreDeprecationWarning,
     InputFilesNotFound,
@@ -41,6 +43,7 @@ from esmvalcore.preprocessor import (
     MULTI_MODEL_FUNCTIONS,
     PreprocessingTask,
     PreprocessorFile,
+    _get_supplementaries,
 )
 from esmvalcore.preprocessor._other import _group_products
 from esmvalcore.preprocessor._regrid import (
@@ -49,9 +52,6 @@ from esmvalcore.preprocessor._regrid import (
     get_reference_levels,
     parse_cell_spec,
 )
-from esmvalcore.preprocessor._supplementary_vars import (
-    PREPROCESSOR_SUPPLEMENTARIES,
-)
 from esmvalcore.typing import Facets
 
 from . import check
@@ -226,8 +226,12 @@ def _get_default_settings(dataset):
     # Strip supplementary variables before saving
     settings['remove_supplementary_variables'] = {}
 
-    # Configure saving cubes to file
-    settings['save'] = {'compress': session['compress_netcdf']}
+    # Configure saving cubes to file, the data of all output files of a
+    # task is written concurrently after they have been processed
+    settings['save'] = {
+        'compress': session['compress_netcdf'],
+        'compute': False,
+    }
     if facets['short_name'] != facets['original_short_name']:
         settings['save']['alias'] = facets['short_name']
 
@@ -325,8 +329,7 @@ def _get_supplementaries_from_fx_variables(
     """Read supplementary facets from `fx_variables` in preprocessor."""
     supplementaries = []
     for step, kwargs in settings.items():
-        allowed = PREPROCESSOR_SUPPLEMENTARIES.get(step,
-                                                   {}).get('variables', [])
+        allowed = (_get_supplementaries(step) or {}).get('variables', [])
         if fx_variables := kwargs.get('fx_variables'):
 
             if isinstance(fx_variables, list):
@@ -452,6 +455,56 @@ def _schedule_for_download(datasets):
         )
 
 
+def _get_input_files(task: BaseTask) -> list[Path]:
+    """Get the input files of a preprocessing task."""
+    return [
+        file for product in task.products
+        for file in getattr(product, '_input_files', [])
+    ]
+
+
+class _BackgroundDownload(threading.Thread):
+    """Download files from ESGF while the tasks are running.
+
+    Parameters
+    ----------
+    files:
+        The files to download, in the order in which they are needed.
+    dest_folder:
+        The destination folder.
+    """
+
+    def __init__(self, files: list[esgf.ESGFFile], dest_folder: Path):
+        super().__init__(name='esgf-download', daemon=True)
+        self.files = files
+        self.dest_folder = dest_folder
+        self.error: Exception | None = None
+
+    def run(self) -> None:
+        """Download the files."""
+        try:
+            esgf.download(self.files, self.dest_folder, ordered=True)
+        except Exception as exc:
+            self.error = exc
+
+    def is_available(self, task: BaseTask) -> bool:
+        """Check if the input files of a task have been downloaded.
+
+        Raises
+        ------
+        esmvalcore.esgf._download.DownloadError:
+            Raised if downloading failed and some input files of the task
+            are missing.
+        """
+        if all(Path(file).exists() for file in _get_input_files(task)):
+            return True
+        if self.is_alive():
+            return False
+        if self.error is not None:
+            raise self.error
+        raise DownloadError(f"Input files for task {task.name} are missing")
+
+
 def _check_input_files(input_datasets: Iterable[Dataset]) -> set[str]:
     """Check that the required input files are available."""
     missing = set()
@@ -616,6 +669,9 @@ def _update_multiproduct(input_products, order, preproc_dir, step):
                                             statistic_attributes[step])
             filename = _get_multiproduct_filename(statistic_attributes,
                                                   preproc_dir)
+            # Use the same file format as the input products
+            if Path(next(iter(products)).filename).suffix == '.zarr':
+                filename = filename.with_suffix('.zarr')
             statistic_product = PreprocessorFile(
                 filename=filename,
                 attributes=statistic_attributes,
@@ -720,6 +776,8 @@ def _get_preprocessor_products(
             dataset.facets,
             dataset.session.preproc_dir,
         )
+        if dataset.session['preprocessor_output_format'] == 'zarr':
+            filename = filename.with_suffix('.zarr')
         product = PreprocessorFile(
             filename=filename,
             attributes=dataset.facets,
@@ -868,6 +926,7 @@ def _get_preprocessor_task(datasets, profiles, task_name):
         order=order,
         debug=session['save_intermediary_cubes'],
         write_ncl_interface=session['write_ncl_interface'],
+        memory_budget=session['preprocessor_memory_budget'],
     )
 
     logger.info("PreprocessingTask %s created.", task.name)
@@ -1291,6 +1350,23 @@ class Recipe:
         # Return smallest possible set of tasks
         return tasks.get_independent()
 
+    def _get_download_order(self) -> list[esgf.ESGFFile]:
+        """Sort the files to download in the order the tasks will run."""
+        download_dir = self.session['download_dir']
+        files = {
+            file.local_file(download_dir): file
+            for file in self._download_files
+        }
+        order = {}
+        tasks = sorted(self.tasks.flatten(), key=lambda t: t.priority)
+        for task in tasks:
+            for local_file in _get_input_files(task):
+                if local_file in files:
+                    order.setdefault(files.pop(local_file), None)
+        # Files that are not used by any task go last
+        order.update(dict.fromkeys(sorted(files.values())))
+        return list(order)
+
     def __str__(self):
         """Get human readable summary."""
         return '\n\n'.join(str(task) for task in self.tasks)
@@ -1302,10 +1378,29 @@ class Recipe:
         filled_recipe = self.write_filled_recipe()
 
         # Download required data
+        download = None
         if self.session['search_esgf'] != 'never':
-            esgf.download(self._download_files, self.session['download_dir'])
-
-        self.tasks.run(max_parallel_tasks=self.session['max_parallel_tasks'])
+            if self.session['run_while_downloading']:
+                # The download is started by the task runner, after it has
+                # created its pool of processes.
+                download = _BackgroundDownload(
+                    self._get_download_order(),
+                    self.session['download_dir'],
+                )
+            else:
+                esgf.download(self._download_files,
+                              self.session['download_dir'])
+
+        self.tasks.run(
+            max_parallel_tasks=self.session['max_parallel_tasks'],
+            task_scheduler=self.session['task_scheduler'],
+            dask_cluster=self.session['dask_cluster'],
+            memory_budget=self.session['task_memory_budget'],
+            is_available=None if download is None else download.is_available,
+            on_start=None if download is None else download.start,
+        )
+        if download is not None:
+            download.join()
         logger.info(
             "Wrote recipe with version numbers and wildcards "
             "to:\nfile://%s", filled_recipe)
@@ -7,17 +7,20 @@ from numbers import Number
 from pathlib import Path
 from typing import Any, Iterable, Iterator
 
+from esmvalcore import esgf
 from esmvalcore.cmor.table import _CMOR_KEYS, _update_cmor_facets
 from esmvalcore.config import Session
 from esmvalcore.dataset import Dataset, _isglob
 from esmvalcore.esgf.facets import FACETS
 from esmvalcore.exceptions import RecipeError
-from esmvalcore.local import LocalFile, _replace_years_with_timerange
+from esmvalcore.local import (
+    LocalFile,
+    _prefetch_directories,
+    _replace_years_with_timerange,
+)
+from esmvalcore.preprocessor import _get_supplementaries
 from esmvalcore.preprocessor._derive import get_required
 from esmvalcore.preprocessor._io import DATASET_KEYS
-from esmvalcore.preprocessor._supplementary_vars import (
-    PREPROCESSOR_SUPPLEMENTARIES,
-)
 from esmvalcore.typing import Facets, FacetValue
 
 from . import check
@@ -204,7 +207,7 @@ def _get_supplementary_short_names(
     is_ocean_variable = any(realm in ocean_realms for realm in realms)
 
     # Guess the best matching supplementary variable based on the realm.
-    short_names = PREPROCESSOR_SUPPLEMENTARIES[step]['variables']
+    short_names = _get_supplementaries(step)['variables']
     if set(short_names) == {'areacella', 'areacello'}:
         short_names = ['areacello'] if is_ocean_variable else ['areacella']
     if set(short_names) == {'sftlf', 'sftof'}:
@@ -219,7 +222,7 @@ def _append_missing_supplementaries(
     settings: dict[str, Any],
 ) -> None:
     """Append wildcard definitions for missing supplementary variables."""
-    steps = [step for step in settings if step in PREPROCESSOR_SUPPLEMENTARIES]
+    steps = [step for step in settings if _get_supplementaries(step)]
 
     project: str = facets['project']  # type: ignore
     for step in steps:
@@ -345,9 +348,7 @@ def _get_datasets_for_variable(
         "Populating list of datasets for variable %s in "
         "diagnostic %s", variable_group, diagnostic_name)
 
-    datasets = []
-    idx = 0
-
+    templates = []
     for facets, supplementaries in _get_facets_from_recipe(
             recipe,
             diagnostic_name=diagnostic_name,
@@ -361,17 +362,84 @@ def _get_datasets_for_variable(
                 template1.add_supplementary(**supplementary_facets)
             for supplementary_ds in template1.supplementaries:
                 supplementary_ds.facets.pop('preprocessor', None)
-            for dataset in _dataset_from_files(template1):
-                dataset['variable_group'] = variable_group
-                dataset['diagnostic'] = diagnostic_name
-                dataset['recipe_dataset_index'] = idx  # type: ignore
-                logger.debug("Found %s", dataset.summary(shorten=True))
-                datasets.append(dataset)
-                idx += 1
+            templates.append(template1)
+
+    _prefetch_input_directories(templates, session)
+    _prefetch_esgf_searches(templates, session)
+
+    datasets = []
+    idx = 0
+    for template1 in templates:
+        for dataset in _dataset_from_files(template1):
+            dataset['variable_group'] = variable_group
+            dataset['diagnostic'] = diagnostic_name
+            dataset['recipe_dataset_index'] = idx  # type: ignore
+            logger.debug("Found %s", dataset.summary(shorten=True))
+            datasets.append(dataset)
+            idx += 1
 
     return datasets
 
 
+def _prefetch_input_directories(
+    datasets: Iterable[Dataset],
+    session: Session,
+) -> None:
+    """List the directories that will be searched for input files at once.
+
+    This is much faster than searching for the files of each dataset and
+    supplementary dataset one after another.
+    """
+    facet_sets = []
+    for dataset in datasets:
+        dataset = dataset.copy()
+        try:
+            dataset.augment_facets()
+        except RecipeError:
+            # The error will be reported when searching for files.
+            continue
+        facet_sets.append(dataset.facets)
+        facet_sets.extend(ds.facets for ds in dataset.supplementaries)
+    _prefetch_directories(facet_sets, session._directory_listings)
+
+
+def _prefetch_esgf_searches(
+    datasets: Iterable[Dataset],
+    session: Session,
+) -> None:
+    """Search ESGF for the files of all datasets at once.
+
+    The search results are cached, so finding the files of each dataset
+    afterwards does not require searching ESGF again.
+    """
+    if session['search_esgf'] == 'never':
+        return
+
+    facet_sets = []
+    for dataset in datasets:
+        dataset = dataset.copy()
+        try:
+            dataset.augment_facets()
+        except RecipeError:
+            # The error will be reported when searching for files.
+            continue
+        for ds in [dataset, *dataset.supplementaries]:
+            # Wildcards in the timerange are resolved using the files found.
+            if '*' in str(ds.facets.get('timerange', '')):
+                ds.facets.pop('timerange')
+            ds._find_local_files()
+            if ds._needs_esgf_search():
+                facet_sets.append(ds.facets)
+
+    if facet_sets:
+        logger.debug("Searching ESGF for %s datasets", len(facet_sets))
+        try:
+            esgf.find_files_concurrently(facet_sets)
+        except FileNotFoundError:
+            # The error will be reported when searching for files.
+            pass
+
+
 def datasets_from_recipe(
     recipe: Path | str | dict[str, Any],
     session: Session,
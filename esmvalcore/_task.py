@@ -2,10 +2,13 @@
 import abc
 import contextlib
 import datetime
+import heapq
+import itertools
 import logging
 import numbers
 import os
 import pprint
+import queue
 import subprocess
 import sys
 import textwrap
@@ -15,13 +18,14 @@ from copy import deepcopy
 from multiprocessing import Pool
 from pathlib import Path, PosixPath
 from shutil import which
-from typing import Optional
+from typing import Callable, Optional
 
 import psutil
 import yaml
 
 from ._citation import _write_citation_files
 from ._provenance import TrackedFile, get_task_provenance
+from .config._dask import get_distributed_client
 from .config._diagnostics import DIAGNOSTICS, TAGS
 
 
@@ -39,6 +43,9 @@ DATASET_KEYS = {
     'mip',
 }
 
+AVAILABILITY_INTERVAL = 1
+"""Interval (in seconds) for checking if a task can be started."""
+
 
 def _get_resource_usage(process, start_time, children=True):
     """Get resource usage."""
@@ -270,6 +277,10 @@ class BaseTask:
     def _run(self, input_files):
         """Run task."""
 
+    def estimate_memory(self) -> int:
+        """Estimate the amount of memory needed to run the task in bytes."""
+        return 0
+
     def get_product_attributes(self) -> dict:
         """Return a mapping of product attributes."""
         return {
@@ -703,94 +714,236 @@ class TaskSet(set):
 
     def get_independent(self) -> 'TaskSet':
         """Return a set of independent tasks."""
-        independent_tasks = TaskSet()
         all_tasks = self.flatten()
-        for task in all_tasks:
-            if not any(task in t.ancestors for t in all_tasks):
-                independent_tasks.add(task)
-        return independent_tasks
-
-    def run(self, max_parallel_tasks: Optional[int] = None) -> None:
+        ancestors = {a for task in all_tasks for a in task.ancestors}
+        return TaskSet(t for t in all_tasks if t not in ancestors)
+
+    def run(
+        self,
+        max_parallel_tasks: Optional[int] = None,
+        task_scheduler: str = 'multiprocessing',
+        dask_cluster: Optional[dict] = None,
+        memory_budget: Optional[float] = None,
+        is_available: Optional[Callable[[BaseTask], bool]] = None,
+        on_start: Optional[Callable[[], None]] = None,
+    ) -> None:
         """Run tasks.
 
         Parameters
         ----------
         max_parallel_tasks : int
             Number of processes to run. If `1`, run the tasks sequentially.
+        task_scheduler : str
+            Backend used to run the tasks, either ``'multiprocessing'`` or
+            ``'distributed'``.
+        dask_cluster : dict
+            Configuration of the Dask distributed cluster used if
+            ``task_scheduler`` is ``'distributed'``.
+        memory_budget : float
+            Amount of memory in GB available for running tasks in parallel.
+            If `None`, tasks are started based on `max_parallel_tasks` only.
+        is_available : callable
+            Function that returns whether a task can be started, e.g.
+            because its input files have been downloaded. Tasks that are not
+            available are checked again every `AVAILABILITY_INTERVAL`
+            seconds. If `None`, all tasks are available.
+        on_start : callable
+            Function without arguments that is called right before the first
+            task is started, e.g. to start a thread. When running tasks in a
+            pool of processes, it is called after the pool has been created,
+            so the processes are not forked while the thread is running.
         """
-        if max_parallel_tasks == 1:
-            self._run_sequential()
-        else:
-            self._run_parallel(max_parallel_tasks)
+        with get_distributed_client(task_scheduler, dask_cluster) as client:
+            if max_parallel_tasks == 1:
+                # If a client was created, it is the default Dask scheduler,
+                # so the computations inside the tasks run on the cluster.
+                self._run_sequential(is_available=is_available,
+                                     on_start=on_start)
+            else:
+                self._run_parallel(max_parallel_tasks,
+                                   client=client,
+                                   memory_budget=memory_budget,
+                                   is_available=is_available,
+                                   on_start=on_start)
 
-    def _run_sequential(self) -> None:
+    def _run_sequential(self, is_available=None, on_start=None) -> None:
         """Run tasks sequentially."""
         n_tasks = len(self.flatten())
         logger.info("Running %s tasks sequentially", n_tasks)
+        if on_start is not None:
+            on_start()
 
         tasks = self.get_independent()
         for task in sorted(tasks, key=lambda t: t.priority):
+            if is_available is not None:
+                # Ancestors are run as part of the task.
+                for task0 in task.flatten():
+                    while not is_available(task0):
+                        time.sleep(AVAILABILITY_INTERVAL)
             task.run()
 
-    def _run_parallel(self, max_parallel_tasks=None):
-        """Run tasks in parallel."""
-        scheduled = self.flatten()
-        running = {}
-
-        n_tasks = n_scheduled = len(scheduled)
-        n_running = 0
+    def _run_parallel(self,
+                      max_parallel_tasks=None,
+                      client=None,
+                      memory_budget=None,
+                      is_available=None,
+                      on_start=None):
+        """Run tasks in parallel.
+
+        A task becomes ready as soon as all its ancestors have completed.
+        Ready tasks are started in order of priority, as long as there are
+        fewer than `max_parallel_tasks` tasks running and, if a
+        `memory_budget` (in GB) is given, the estimated memory needed by the
+        running tasks and the new task fits within it. Ready tasks for which
+        `is_available` returns False are skipped until they become available.
+        If given, `on_start` is called once the pool of processes has been
+        created, before the first task is started.
+
+        If `client` is `None`, the tasks are run in a pool of local
+        processes, otherwise they are submitted to the Dask distributed
+        cluster that `client` is connected to.
+        """
+        tasks = self.flatten()
+        n_tasks = len(tasks)
 
         if max_parallel_tasks is None:
-            max_parallel_tasks = os.cpu_count()
+            if client is None:
+                max_parallel_tasks = os.cpu_count()
+            else:
+                max_parallel_tasks = sum(client.nthreads().values())
         max_parallel_tasks = min(max_parallel_tasks, n_tasks)
-        logger.info("Running %s tasks using %s processes", n_tasks,
-                    max_parallel_tasks)
-
-        def done(task):
-            """Assume a task is done if it not scheduled or running."""
-            return not (task in scheduled or task in running)
-
-        with Pool(processes=max_parallel_tasks) as pool:
-            while scheduled or running:
-                # Submit new tasks to pool
-                for task in sorted(scheduled, key=lambda t: t.priority):
-                    if len(running) >= max_parallel_tasks:
-                        break
-                    if all(done(t) for t in task.ancestors):
-                        future = pool.apply_async(_run_task, [task])
-                        running[task] = future
-                        scheduled.remove(task)
-
-                # Handle completed tasks
-                ready = {t for t in running if running[t].ready()}
-                for task in ready:
-                    _copy_results(task, running[task])
-                    running.pop(task)
-
-                # Wait if there are still tasks running
-                if running:
-                    time.sleep(0.1)
+        if client is None:
+            logger.info("Running %s tasks using %s processes", n_tasks,
+                        max_parallel_tasks)
+            executor = Pool(processes=max_parallel_tasks)
+        else:
+            logger.info(
+                "Running %s tasks using at most %s tasks in parallel on Dask "
+                "distributed cluster %s", n_tasks, max_parallel_tasks,
+                client.scheduler.address)
+            executor = contextlib.nullcontext(client)
+
+        if memory_budget is None:
+            memory = dict.fromkeys(tasks, 0)
+        else:
+            memory = {task: task.estimate_memory() for task in tasks}
+            memory_budget = memory_budget * 2**30
+            logger.info("Using a memory budget of %.1f GB for running tasks",
+                        memory_budget / 2**30)
+
+        # Build the task graph: a task can start when it no longer waits for
+        # any of its ancestors.
+        n_waiting_for = {task: len(set(task.ancestors)) for task in tasks}
+        children = {task: [] for task in tasks}
+        for task in tasks:
+            for ancestor in set(task.ancestors):
+                children[ancestor].append(task)
+
+        # Ready tasks are ordered by priority, ties by order of becoming ready
+        ready = []
+        counter = itertools.count()
+
+        def make_ready(task):
+            heapq.heappush(ready, (task.priority, next(counter), task))
+
+        for task in tasks:
+            if not n_waiting_for[task]:
+                make_ready(task)
+
+        # Completed tasks are reported by callbacks, so there is no need to
+        # poll the running tasks.
+        completed = queue.Queue()
+
+        def submit(task):
+            if client is None:
+                executor.apply_async(
+                    _run_task,
+                    [task],
+                    callback=lambda result: completed.put((task, result)),
+                    error_callback=lambda exc: completed.put((task, exc)),
+                )
+            else:
+                future = client.submit(_run_task_on_cluster, task, pure=False)
+                future.add_done_callback(
+                    lambda future: completed.put((task, future)))
+
+        def fits(task):
+            if memory_budget is None or not running:
+                return True
+            return sum(running.values()) + memory[task] <= memory_budget
+
+        running = {}
+        n_done = 0
+        with executor:
+            # Threads should only be started after the processes in the pool
+            # have been forked.
+            if on_start is not None:
+                on_start()
+            while n_done < n_tasks:
+                # Submit new tasks
+                unavailable = []
+                while (ready and len(running) < max_parallel_tasks
+                       and fits(ready[0][-1])):
+                    item = heapq.heappop(ready)
+                    task = item[-1]
+                    if is_available is None or is_available(task):
+                        submit(task)
+                        running[task] = memory[task]
+                    else:
+                        unavailable.append(item)
+                for item in unavailable:
+                    heapq.heappush(ready, item)
+
+                # Wait for a task to complete, or check again if a task
+                # that was not available yet has become available.
+                timeout = AVAILABILITY_INTERVAL if unavailable else None
+                try:
+                    task, result = completed.get(timeout=timeout)
+                except queue.Empty:
+                    continue
+                if client is not None:
+                    result = result.result()
+                elif isinstance(result, BaseException):
+                    raise result
+                _copy_results(task, result)
+                running.pop(task)
+                n_done += 1
+                for child in children[task]:
+                    n_waiting_for[child] -= 1
+                    if not n_waiting_for[child]:
+                        make_ready(child)
 
                 # Log progress message
-                if len(scheduled) != n_scheduled or len(running) != n_running:
-                    n_scheduled, n_running = len(scheduled), len(running)
-                    n_done = n_tasks - n_scheduled - n_running
-                    logger.info(
-                        "Progress: %s tasks running, %s tasks waiting for "
-                        "ancestors, %s/%s done", n_running, n_scheduled,
-                        n_done, n_tasks)
+                logger.info(
+                    "Progress: %s tasks running, %s tasks waiting, %s/%s "
+                    "done", len(running), n_tasks - n_done - len(running),
+                    n_done, n_tasks)
 
             logger.info("Successfully completed all tasks.")
-            pool.close()
-            pool.join()
+            if client is None:
+                executor.close()
+                executor.join()
 
 
-def _copy_results(task, future):
+def _copy_results(task, result):
     """Update task with the results from the remote process."""
-    task.output_files, task.products = future.get()
+    task.output_files, task.products = result
 
 
 def _run_task(task):
     """Run task and return the result."""
     output_files = task.run()
     return output_files, task.products
+
+
+def _run_task_on_cluster(task):
+    """Run task on a Dask distributed worker and return the result.
+
+    The worker leaves its thread pool while the task is running, so the Dask
+    computations inside the task can be scheduled on the whole cluster.
+    """
+    import dask
+    from distributed import worker_client
+
+    with worker_client() as client, dask.config.set(scheduler=client):
+        return _run_task(task)
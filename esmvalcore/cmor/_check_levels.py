@@ -0,0 +1,22 @@
+"""Levels of strictness of the CMOR checks.
+
+This is kept separate from :mod:`esmvalcore.cmor.check`, so the
+configuration can use it without importing iris.
+"""
+from enum import IntEnum
+
+CheckLevels = IntEnum(
+    'CheckLevels',
+    'DEBUG STRICT DEFAULT RELAXED IGNORE',
+    module='esmvalcore.cmor.check',
+)
+CheckLevels.__doc__ = """Level of strictness of the checks.
+
+   Attributes
+   ------
+   - DEBUG: Report any debug message that the checker wants to communicate.
+   - STRICT: Fail if there are warnings regarding compliance of CMOR standards.
+   - DEFAULT: Fail if cubes present any discrepancy with CMOR standards.
+   - RELAXED: Fail if cubes present severe discrepancies with CMOR standards.
+   - IGNORE: Do not fail for any discrepancy with CMOR standards.
+"""
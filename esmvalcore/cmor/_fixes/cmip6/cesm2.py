@@ -1,8 +1,5 @@
 """Fixes for CESM2 model."""
-from shutil import copyfile
-
 import numpy as np
-from netCDF4 import Dataset
 
 from ..common import SiconcFixScalarCoord
 from ..fix import Fix
@@ -25,21 +22,20 @@ class Cl(Fix):
         add_unique_suffix=False,
     ):
         """Fix ``formula_terms`` attribute."""
-        new_path = self.get_fixed_filepath(
-            output_dir, filepath, add_unique_suffix=add_unique_suffix
-        )
-        copyfile(filepath, new_path)
-        dataset = Dataset(new_path, mode='a')
-        dataset.variables['lev'].formula_terms = 'p0: p0 a: a b: b ps: ps'
-        dataset.variables['lev'].standard_name = (
-            'atmosphere_hybrid_sigma_pressure_coordinate')
-        dataset.close()
-        return new_path
+        overlay = self.get_overlay(filepath)
+        overlay.set_attribute('formula_terms', 'p0: p0 a: a b: b ps: ps',
+                              variable='lev')
+        overlay.set_attribute('standard_name',
+                              'atmosphere_hybrid_sigma_pressure_coordinate',
+                              variable='lev')
+        return overlay
 
     def fix_file(self, filepath, output_dir, add_unique_suffix=False):
         """Fix hybrid pressure coordinate.
 
-        Adds missing ``formula_terms`` attribute to file.
+        Adds missing ``formula_terms`` attribute to file and reverses the
+        bounds of the coefficients ``a`` and ``b``. The file is not copied,
+        these changes are applied when the file is loaded.
 
         Note
         ----
@@ -50,7 +46,7 @@ class Cl(Fix):
 
         Parameters
         ----------
-        filepath : str
+        filepath : str or FileOverlay
             Path to the original file.
         output_dir: Path
             Output directory for fixed files.
@@ -59,18 +55,16 @@ class Cl(Fix):
 
         Returns
         -------
-        str
-            Path to the fixed file.
+        FileOverlay
+            Overlay describing the changes to the original file.
 
         """
-        new_path = self._fix_formula_terms(
+        overlay = self._fix_formula_terms(
             filepath, output_dir, add_unique_suffix=add_unique_suffix
         )
-        dataset = Dataset(new_path, mode='a')
-        dataset.variables['a_bnds'][:] = dataset.variables['a_bnds'][::-1, :]
-        dataset.variables['b_bnds'][:] = dataset.variables['b_bnds'][::-1, :]
-        dataset.close()
-        return new_path
+        for name in ('a_bnds', 'b_bnds'):
+            overlay.set_data(name, overlay.get_data(name)[::-1, :])
+        return overlay
 
     def fix_metadata(self, cubes):
         """Fix ``atmosphere_hybrid_sigma_pressure_coordinate``.
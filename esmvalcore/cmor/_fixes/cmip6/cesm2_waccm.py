@@ -1,6 +1,4 @@
 """Fixes for CESM2-WACCM model."""
-from netCDF4 import Dataset
-
 from ..common import SiconcFixScalarCoord
 from .cesm2 import Cl as BaseCl
 from .cesm2 import Fgco2 as BaseFgco2
@@ -14,7 +12,9 @@ class Cl(BaseCl):
     def fix_file(self, filepath, output_dir, add_unique_suffix=False):
         """Fix hybrid pressure coordinate.
 
-        Adds missing ``formula_terms`` attribute to file.
+        Adds missing ``formula_terms`` attribute to file and reverses the
+        bounds of the coefficients ``a`` and ``b``. The file is not copied,
+        these changes are applied when the file is loaded.
 
         Note
         ----
@@ -25,7 +25,7 @@ class Cl(BaseCl):
 
         Parameters
         ----------
-        filepath : str
+        filepath : str or FileOverlay
             Path to the original file.
         output_dir: Path
             Output directory for fixed files.
@@ -34,18 +34,16 @@ class Cl(BaseCl):
 
         Returns
         -------
-        str
-            Path to the fixed file.
+        FileOverlay
+            Overlay describing the changes to the original file.
 
         """
-        new_path = self._fix_formula_terms(
+        overlay = self._fix_formula_terms(
             filepath, output_dir, add_unique_suffix=add_unique_suffix
         )
-        dataset = Dataset(new_path, mode='a')
-        dataset.variables['a_bnds'][:] = dataset.variables['a_bnds'][:, ::-1]
-        dataset.variables['b_bnds'][:] = dataset.variables['b_bnds'][:, ::-1]
-        dataset.close()
-        return new_path
+        for name in ('a_bnds', 'b_bnds'):
+            overlay.set_data(name, overlay.get_data(name)[:, ::-1])
+        return overlay
 
 
 Cli = Cl
@@ -12,7 +12,6 @@ variable) as single argument.
 """
 
 import logging
-from shutil import copyfile
 
 import dask.array as da
 import iris.analysis
@@ -20,7 +19,6 @@ import iris.util
 from iris import NameConstraint
 from iris.aux_factory import HybridPressureFactory
 from iris.cube import CubeList
-from netCDF4 import Dataset
 from scipy import constants
 
 from ..shared import add_aux_coords_from_cubes
@@ -47,20 +45,16 @@ class AllVars(EmacFix):
         This fix removes the ``formula_terms`` attribute of the hybrid pressure
         level variables to make the corresponding coefficients appear correctly
         in the class:`iris.cube.CubeList` object returned by :mod:`iris.load`.
+        The file is not copied, the attribute is removed when the file is
+        loaded.
 
         """
         if 'alevel' not in self.vardef.dimensions:
             return filepath
-        new_path = self.get_fixed_filepath(
-            output_dir, filepath, add_unique_suffix=add_unique_suffix
-        )
-        copyfile(filepath, new_path)
-        with Dataset(new_path, mode='a') as dataset:
-            if 'formula_terms' in dataset.variables['lev'].ncattrs():
-                del dataset.variables['lev'].formula_terms
-            if 'formula_terms' in dataset.variables['ilev'].ncattrs():
-                del dataset.variables['ilev'].formula_terms
-        return new_path
+        overlay = self.get_overlay(filepath)
+        overlay.delete_attribute('formula_terms', variable='lev')
+        overlay.delete_attribute('formula_terms', variable='ilev')
+        return overlay
 
     def fix_metadata(self, cubes):
         """Fix metadata."""
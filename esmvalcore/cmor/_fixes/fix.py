@@ -4,9 +4,11 @@ from __future__ import annotations
 import importlib
 import inspect
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from ..table import CMOR_TABLES
+from .overlay import FileOverlay
 
 
 class Fix:
@@ -31,20 +33,28 @@ class Fix:
 
     def fix_file(
         self,
-        filepath: Path,
+        filepath: Path | FileOverlay,
         output_dir: Path,
         add_unique_suffix: bool = False,
-    ) -> Path:
+    ) -> Path | FileOverlay:
         """Apply fixes to the files prior to creating the cube.
 
         Should be used only to fix errors that prevent loading or cannot be
         fixed in the cube (e.g., those related to `missing_value` or
         `_FillValue`).
 
+        Fixes that only change attributes, rename or drop variables, or
+        replace the values of small variables should not write a fixed copy
+        of the file, but describe the changes with a
+        :class:`~esmvalcore.cmor._fixes.overlay.FileOverlay` obtained from
+        :meth:`get_overlay` instead.
+
         Parameters
         ----------
-        filepath: Path
-            File to fix.
+        filepath: Path or FileOverlay
+            File to fix. This is a
+            :class:`~esmvalcore.cmor._fixes.overlay.FileOverlay` if a
+            previous fix has described its changes with one.
         output_dir: Path
             Output directory for fixed files.
         add_unique_suffix: bool, optional (default: False)
@@ -52,14 +62,35 @@ class Fix:
 
         Returns
         -------
-        Path
-            Path to the corrected file. It can be different from the original
-            filepath if a fix has been applied, but if not it should be the
-            original filepath.
+        Path or FileOverlay
+            Path to the corrected file or overlay describing the changes to
+            the original file. It can be different from the original filepath
+            if a fix has been applied, but if not it should be the original
+            filepath.
 
         """
         return filepath
 
+    @staticmethod
+    def get_overlay(filepath: str | Path | FileOverlay) -> FileOverlay:
+        """Get an overlay to describe changes to a file without copying it.
+
+        Parameters
+        ----------
+        filepath: str or Path or FileOverlay
+            File to fix. If this is already an overlay, it is returned so
+            that the changes of several fixes are combined.
+
+        Returns
+        -------
+        FileOverlay
+            Overlay that is applied when the file is loaded.
+
+        """
+        if isinstance(filepath, FileOverlay):
+            return filepath
+        return FileOverlay(filepath)
+
     def fix_metadata(self, cubes):
         """Apply fixes to the metadata of the cube.
 
@@ -180,37 +211,14 @@ class Fix:
         if extra_facets is None:
             extra_facets = {}
 
-        fixes = []
-
-        fixes_modules = []
+        driver = None
         if project == 'cordex':
             driver = extra_facets['driver'].replace('-', '_').lower()
             extra_facets['dataset'] = dataset
-            try:
-                fixes_modules.append(importlib.import_module(
-                    f'esmvalcore.cmor._fixes.{project}.{driver}.{dataset}'
-                ))
-            except ImportError:
-                pass
-            fixes_modules.append(importlib.import_module(
-                'esmvalcore.cmor._fixes.cordex.cordex_fixes'))
-        else:
-            try:
-                fixes_modules.append(importlib.import_module(
-                    f'esmvalcore.cmor._fixes.{project}.{dataset}'))
-            except ImportError:
-                pass
-
-        for fixes_module in fixes_modules:
-            classes = inspect.getmembers(fixes_module, inspect.isclass)
-            classes = dict((name.lower(), value) for name, value in classes)
-            for fix_name in (short_name, mip.lower(), 'allvars'):
-                try:
-                    fixes.append(classes[fix_name](vardef, extra_facets))
-                except KeyError:
-                    pass
-
-        return fixes
+
+        fix_classes = _get_fix_classes(project, dataset, mip.lower(),
+                                       short_name, driver)
+        return [fix_class(vardef, extra_facets) for fix_class in fix_classes]
 
     @staticmethod
     def get_fixed_filepath(
@@ -245,3 +253,62 @@ class Fix:
         else:
             output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir / Path(filepath).name
+
+
+@lru_cache(maxsize=None)
+def _get_fix_module_names() -> frozenset[str]:
+    """Get the names of all modules that may contain fixes."""
+    root = Path(__file__).parent
+    names = set()
+    for path in root.rglob('*.py'):
+        parts = path.relative_to(root).with_suffix('').parts
+        if parts[-1] == '__init__':
+            parts = parts[:-1]
+        names.add('.'.join(('esmvalcore.cmor._fixes', *parts)))
+    return frozenset(names)
+
+
+@lru_cache(maxsize=None)
+def _get_module_classes(module_name: str) -> dict[str, type]:
+    """Get the classes defined in a module by lower case name."""
+    module = importlib.import_module(module_name)
+    classes = inspect.getmembers(module, inspect.isclass)
+    return {name.lower(): value for name, value in classes}
+
+
+def _get_dataset_classes(module_name: str) -> dict[str, type]:
+    """Get the classes defined in a dataset module, if it exists."""
+    if module_name not in _get_fix_module_names():
+        return {}
+    try:
+        return _get_module_classes(module_name)
+    except ImportError:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _get_fix_classes(
+    project: str,
+    dataset: str,
+    mip: str,
+    short_name: str,
+    driver: str | None = None,
+) -> tuple[type, ...]:
+    """Get the fix classes for a dataset in the order they are applied.
+
+    The arguments are expected to be normalized as in
+    :meth:`Fix.get_fixes`. The result is cached, so after the first call
+    finding the fixes for a dataset is a dictionary lookup.
+    """
+    package = 'esmvalcore.cmor._fixes'
+    if project == 'cordex':
+        modules = [
+            _get_dataset_classes(f'{package}.{project}.{driver}.{dataset}'),
+            _get_module_classes(f'{package}.cordex.cordex_fixes'),
+        ]
+    else:
+        modules = [_get_dataset_classes(f'{package}.{project}.{dataset}')]
+
+    return tuple(classes[fix_name] for classes in modules
+                 for fix_name in (short_name, mip, 'allvars')
+                 if fix_name in classes)
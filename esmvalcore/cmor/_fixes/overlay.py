@@ -0,0 +1,425 @@
+"""In-memory changes to NetCDF files that are applied while loading them.
+
+File fixes that only need to change the metadata of a file (e.g., add,
+rename, or remove attributes, rename or drop variables) or the values of a
+few small variables do not need to write a fixed copy of the input file.
+Instead, they can describe these changes with a :class:`FileOverlay`, which
+is applied by :func:`esmvalcore.preprocessor.load` when the file is read.
+The data of all variables that are not changed is still read lazily from the
+original file.
+
+Loading overlays requires iris 3.8 or later, see :func:`overlays_supported`.
+With older versions of iris, the changes are written to a fixed copy of the
+file with :meth:`FileOverlay.write` instead.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import dask.array as da
+import iris
+import netCDF4
+import numpy as np
+from iris.fileformats.netcdf import NetCDFDataProxy
+from packaging.version import Version
+
+try:
+    # Use the same lock as iris, because the netCDF library is not thread-safe
+    from iris.fileformats.netcdf._thread_safe_nc import (
+        _GLOBAL_NETCDF4_LOCK as _NETCDF4_LOCK,
+    )
+except ImportError:  # iris < 3.5
+    _NETCDF4_LOCK = threading.Lock()
+
+_DELETED = object()
+
+# Number of values that are copied at once by FileOverlay.write
+_COPY_SIZE = 2**24
+
+# Attributes used by the netCDF library to decode the data. Data that is read
+# lazily from the original file is always decoded with the original values, so
+# these cannot be changed by an overlay.
+_DECODING_ATTRIBUTES = (
+    '_FillValue',
+    'add_offset',
+    'missing_value',
+    'scale_factor',
+    'valid_max',
+    'valid_min',
+    'valid_range',
+)
+
+
+def overlays_supported() -> bool:
+    """Check if the installed version of iris can load overlays.
+
+    Loading a :class:`FileOverlay` relies on iris loading objects that behave
+    like a :class:`netCDF4.Dataset` and reading the data of variables from
+    their ``_data_array`` attribute.
+    """
+    return Version(iris.__version__) >= Version('3.8')
+
+
+class FileOverlay:
+    """Changes to a NetCDF file that are applied when the file is loaded.
+
+    Parameters
+    ----------
+    filepath:
+        Path to the original file. This file is never modified.
+    """
+
+    def __init__(self, filepath: str | Path) -> None:
+        self.filepath = Path(filepath)
+        self._attributes: dict[str | None, dict[str, Any]] = {}
+        self._renamed_variables: dict[str, str] = {}
+        self._dropped_variables: set[str] = set()
+        self._data: dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        """Create a string representation."""
+        return f"{self.__class__.__name__}({repr(str(self.filepath))})"
+
+    def _original_name(self, variable: str) -> str:
+        """Get the name of `variable` in the original file."""
+        for original, new in self._renamed_variables.items():
+            if new == variable:
+                return original
+        return variable
+
+    def _check_variable(self, variable: str | None) -> None:
+        if variable is not None and variable in self._dropped_variables:
+            raise KeyError(f"Variable '{variable}' has been dropped from "
+                           f"{self.filepath}")
+
+    def set_attribute(
+        self,
+        name: str,
+        value: Any,
+        variable: str | None = None,
+    ) -> None:
+        """Set an attribute.
+
+        Parameters
+        ----------
+        name:
+            Name of the attribute.
+        value:
+            Value of the attribute.
+        variable:
+            Name of the variable. If ``None``, set a global attribute.
+
+        Raises
+        ------
+        ValueError
+            The attribute is used to decode the data of the variable.
+        """
+        self._check_variable(variable)
+        if variable is not None and name in _DECODING_ATTRIBUTES:
+            raise ValueError(
+                f"Attribute '{name}' of variable '{variable}' cannot be "
+                f"changed by an overlay, because it is needed to decode the "
+                f"data in {self.filepath}")
+        self._attributes.setdefault(variable, {})[name] = value
+
+    def delete_attribute(self, name: str, variable: str | None = None) -> None:
+        """Delete an attribute if it exists.
+
+        Parameters
+        ----------
+        name:
+            Name of the attribute.
+        variable:
+            Name of the variable. If ``None``, delete a global attribute.
+        """
+        self.set_attribute(name, _DELETED, variable=variable)
+
+    def rename_attribute(
+        self,
+        name: str,
+        new_name: str,
+        variable: str | None = None,
+    ) -> None:
+        """Rename an attribute if it exists.
+
+        Parameters
+        ----------
+        name:
+            Current name of the attribute.
+        new_name:
+            New name of the attribute.
+        variable:
+            Name of the variable. If ``None``, rename a global attribute.
+        """
+        value = self.get_attribute(name, variable=variable)
+        if value is _DELETED:
+            return
+        self.set_attribute(new_name, value, variable=variable)
+        self.delete_attribute(name, variable=variable)
+
+    def get_attribute(self, name: str, variable: str | None = None) -> Any:
+        """Get the value of an attribute with the overlay applied."""
+        self._check_variable(variable)
+        attributes = self._attributes.get(variable, {})
+        if name in attributes:
+            return attributes[name]
+        with _NETCDF4_LOCK, netCDF4.Dataset(self.filepath) as dataset:
+            if variable is None:
+                obj = dataset
+            else:
+                obj = dataset.variables[self._original_name(variable)]
+            if name in obj.ncattrs():
+                return obj.getncattr(name)
+        return _DELETED
+
+    def rename_variable(self, variable: str, new_name: str) -> None:
+        """Rename a variable.
+
+        References to the variable in attributes of other variables (e.g.,
+        ``coordinates`` or ``bounds``) are not updated.
+
+        Parameters
+        ----------
+        variable:
+            Current name of the variable.
+        new_name:
+            New name of the variable.
+        """
+        self._check_variable(variable)
+        original = self._original_name(variable)
+        self._renamed_variables[original] = new_name
+        for values in (self._attributes, self._data):
+            if variable in values:
+                values[new_name] = values.pop(variable)
+
+    def drop_variable(self, variable: str) -> None:
+        """Drop a variable.
+
+        Parameters
+        ----------
+        variable:
+            Name of the variable.
+        """
+        self._attributes.pop(variable, None)
+        self._data.pop(variable, None)
+        self._dropped_variables.add(variable)
+
+    def set_data(self, variable: str, data: Any) -> None:
+        """Replace the data of a variable.
+
+        The new data is kept in memory, so this should only be used for small
+        variables (e.g., coordinates or their bounds) or with a
+        :class:`dask.array.Array`.
+
+        Parameters
+        ----------
+        variable:
+            Name of the variable.
+        data:
+            New values. Must have the same shape as the variable.
+        """
+        self._check_variable(variable)
+        self._data[variable] = data
+
+    def get_data(self, variable: str) -> Any:
+        """Get the values of a variable with the overlay applied."""
+        self._check_variable(variable)
+        if variable in self._data:
+            return self._data[variable]
+        with _NETCDF4_LOCK, netCDF4.Dataset(self.filepath) as dataset:
+            return dataset.variables[self._original_name(variable)][:]
+
+    def write(self, target: str | Path) -> Path:
+        """Write a copy of the file with the overlay applied.
+
+        Parameters
+        ----------
+        target:
+            Path of the new file.
+
+        Returns
+        -------
+        :
+            Path of the new file.
+        """
+        target = Path(target)
+        with _NETCDF4_LOCK, netCDF4.Dataset(self.filepath) as src:
+            with netCDF4.Dataset(target, 'w', format=src.data_model) as dst:
+                _copy_group(src, dst, self)
+        return target
+
+    def open(self) -> _OverlayDataset:
+        """Open the file with the overlay applied.
+
+        Returns
+        -------
+        :
+            Object that behaves like a read-only :class:`netCDF4.Dataset` and
+            that can be loaded with :func:`iris.load_raw`. Needs to be closed
+            after use.
+        """
+        return _OverlayDataset(self)
+
+
+def _copy_group(src, dst, overlay: FileOverlay | None = None) -> None:
+    """Copy a netCDF4 group, applying `overlay` to its variables."""
+    overlay_attributes = overlay._attributes if overlay else {}
+
+    def get_attributes(obj, changes, exclude=()):
+        values = {n: obj.getncattr(n) for n in obj.ncattrs()}
+        values.update(changes)
+        return {
+            n: v
+            for n, v in values.items()
+            if v is not _DELETED and n not in exclude
+        }
+
+    dst.setncatts(get_attributes(src, overlay_attributes.get(None, {})))
+    for name, dimension in src.dimensions.items():
+        dst.createDimension(
+            name, None if dimension.isunlimited() else len(dimension))
+
+    for original, variable in src.variables.items():
+        name = original
+        if overlay is not None:
+            name = overlay._renamed_variables.get(original, original)
+            if name in overlay._dropped_variables:
+                continue
+        filters = variable.filters() or {}
+        chunking = variable.chunking()
+        new = dst.createVariable(
+            name,
+            variable.datatype,
+            variable.dimensions,
+            zlib=filters.get('zlib', False),
+            complevel=filters.get('complevel', 4),
+            shuffle=filters.get('shuffle', True),
+            fletcher32=filters.get('fletcher32', False),
+            chunksizes=None if chunking == 'contiguous' else chunking,
+            fill_value=getattr(variable, '_FillValue', None),
+        )
+        new.setncatts(
+            get_attributes(variable, overlay_attributes.get(name, {}),
+                           exclude=('_FillValue', )))
+
+        data = overlay._data.get(name) if overlay is not None else None
+        if data is not None:
+            new[...] = np.asanyarray(data)
+            continue
+        # Copy the encoded values
+        variable.set_auto_maskandscale(False)
+        new.set_auto_maskandscale(False)
+        if variable.ndim == 0:
+            new[...] = variable[...]
+            continue
+        row_size = max(1, int(np.prod(variable.shape[1:])))
+        step = max(1, _COPY_SIZE // row_size)
+        for start in range(0, variable.shape[0], step):
+            new[start:start + step] = variable[start:start + step]
+
+    for name, group in src.groups.items():
+        _copy_group(group, dst.createGroup(name))
+
+
+class _OverlayObject:
+    """Read-only view on a netCDF4 object with changed attributes."""
+
+    def __init__(self, obj, attributes: dict[str, Any]) -> None:
+        self._obj = obj
+        self._attributes = attributes
+
+    def ncattrs(self) -> list[str]:
+        with _NETCDF4_LOCK:
+            names = list(self._obj.ncattrs())
+        names.extend(n for n in self._attributes if n not in names)
+        return [n for n in names if self._attributes.get(n) is not _DELETED]
+
+    def getncattr(self, name: str) -> Any:
+        if name in self._attributes:
+            value = self._attributes[name]
+            if value is _DELETED:
+                raise AttributeError(f"NetCDF: Attribute not found: {name}")
+            return value
+        with _NETCDF4_LOCK:
+            return self._obj.getncattr(name)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__') or name in ('_obj', '_attributes'):
+            raise AttributeError(name)
+        if name in self._attributes:
+            return self.getncattr(name)
+        with _NETCDF4_LOCK:
+            return getattr(self._obj, name)
+
+
+class _OverlayVariable(_OverlayObject):
+    """Read-only view on a :class:`netCDF4.Variable` with an overlay."""
+
+    def __init__(self, variable, name, attributes, data=None) -> None:
+        super().__init__(variable, attributes)
+        self.name = name
+        if data is None and name != variable.name:
+            # The data of renamed variables needs to be read from the
+            # original variable, iris would look for the new name otherwise.
+            with _NETCDF4_LOCK:
+                path = variable.group().filepath()
+                fill_value = getattr(
+                    variable,
+                    '_FillValue',
+                    netCDF4.default_fillvals.get(variable.dtype.str[1:]),
+                )
+            proxy = NetCDFDataProxy(variable.shape, variable.dtype, path,
+                                    variable.name, fill_value)
+            data = da.from_array(
+                proxy,
+                chunks='auto',
+                asarray=False,
+                meta=np.ma.array(np.empty((0, ) * variable.ndim,
+                                          dtype=variable.dtype)),
+            )
+        if data is not None:
+            # iris uses this array instead of reading from the file
+            self._data_array = data
+
+    def __getitem__(self, key):
+        if '_data_array' in self.__dict__:
+            return np.asanyarray(self._data_array[key])
+        with _NETCDF4_LOCK:
+            return self._obj[key]
+
+
+class _OverlayDataset(_OverlayObject):
+    """Read-only view on a :class:`netCDF4.Dataset` with an overlay."""
+
+    def __init__(self, overlay: FileOverlay) -> None:
+        with _NETCDF4_LOCK:
+            dataset = netCDF4.Dataset(overlay.filepath, mode='r')
+        super().__init__(dataset, overlay._attributes.get(None, {}))
+        self.overlay = overlay
+        self.variables = {}
+        with _NETCDF4_LOCK:
+            original_variables = dict(dataset.variables)
+        for original, variable in original_variables.items():
+            name = overlay._renamed_variables.get(original, original)
+            if name in overlay._dropped_variables:
+                continue
+            self.variables[name] = _OverlayVariable(
+                variable,
+                name,
+                overlay._attributes.get(name, {}),
+                overlay._data.get(name),
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self) -> None:
+        """Close the original file."""
+        with _NETCDF4_LOCK:
+            if self._obj.isopen():
+                self._obj.close()
@@ -1,9 +1,13 @@
 """Module for checking iris cubes against their CMOR definitions."""
+import contextlib
+import copy
 import logging
+from contextvars import ContextVar
 from datetime import datetime
-from enum import IntEnum
 
 import cf_units
+import dask
+import dask.array as da
 import iris.coord_categorisation
 import iris.coords
 import iris.exceptions
@@ -12,19 +16,57 @@ import numpy as np
 
 from esmvalcore.iris_helpers import date2num
 
+from ._check_levels import CheckLevels
 from .table import CMOR_TABLES
 
-CheckLevels = IntEnum('CheckLevels', 'DEBUG STRICT DEFAULT RELAXED IGNORE')
-"""Level of strictness of the checks.
+# Lazy checks of the data values that are computed together with the data,
+# see _defer_data_checks.
+_DEFERRED_DATA_CHECKS: ContextVar = ContextVar('_DEFERRED_DATA_CHECKS',
+                                               default=None)
 
-   Attributes
-   ------
-   - DEBUG: Report any debug message that the checker wants to communicate.
-   - STRICT: Fail if there are warnings regarding compliance of CMOR standards.
-   - DEFAULT: Fail if cubes present any discrepancy with CMOR standards.
-   - RELAXED: Fail if cubes present severe discrepancies with CMOR standards.
-   - IGNORE: Do not fail for any discrepancy with CMOR standards.
-"""
+
+@contextlib.contextmanager
+def _defer_data_checks():
+    """Collect the checks of lazy data values instead of skipping them.
+
+    Checking the values of lazy data requires reading all data, so within
+    this context :meth:`CMORCheck.check_data` does not compute these checks
+    but adds a :class:`dask.delayed.Delayed` to the yielded list. Computing
+    it together with the data (e.g. when saving the data) runs the checks
+    without reading the data twice and reports the results. Checks that are
+    still in the list when leaving a nested context are passed on to the
+    enclosing one.
+    """
+    outer = _DEFERRED_DATA_CHECKS.get()
+    checks = []
+    token = _DEFERRED_DATA_CHECKS.set(checks)
+    try:
+        yield checks
+    finally:
+        _DEFERRED_DATA_CHECKS.reset(token)
+        if outer is not None:
+            outer.extend(checks)
+
+
+def _get_data_statistics(data, valid_min=None, valid_max=None):
+    """Get the statistics of the data needed by the checks of the values.
+
+    The statistics are lazy and computed in a single pass over the data.
+    """
+    data = da.asanyarray(data)
+    mask = da.ma.getmaskarray(data)
+    values = da.ma.getdata(data)
+    finite = da.isfinite(values)
+    valid = ~mask & finite
+    stats = {
+        'masked': mask.sum(),
+        'not_finite': (~mask & ~finite).sum(),
+    }
+    if valid_min is not None:
+        stats['below_valid_min'] = (valid & (values < valid_min)).sum()
+    if valid_max is not None:
+        stats['above_valid_max'] = (valid & (values > valid_max)).sum()
+    return stats
 
 
 def _get_next_month(month, year):
@@ -196,6 +238,10 @@ class CMORCheck():
         Assumes that metadata is correct, so you must call check_metadata prior
         to this.
 
+        The values of lazy data are only checked if this is called within
+        :func:`_defer_data_checks`, so they can be checked when the data is
+        computed anyway.
+
         It will also report some warnings in case of minor errors.
 
         Parameters
@@ -219,6 +265,7 @@ class CMORCheck():
                 self._cube.convert_units(units)
 
         self._check_coords_data()
+        self._check_data_values()
 
         self.report_warnings()
         self.report_errors()
@@ -278,6 +325,64 @@ class CMORCheck():
             ])
             self._logger.debug(msg)
 
+    def _check_data_values(self):
+        """Check the data for masked, non-finite, and out of range values."""
+        if (self._check_level == CheckLevels.IGNORE
+                or self._cube.dtype.kind not in 'fiu'):
+            return
+        valid_min = self._get_valid_limit('valid_min')
+        valid_max = self._get_valid_limit('valid_max')
+        stats = _get_data_statistics(self._cube.core_data(), valid_min,
+                                     valid_max)
+        if not self._cube.has_lazy_data():
+            stats, = dask.compute(stats)
+            self._report_data_values(stats, valid_min, valid_max)
+            return
+        checks = _DEFERRED_DATA_CHECKS.get()
+        if checks is None:
+            self._logger.debug(
+                "Not checking values of lazy data of variable %s",
+                self._cube.var_name)
+            return
+        checker = copy.copy(self)
+        checker._errors = []
+        checker._warnings = []
+        checker._debug_messages = []
+        checks.append(
+            dask.delayed(checker._report_deferred_data_values)(
+                stats, valid_min, valid_max))
+
+    def _get_valid_limit(self, name):
+        value = getattr(self._cmor_var, name, '')
+        if not value:
+            return None
+        return float(value)
+
+    def _report_data_values(self, stats, valid_min, valid_max):
+        """Report the results of the checks of the data values.
+
+        These findings are only reported as warnings, i.e. they are
+        only fatal with ``--check_level=strict``.
+        """
+        var_name = self._cube.var_name
+        if stats['masked'] == self._cube.core_data().size:
+            self.report_warning('{}: all values are masked', var_name)
+        if stats['not_finite']:
+            self.report_warning('{}: has {} non-finite values', var_name,
+                                int(stats['not_finite']))
+        if stats.get('below_valid_min'):
+            self.report_warning(self._vals_msg, var_name, '< valid_min =',
+                                valid_min)
+        if stats.get('above_valid_max'):
+            self.report_warning(self._vals_msg, var_name, '> valid_max =',
+                                valid_max)
+
+    def _report_deferred_data_values(self, stats, valid_min, valid_max):
+        """Report the results of deferred checks of the data values."""
+        self._report_data_values(stats, valid_min, valid_max)
+        self.report_warnings()
+        self.report_errors()
+
     def _check_fill_value(self):
         """Check fill value."""
         # Iris removes _FillValue/missing_value information if data has none
@@ -728,14 +833,18 @@ class CMORCheck():
 
         l_fix_coord_value = False
 
-        # Check coordinate value ranges
+        # Check coordinate value ranges, the extremes of lazy points are
+        # computed in a single pass
+        if coord_info.valid_min or coord_info.valid_max:
+            min_point, max_point = dask.compute(coord.core_points().min(),
+                                                coord.core_points().max())
         if coord_info.valid_min:
             valid_min = float(coord_info.valid_min)
-            if np.any(coord.core_points() < valid_min):
+            if min_point < valid_min:
                 if coord_info.standard_name == 'longitude' and \
                         self.automatic_fixes:
                     l_fix_coord_value = self._check_longitude_min(
-                        coord, var_name)
+                        min_point, var_name)
                 else:
                     self.report_critical(self._vals_msg, var_name,
                                          '< {} ='.format('valid_min'),
@@ -743,26 +852,27 @@ class CMORCheck():
 
         if coord_info.valid_max:
             valid_max = float(coord_info.valid_max)
-            if np.any(coord.core_points() > valid_max):
+            if max_point > valid_max:
                 if coord_info.standard_name == 'longitude' and \
                         self.automatic_fixes:
                     l_fix_coord_value = self._check_longitude_max(
-                        coord, var_name)
+                        max_point, var_name)
                 else:
                     self.report_critical(self._vals_msg, var_name,
                                          '> {} ='.format('valid_max'),
                                          valid_max)
 
         if l_fix_coord_value:
-            # cube.intersection only works for cells with 0 or 2 bounds
+            # Rolling the cube only works for cells with 0 or 2 bounds
             # Note: nbounds==0 means there are no bounds given, nbounds==2
             # implies a regular grid with bounds in the grid direction,
             # nbounds>2 implies an irregular grid with bounds given as vertices
             # of the cell polygon.
             if coord.ndim == 1 and coord.nbounds in (0, 2):
-                lon_extent = iris.coords.CoordExtent(coord, 0.0, 360., True,
-                                                     False)
-                self._cube = self._cube.intersection(lon_extent)
+                if not self._roll_longitude(coord):
+                    lon_extent = iris.coords.CoordExtent(
+                        coord, 0.0, 360., True, False)
+                    self._cube = self._cube.intersection(lon_extent)
             else:
                 new_lons = coord.core_points().copy()
                 new_lons = self._set_range_in_0_360(new_lons)
@@ -780,20 +890,53 @@ class CMORCheck():
         self._check_coord_monotonicity_and_direction(coord_info, coord,
                                                      var_name)
 
-    def _check_longitude_max(self, coord, var_name):
-        if np.any(coord.core_points() > 720):
+    def _check_longitude_max(self, max_point, var_name):
+        if max_point > 720:
             self.report_critical(
                 f'{var_name} longitude coordinate has values > 720 degrees')
             return False
         return True
 
-    def _check_longitude_min(self, coord, var_name):
-        if np.any(coord.core_points() < -360):
+    def _check_longitude_min(self, min_point, var_name):
+        if min_point < -360:
             self.report_critical(
                 f'{var_name} longitude coordinate has values < -360 degrees')
             return False
         return True
 
+    def _roll_longitude(self, coord):
+        """Move 1D longitudes to [0, 360) by rolling the cube.
+
+        In contrast to :meth:`iris.cube.Cube.intersection`, this only
+        reorders the data along the longitude dimension, so lazy data stays
+        lazy and keeps its chunks.
+
+        Returns
+        -------
+        bool
+            ``False`` if the longitudes are not monotonic after rolling them.
+        """
+        points = self._set_range_in_0_360(coord.points)
+        offsets = points - coord.points
+        shift = -int(np.argmin(points))
+        points = np.roll(points, shift)
+        if np.any(np.diff(points) <= 0):
+            return False
+        bounds = None
+        if coord.has_bounds():
+            bounds = np.roll(coord.bounds + offsets[:, np.newaxis], shift,
+                             axis=0)
+        if shift:
+            dim, = self._cube.coord_dims(coord)
+            index = [slice(None)] * self._cube.ndim
+            index[dim] = np.roll(np.arange(len(points)), shift)
+            self._cube = self._cube[tuple(index)]
+            coord = self._cube.coord(coord)
+        coord.bounds = None
+        coord.points = points
+        coord.bounds = bounds
+        return True
+
     @staticmethod
     def _set_range_in_0_360(array):
         """Convert longitude coordinate to [0, 360]."""
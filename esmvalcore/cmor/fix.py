@@ -4,6 +4,8 @@ All functions in this module will work even if no fixes are available
 for the given dataset. Therefore is recommended to apply them to all
 variables to be sure that all known errors are fixed.
 """
+from __future__ import annotations
+
 import logging
 from collections import defaultdict
 from pathlib import Path
@@ -11,6 +13,7 @@ from pathlib import Path
 from iris.cube import CubeList
 
 from ._fixes.fix import Fix
+from ._fixes.overlay import FileOverlay, overlays_supported
 from .check import CheckLevels, _get_cmor_checker
 
 logger = logging.getLogger(__name__)
@@ -24,8 +27,9 @@ def fix_file(
     mip: str,
     output_dir: Path,
     add_unique_suffix: bool = False,
+    allow_overlay: bool = False,
     **extra_facets,
-) -> Path:
+) -> Path | FileOverlay:
     """Fix files before ESMValTool can load them.
 
     This fixes are only for issues that prevent iris from loading the cube or
@@ -49,14 +53,21 @@ def fix_file(
         Output directory for fixed files.
     add_unique_suffix: bool, optional (default: False)
         Adds a unique suffix to `output_dir` for thread safety.
+    allow_overlay: bool, optional (default: False)
+        If True, fixes that only change the metadata of the file do not write
+        a fixed file, but return an overlay describing the changes instead.
+        The overlay can be loaded with :func:`esmvalcore.preprocessor.load`.
+        This requires iris 3.8 or later; with older versions of iris, a fixed
+        file is always written.
     **extra_facets: dict, optional
         Extra facets are mainly used for data outside of the big projects like
         CMIP, CORDEX, obs4MIPs. For details, see :ref:`extra_facets`.
 
     Returns
     -------
-    Path:
-        Path to the fixed file.
+    Path or esmvalcore.cmor._fixes.overlay.FileOverlay:
+        Path to the fixed file, or an overlay describing the changes to the
+        original file if `allow_overlay` is True.
     """
     # Update extra_facets with variable information given as regular arguments
     # to this function
@@ -75,6 +86,12 @@ def fix_file(
         file = fix.fix_file(
             file, output_dir, add_unique_suffix=add_unique_suffix
         )
+    if isinstance(file, FileOverlay) and not (allow_overlay
+                                              and overlays_supported()):
+        file = file.write(
+            Fix.get_fixed_filepath(output_dir,
+                                   file.filepath,
+                                   add_unique_suffix=add_unique_suffix))
     return file
 
 
@@ -8,10 +8,13 @@ from __future__ import annotations
 import copy
 import errno
 import glob
+import hashlib
 import json
 import logging
 import os
+import pickle
 import tempfile
+import uuid
 import warnings
 from collections import Counter
 from functools import lru_cache, total_ordering
@@ -29,6 +32,32 @@ CMORTable = Union['CMIP3Info', 'CMIP5Info', 'CMIP6Info', 'CustomInfo']
 CMOR_TABLES: dict[str, CMORTable] = {}
 """dict of str, obj: CMOR info objects."""
 
+
+def _get_cmor_tables_cache_dir() -> Path | None:
+    """Get the directory for storing parsed CMOR tables between runs.
+
+    The tables are read while the configuration is loaded, so the directory
+    is set with an environment variable rather than a configuration option.
+    """
+    cache_dir = os.environ.get(
+        'ESMVALTOOL_CMOR_TABLES_CACHE_DIR',
+        '~/.esmvaltool/cache/cmor-tables',
+    )
+    if not cache_dir:
+        return None
+    return Path(os.path.expandvars(cache_dir)).expanduser()
+
+
+CMOR_TABLES_CACHE_DIR: Path | None = _get_cmor_tables_cache_dir()
+"""Directory where the parsed CMOR tables are stored between runs.
+
+Set with the environment variable ``ESMVALTOOL_CMOR_TABLES_CACHE_DIR``. If
+``None``, the tables are not stored.
+"""
+
+MAX_CACHED_TABLES = 10
+"""Maximum number of sets of parsed CMOR tables kept in the cache."""
+
 _CMOR_KEYS = (
     'standard_name',
     'long_name',
@@ -131,6 +160,11 @@ def read_cmor_tables(cfg_developer: Optional[Path] = None) -> None:
 def _read_cmor_tables(cfg_file: Path, mtime: float) -> dict[str, CMORTable]:
     """Read cmor tables required in the configuration.
 
+    If :obj:`CMOR_TABLES_CACHE_DIR` is set, the parsed tables are stored in
+    it, so they only need to be parsed again when config-developer.yml or
+    any of the table files change. Tables loaded from the cache are only
+    unpickled when they are first used.
+
     Parameters
     ----------
     cfg_file: pathlib.Path
@@ -142,6 +176,90 @@ def _read_cmor_tables(cfg_file: Path, mtime: float) -> dict[str, CMORTable]:
     """
     with cfg_file.open('r', encoding='utf-8') as file:
         cfg_developer = yaml.safe_load(file)
+
+    if CMOR_TABLES_CACHE_DIR is None:
+        return _parse_cmor_tables(cfg_developer)
+
+    key = _get_cache_key(cfg_file, cfg_developer)
+    cmor_tables = _load_cached_tables(key)
+    if cmor_tables is None:
+        cmor_tables = _parse_cmor_tables(cfg_developer)
+        _save_cached_tables(key, cmor_tables)
+    return cmor_tables
+
+
+def _get_cache_key(cfg_file: Path, cfg_developer: dict) -> str:
+    """Get a key that changes when the CMOR tables need to be read again."""
+    install_dir = Path(__file__).parent
+    table_paths = {install_dir / 'tables' / 'custom'}
+    for project, settings in cfg_developer.items():
+        if project == 'custom':
+            default_path = 'custom'
+        else:
+            default_path = settings.get('cmor_type', 'CMIP5').lower()
+        table_path = str(settings.get('cmor_path', default_path))
+        table_path = os.path.expandvars(os.path.expanduser(table_path))
+        table_paths.add(Path(table_path))
+        table_paths.add(install_dir / 'tables' / table_path)
+
+    hasher = hashlib.sha256()
+    for file in (Path(__file__), cfg_file,
+                 install_dir / 'variable_alt_names.yml'):
+        hasher.update(file.read_bytes())
+    for table_path in sorted(table_paths):
+        for root, dirs, files in os.walk(table_path):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                hasher.update(
+                    f'{path}:{stat.st_size}:{stat.st_mtime_ns}'.encode())
+    return hasher.hexdigest()
+
+
+def _load_cached_tables(key: str) -> dict[str, CMORTable] | None:
+    """Load parsed CMOR tables from the cache."""
+    path = CMOR_TABLES_CACHE_DIR / f'{key}.pickle'
+    try:
+        with path.open('rb') as file:
+            cmor_tables = pickle.load(file)
+        # Mark the file as recently used
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug("Unable to read cached CMOR tables from %s: %s", path,
+                     exc)
+        return None
+    return cmor_tables
+
+
+def _save_cached_tables(key: str, cmor_tables: dict[str, CMORTable]) -> None:
+    """Store parsed CMOR tables in the cache."""
+    path = CMOR_TABLES_CACHE_DIR / f'{key}.pickle'
+    # Write to a temporary file first, so other processes never read a
+    # partially written file.
+    tmp_path = path.with_name(f'.{path.stem}.{uuid.uuid4()}.pickle')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open('wb') as file:
+            pickle.dump(cmor_tables, file, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+    except (OSError, pickle.PicklingError) as exc:
+        logger.debug("Unable to store CMOR tables in %s: %s", path, exc)
+        tmp_path.unlink(missing_ok=True)
+        return
+
+    # Remove the least recently used files
+    files = sorted(CMOR_TABLES_CACHE_DIR.glob('*.pickle'),
+                   key=lambda f: f.stat().st_mtime_ns,
+                   reverse=True)
+    for file in files[MAX_CACHED_TABLES:]:
+        file.unlink(missing_ok=True)
+
+
+def _parse_cmor_tables(cfg_developer: dict) -> dict[str, CMORTable]:
+    """Parse the cmor tables required in the configuration."""
     cwd = os.path.dirname(os.path.realpath(__file__))
     var_alt_names_file = os.path.join(cwd, 'variable_alt_names.yml')
     with open(var_alt_names_file, 'r') as yfile:
@@ -202,6 +320,41 @@ def _read_table(cfg_developer, table, install_dir, custom, alt_names):
     raise ValueError(f'Unsupported CMOR type {cmor_type}')
 
 
+class _LazyTableDict(dict):
+    """Dictionary of tables that are unpickled when they are first used.
+
+    When the dictionary is pickled, each table is pickled separately, so
+    loading a pickled :class:`InfoBase` object is cheap and only the tables
+    that are actually used need to be unpickled.
+    """
+
+    def __getitem__(self, key):
+        table = super().__getitem__(key)
+        if isinstance(table, bytes):
+            table = pickle.loads(table)
+            super().__setitem__(key, table)
+        return table
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def __reduce__(self):
+        tables = {
+            key: table if isinstance(table, bytes) else pickle.dumps(
+                table, protocol=pickle.HIGHEST_PROTOCOL)
+            for key, table in super().items()
+        }
+        return (self.__class__, (tables, ))
+
+
 class InfoBase():
     """Base class for all table info classes.
 
@@ -227,6 +380,12 @@ class InfoBase():
         self.strict = strict
         self.tables = {}
 
+    def __getstate__(self):
+        """Get the state for pickling, with tables that load lazily."""
+        state = self.__dict__.copy()
+        state['tables'] = _LazyTableDict(self.tables)
+        return state
+
     def get_table(self, table):
         """Search and return the table info.
 
@@ -771,6 +930,12 @@ class CMIP5Info(InfoBase):
         cmor_tables_path = os.path.join(cwd, 'tables', cmor_tables_path)
         return cmor_tables_path
 
+    def __getstate__(self):
+        """Get the state for pickling, without the table file being read."""
+        state = super().__getstate__()
+        state['_current_table'] = None
+        return state
+
     def _load_table(self, table_file, table_name=''):
         if table_name and table_name in self.tables:
             # special case used for updating a table with custom variable file
@@ -10,7 +10,7 @@ from typing import Optional, Union
 import yaml
 
 import esmvalcore
-from esmvalcore.cmor.check import CheckLevels
+from esmvalcore.cmor._check_levels import CheckLevels
 from esmvalcore.exceptions import ESMValCoreDeprecationWarning
 
 from ._config_validators import (
@@ -87,6 +87,7 @@ class Config(ValidatedConfig):
         mapping['extra_facets_dir'] = tuple()
         mapping['max_datasets'] = None
         mapping['max_years'] = None
+        mapping['refresh_esgf_cache'] = False
         mapping['resume_from'] = []
         mapping['run_diagnostic'] = True
         mapping['skip_nonexistent'] = False
@@ -165,6 +166,9 @@ class Session(ValidatedConfig):
         super().__init__(config)
         self.session_name: Union[str, None] = None
         self.set_session_name(name)
+        # Directory listings used when searching for files, see
+        # :func:`esmvalcore.local._list_directory`.
+        self._directory_listings: dict = {}
 
     def set_session_name(self, name: str = 'session'):
         """Set the name for the session.
@@ -1,6 +1,7 @@
 """List of config validators."""
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os.path
 import warnings
@@ -12,7 +13,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 from packaging import version
 
 from esmvalcore import __version__ as current_version
-from esmvalcore.cmor.check import CheckLevels
+from esmvalcore.cmor._check_levels import CheckLevels
 from esmvalcore.config._config import (
     TASKSEP,
     importlib_files,
@@ -35,6 +36,16 @@ SEARCH_ESGF_OPTIONS = (
     'always',  # Always search ESGF for files
 )
 
+TASK_SCHEDULER_OPTIONS = (
+    'multiprocessing',  # Run tasks in a pool of local processes
+    'distributed',  # Run tasks on a Dask distributed cluster
+)
+
+PREPROCESSOR_OUTPUT_FORMATS = (
+    'netcdf',  # Write preprocessor output to NetCDF files
+    'zarr',  # Write preprocessor output to Zarr stores
+)
+
 
 class ValidationError(ValueError):
     """Custom validation error."""
@@ -183,6 +194,7 @@ validate_floatlist = _listify_validator(validate_float,
                                         docstring='Return a list of floats.')
 
 validate_dict = _make_type_validator(dict)
+validate_dict_or_none = _make_type_validator(dict, allow_none=True)
 
 validate_path_or_none = _make_type_validator(validate_path, allow_none=True)
 
@@ -196,6 +208,9 @@ validate_pathtuple = _listify_validator(validate_path,
 validate_int_positive = _chain_validator(validate_int, validate_positive)
 validate_int_positive_or_none = _make_type_validator(validate_int_positive,
                                                      allow_none=True)
+validate_float_positive = _chain_validator(validate_float, validate_positive)
+validate_float_positive_or_none = _make_type_validator(validate_float_positive,
+                                                       allow_none=True)
 
 
 def validate_rootpath(value):
@@ -263,6 +278,35 @@ def validate_search_esgf(value):
     return value
 
 
+def validate_task_scheduler(value):
+    """Validate options for the task scheduler."""
+    value = validate_string(value)
+    value = value.lower()
+    if value not in TASK_SCHEDULER_OPTIONS:
+        raise ValidationError(
+            f'`{value}` is not a valid task scheduler, possible values are '
+            f'{TASK_SCHEDULER_OPTIONS}'
+        ) from None
+    return value
+
+
+def validate_preprocessor_output_format(value):
+    """Validate the file format of preprocessor output."""
+    value = validate_string(value)
+    value = value.lower()
+    if value not in PREPROCESSOR_OUTPUT_FORMATS:
+        raise ValidationError(
+            f'`{value}` is not a valid preprocessor output format, possible '
+            f'values are {PREPROCESSOR_OUTPUT_FORMATS}'
+        ) from None
+    if value == 'zarr' and importlib.util.find_spec('zarr') is None:
+        raise ValidationError(
+            'Writing preprocessor output in the `zarr` format requires the '
+            'zarr package, install it with e.g. `pip install zarr`'
+        )
+    return value
+
+
 def validate_diagnostics(
     diagnostics: Union[Iterable[str], str, None]
 ) -> Optional[set[str]]:
@@ -282,21 +326,35 @@ _validators = {
     'auxiliary_data_dir': validate_path,
     'compress_netcdf': validate_bool,
     'config_developer_file': validate_config_developer,
+    'dask_cluster': validate_dict_or_none,
     'download_dir': validate_path,
     'drs': validate_drs,
     'exit_on_warning': validate_bool,
     'extra_facets_dir': validate_pathtuple,
+    'file_dates_cache_dir': validate_path_or_none,
+    'fixed_data_cache_dir': validate_path_or_none,
+    'fixed_data_cache_size': validate_float_positive,
+    'local_file_index': validate_path_or_none,
     'log_level': validate_string,
     'max_parallel_tasks': validate_int_or_none,
     'offline': validate_bool,
     'output_dir': validate_path,
     'output_file_type': validate_string,
+    'preprocessor_cache_dir': validate_path_or_none,
+    'preprocessor_cache_size': validate_float_positive,
+    'preprocessor_memory_budget': validate_float_positive_or_none,
+    'preprocessor_output_format': validate_preprocessor_output_format,
     'profile_diagnostic': validate_bool,
+    'regrid_weights_cache_dir': validate_path_or_none,
     'remove_preproc_dir': validate_bool,
+    'reuse_file_metadata': validate_bool,
     'rootpath': validate_rootpath,
     'run_diagnostic': validate_bool,
+    'run_while_downloading': validate_bool,
     'save_intermediary_cubes': validate_bool,
     'search_esgf': validate_search_esgf,
+    'task_memory_budget': validate_float_positive_or_none,
+    'task_scheduler': validate_task_scheduler,
     'use_legacy_supplementaries': validate_bool_or_none,
 
     # From CLI
@@ -304,6 +362,7 @@ _validators = {
     'diagnostics': validate_diagnostics,
     'max_datasets': validate_int_positive_or_none,
     'max_years': validate_int_positive_or_none,
+    'refresh_esgf_cache': validate_bool,
     'resume_from': validate_pathlist,
     'skip_nonexistent': validate_bool,
 
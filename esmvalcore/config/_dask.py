@@ -0,0 +1,73 @@
+"""Configuration for Dask distributed."""
+from __future__ import annotations
+
+import contextlib
+import importlib
+import logging
+from collections.abc import Generator
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLUSTER_TYPE = 'distributed.LocalCluster'
+
+
+def _create_cluster(cluster_config: dict[str, Any]):
+    """Create a Dask cluster from its configuration."""
+    cluster_config = dict(cluster_config)
+    cluster_type = cluster_config.pop('type', DEFAULT_CLUSTER_TYPE)
+    module_name, class_name = cluster_type.rsplit('.', 1)
+    module = importlib.import_module(module_name)
+    cluster_cls = getattr(module, class_name)
+    logger.debug("Starting Dask cluster %s with arguments %s", cluster_type,
+                 cluster_config)
+    return cluster_cls(**cluster_config)
+
+
+@contextlib.contextmanager
+def get_distributed_client(
+    task_scheduler: str = 'multiprocessing',
+    dask_cluster: Optional[dict[str, Any]] = None,
+) -> Generator:
+    """Get a Dask distributed client.
+
+    Parameters
+    ----------
+    task_scheduler:
+        Backend used to run tasks. If this is not ``'distributed'``, no
+        client is created and ``None`` is returned.
+    dask_cluster:
+        Cluster configuration. If it contains the key ``scheduler_address``,
+        the client connects to this (already running) scheduler. Otherwise,
+        a cluster of class ``type`` (``distributed.LocalCluster`` by default)
+        is started with the remaining items as keyword arguments and shut
+        down again on exit.
+
+    Yields
+    ------
+    distributed.Client or None
+        The client connected to the cluster.
+    """
+    if task_scheduler != 'distributed':
+        yield None
+        return
+
+    from distributed import Client
+
+    cluster_config = dict(dask_cluster or {})
+    address = cluster_config.pop('scheduler_address', None)
+    if address is None:
+        cluster = _create_cluster(cluster_config)
+        address = cluster.scheduler_address
+    else:
+        cluster = None
+
+    client = Client(address)
+    logger.info("Using Dask distributed scheduler at %s, dashboard: %s",
+                address, client.dashboard_link)
+    try:
+        yield client
+    finally:
+        client.close()
+        if cluster is not None:
+            cluster.close()
@@ -14,9 +14,18 @@ from typing import Any, Iterator, Sequence, Union
 
 from iris.cube import Cube
 
+import esmvalcore
 from esmvalcore import esgf, local
+from esmvalcore._data_cache import (
+    DataCache,
+    get_file_fingerprint,
+    get_key,
+    get_source_fingerprint,
+)
 from esmvalcore._recipe import check
 from esmvalcore._recipe.from_datasets import datasets_to_recipe
+from esmvalcore.cmor.check import _defer_data_checks
+from esmvalcore.cmor.fix import Fix
 from esmvalcore.cmor.table import _get_mips, _update_cmor_facets
 from esmvalcore.config import CFG, Session
 from esmvalcore.config._config import (
@@ -43,6 +52,15 @@ logger = logging.getLogger(__name__)
 
 File = Union[esgf.ESGFFile, local.LocalFile]
 
+# Facets that do not influence the data loaded for a dataset.
+_RECIPE_FACETS = (
+    'alias',
+    'diagnostic',
+    'preprocessor',
+    'recipe_dataset_index',
+    'variable_group',
+)
+
 INHERITED_FACETS: list[str] = [
     'dataset',
     'domain',
@@ -611,19 +629,24 @@ class Dataset:
         for supplementary in self.supplementaries:
             supplementary.find_files()
 
-    def _find_files(self) -> None:
-        self.files, self._file_globs = local.find_files(
+    def _find_local_files(self) -> None:
+        self.files, self._file_globs = local._find_files(
+            self.facets,
             debug=True,
-            **self.facets,
+            # Sessions in tests may be plain dictionaries
+            listings=getattr(self.session, '_directory_listings', None),
         )
 
-        # If project does not support automatic downloads from ESGF, stop here
+    def _needs_esgf_search(self) -> bool:
+        """Check if ESGF needs to be searched, given the local files."""
+        # If project does not support automatic downloads from ESGF, do not
+        # check ESGF
         if self.facets['project'] not in esgf.facets.FACETS:
-            return
+            return False
 
-        # 'never' mode: never download files from ESGF and stop here
+        # 'never' mode: never download files from ESGF
         if self.session['search_esgf'] == 'never':
-            return
+            return False
 
         # 'when_missing' mode: if files are available locally, do not check
         # ESGF
@@ -633,10 +656,17 @@ class Dataset:
             except InputFilesNotFound:
                 pass  # search ESGF for files
             else:
-                return  # use local files
+                return False  # use local files
 
         # Local files are not available in 'when_missing' mode or 'always' mode
         # is used: check ESGF
+        return True
+
+    def _find_files(self) -> None:
+        self._find_local_files()
+        if not self._needs_esgf_search():
+            return
+
         local_files = {f.name: f for f in self.files}
         search_result = esgf.find_files(**self.facets)
         for file in search_result:
@@ -726,9 +756,12 @@ class Dataset:
         settings['fix_file'] = {
             'output_dir': fix_dir_prefix,
             'add_unique_suffix': True,
+            'allow_overlay': True,
             **self.facets,
         }
         settings['load'] = {'callback': callback}
+        if self.session['reuse_file_metadata']:
+            settings['load']['reuse_metadata'] = True
         settings['fix_metadata'] = {
             'check_level': self.session['check_level'],
             **self.facets,
@@ -761,19 +794,69 @@ class Dataset:
             file.local_file(self.session['download_dir']) if isinstance(
                 file, esgf.ESGFFile) else file for file in self.files
         ]
-        for step, kwargs in settings.items():
-            result = preprocess(
-                result,
-                step,
-                input_files=self.files,
-                output_file=output_file,
-                debug=self.session['save_intermediary_cubes'],
-                **kwargs,
+
+        cache = None
+        if self.session['fixed_data_cache_dir'] is not None:
+            cache = DataCache(
+                self.session['fixed_data_cache_dir'],
+                max_size=self.session['fixed_data_cache_size'] * 2**30,
             )
+            key = get_key(self, callback)
+            cube = cache.load(key)
+            if cube is not None:
+                logger.debug("Loaded %s from cache", self)
+                return cube
+
+        with _defer_data_checks() as checks:
+            for step, kwargs in settings.items():
+                result = preprocess(
+                    result,
+                    step,
+                    input_files=self.files,
+                    output_file=output_file,
+                    debug=self.session['save_intermediary_cubes'],
+                    **kwargs,
+                )
 
-        cube = result[0]
+            cube = result[0]
+            if cache is not None:
+                # Check the data values while writing the data to the cache
+                cube = cache.save(key, cube, checks)
+                checks.clear()
         return cube
 
+    def _get_fingerprint(self) -> tuple:
+        """Get a fingerprint of the data loaded for this dataset.
+
+        The fingerprint changes when the input files, the facets (except those
+        that only describe where the dataset is used in the recipe), the
+        applicable fixes, or the ``check_level`` change. Supplementary
+        datasets are not taken into account.
+        """
+        facets = {
+            k: v
+            for k, v in self.facets.items() if k not in _RECIPE_FACETS
+        }
+        fixes = Fix.get_fixes(
+            project=self.facets['project'],
+            dataset=self.facets['dataset'],
+            mip=self.facets['mip'],
+            short_name=self.facets['short_name'],
+            extra_facets=self.facets,
+        )
+        files = [
+            (file.dataset, file.name, file.size) if isinstance(
+                file, esgf.ESGFFile) else get_file_fingerprint(file)
+            for file in self.files
+        ]
+        return (
+            files,
+            sorted(facets.items()),
+            self.session['check_level'],
+            get_source_fingerprint(fixes),
+            esmvalcore.__version__,
+        )
+
     def from_ranges(self) -> list['Dataset']:
         """Create a list of datasets from short notations.
 
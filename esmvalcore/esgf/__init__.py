@@ -1,9 +1,10 @@
 """Find files on the ESGF and download them."""
 from ._download import ESGFFile, download
-from ._search import find_files
+from ._search import find_files, find_files_concurrently
 
 __all__ = [
     'ESGFFile',
     'download',
     'find_files',
+    'find_files_concurrently',
 ]
@@ -10,6 +10,8 @@ import os
 import random
 import re
 import shutil
+import threading
+import time
 from pathlib import Path
 from statistics import median
 from tempfile import NamedTemporaryFile
@@ -30,6 +32,18 @@ logger = logging.getLogger(__name__)
 TIMEOUT = 5 * 60
 """Timeout (in seconds) for downloads."""
 
+MAX_DOWNLOADS_PER_HOST = 4
+"""Default maximum number of files downloaded from a single host at once."""
+
+CHUNK_SIZE = 2**20
+"""Size (in bytes) of the pieces in which a file is downloaded and written."""
+
+MAX_RETRIES = 3
+"""Number of times an interrupted download is resumed before giving up."""
+
+FLUSH_INTERVAL = 60
+"""Interval (in seconds) for writing download statistics to HOSTS_FILE."""
+
 HOSTS_FILE = Path.home() / '.esmvaltool' / 'cache' / 'esgf-hosts.yml'
 SIZE = 'size (bytes)'
 DURATION = 'duration (s)'
@@ -59,9 +73,8 @@ def load_speeds():
     return speeds
 
 
-def log_speed(url, size, duration):
-    """Write the downloaded file size and duration to HOSTS_FILE."""
-    speeds = load_speeds()
+def _add_speed(speeds, url, size, duration):
+    """Add the downloaded file size and duration to speeds."""
     host = urlparse(url).hostname
     size += speeds.get(host, {}).get(SIZE, 0)
     duration += speeds.get(host, {}).get(DURATION, 0)
@@ -73,21 +86,152 @@ def log_speed(url, size, duration):
         SPEED: round(speed, 1),
         'error': False,
     }
-    with atomic_write(HOSTS_FILE) as file:
-        yaml.safe_dump(speeds, file)
 
 
-def log_error(url):
-    """Write the hosts that errored to HOSTS_FILE."""
-    speeds = load_speeds()
+def _add_error(speeds, url):
+    """Mark the host of url as errored in speeds."""
     host = urlparse(url).hostname
     entry = speeds.get(host, {SIZE: 0, DURATION: 0, SPEED: 0})
     entry['error'] = True
     speeds[host] = entry
+
+
+def _save_speeds(speeds):
+    """Write download speeds to HOSTS_FILE."""
     with atomic_write(HOSTS_FILE) as file:
         yaml.safe_dump(speeds, file)
 
 
+def log_speed(url, size, duration):
+    """Write the downloaded file size and duration to HOSTS_FILE."""
+    speeds = load_speeds()
+    _add_speed(speeds, url, size, duration)
+    _save_speeds(speeds)
+
+
+def log_error(url):
+    """Write the hosts that errored to HOSTS_FILE."""
+    speeds = load_speeds()
+    _add_error(speeds, url)
+    _save_speeds(speeds)
+
+
+class _HostStatistics:
+    """Download statistics that are written to HOSTS_FILE in batches.
+
+    Writing the statistics after every file is slow when many small files
+    are downloaded, so while a batch is active the statistics are kept in
+    memory and written at most every ``FLUSH_INTERVAL`` seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._events = []
+        self._batches = 0
+        self._last_flush = time.monotonic()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Keep the statistics in memory until the batch is done."""
+        with self._lock:
+            self._batches += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batches -= 1
+                if not self._batches:
+                    self.flush()
+
+    def log_speed(self, url, size, duration):
+        """Record the downloaded file size and duration."""
+        self._log((_add_speed, url, size, duration))
+
+    def log_error(self, url):
+        """Record that the host of url returned an error."""
+        self._log((_add_error, url))
+
+    def _log(self, event):
+        with self._lock:
+            self._events.append(event)
+            age = time.monotonic() - self._last_flush
+            if not self._batches or age > FLUSH_INTERVAL:
+                self.flush()
+
+    def flush(self):
+        """Write the recorded statistics to HOSTS_FILE."""
+        with self._lock:
+            if self._events:
+                speeds = load_speeds()
+                for add, *args in self._events:
+                    add(speeds, *args)
+                _save_speeds(speeds)
+                self._events.clear()
+            self._last_flush = time.monotonic()
+
+
+_STATISTICS = _HostStatistics()
+
+_SESSIONS = {}
+_HOST_SLOTS = {}
+_HOSTS_LOCK = threading.Lock()
+
+
+def _get_session(url, max_downloads_per_host=MAX_DOWNLOADS_PER_HOST):
+    """Get a session for url, so connections to a host are re-used."""
+    key = (urlparse(url).hostname, max_downloads_per_host)
+    with _HOSTS_LOCK:
+        if key not in _SESSIONS:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=max_downloads_per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSIONS[key] = session
+        return _SESSIONS[key]
+
+
+def _host_slot(url, max_downloads_per_host=MAX_DOWNLOADS_PER_HOST):
+    """Get a semaphore that limits the number of downloads from a host."""
+    key = (urlparse(url).hostname, max_downloads_per_host)
+    with _HOSTS_LOCK:
+        if key not in _HOST_SLOTS:
+            _HOST_SLOTS[key] = threading.BoundedSemaphore(
+                max_downloads_per_host)
+        return _HOST_SLOTS[key]
+
+
+def _acquire_lock(lock_file, tmp_file):
+    """Try to create `lock_file` to get exclusive access to `tmp_file`.
+
+    A lock is considered stale and is removed if neither the lock file nor
+    `tmp_file` has been modified for longer than :obj:`TIMEOUT`, e.g. because
+    the process holding it was killed. A download in progress would have
+    timed out by then.
+
+    Returns
+    -------
+    bool
+        True if the lock was acquired, False if it is held by someone else.
+    """
+    for _ in range(2):
+        try:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            mtimes = []
+            for file in (lock_file, tmp_file):
+                with contextlib.suppress(FileNotFoundError):
+                    mtimes.append(file.stat().st_mtime)
+            if mtimes and time.time() - max(mtimes) < TIMEOUT:
+                return False
+            logger.debug("Removing stale lock %s", lock_file)
+            lock_file.unlink(missing_ok=True)
+        else:
+            os.close(fd)
+            return True
+    return False
+
+
 @contextlib.contextmanager
 def atomic_write(filename):
     """Write a file without the risk of interfering with other processes."""
@@ -396,13 +540,18 @@ class ESGFFile:
         file.facets = self.facets
         return file
 
-    def download(self, dest_folder):
+    def download(self,
+                 dest_folder,
+                 max_downloads_per_host=MAX_DOWNLOADS_PER_HOST):
         """Download the file.
 
         Arguments
         ---------
         dest_folder: Path
             The destination folder.
+        max_downloads_per_host: int
+            The maximum number of files that are downloaded from a single
+            host at the same time.
 
         Raises
         ------
@@ -422,17 +571,20 @@ class ESGFFile:
         os.makedirs(local_file.parent, exist_ok=True)
 
         errors = {}
-        for url in sort_hosts(self.urls):
-            try:
-                self._download(local_file, url)
-            except (DownloadError,
-                    requests.exceptions.RequestException) as error:
-                logger.debug("Not able to download %s. Error message: %s", url,
-                             error)
-                errors[url] = error
-                log_error(url)
-            else:
-                break
+        with _STATISTICS.batch():
+            for url in sort_hosts(self.urls):
+                try:
+                    with _host_slot(url, max_downloads_per_host):
+                        self._download(local_file, url,
+                                       max_downloads_per_host)
+                except (DownloadError,
+                        requests.exceptions.RequestException) as error:
+                    logger.debug("Not able to download %s. Error message: %s",
+                                 url, error)
+                    errors[url] = error
+                    _STATISTICS.log_error(url)
+                else:
+                    break
 
         if not local_file.exists():
             raise DownloadError(
@@ -442,35 +594,71 @@ class ESGFFile:
         return local_file
 
     @staticmethod
+    @contextlib.contextmanager
     def _tmp_local_file(local_file):
-        """Return the path to a temporary local file for downloading to."""
-        with NamedTemporaryFile(prefix=f"{local_file}.") as tmp_file:
-            return Path(tmp_file.name)
+        """Get the path to a temporary local file for downloading to.
 
-    def _download(self, local_file, url):
+        The path does not change, so a download that was interrupted, e.g.
+        because the run was stopped, can be resumed later. While downloading,
+        the temporary file is locked by creating a lock file next to it. If
+        another thread or process holds the lock, a new unique temporary file
+        is used instead, so the two downloads do not write to the same file.
+        """
+        tmp_file = local_file.with_name(f"{local_file.name}.tmp")
+        lock_file = local_file.with_name(f"{local_file.name}.lock")
+        if _acquire_lock(lock_file, tmp_file):
+            try:
+                yield tmp_file
+            finally:
+                lock_file.unlink(missing_ok=True)
+            return
+
+        logger.debug("%s is locked, downloading to a new temporary file",
+                     tmp_file)
+        with NamedTemporaryFile(prefix=f"{local_file.name}.",
+                                suffix='.tmp',
+                                dir=local_file.parent,
+                                delete=False) as file:
+            tmp_file = Path(file.name)
+        try:
+            yield tmp_file
+        finally:
+            # This file cannot be found again to resume the download.
+            tmp_file.unlink(missing_ok=True)
+
+    def _download(self, local_file, url,
+                  max_downloads_per_host=MAX_DOWNLOADS_PER_HOST):
         """Download file from a single url."""
+        with self._tmp_local_file(local_file) as tmp_file:
+            self._download_to(local_file, tmp_file, url,
+                              max_downloads_per_host)
+
+    def _download_to(self, local_file, tmp_file, url,
+                     max_downloads_per_host):
+        """Download file from a single url via `tmp_file`."""
         idx = self.urls.index(url)
         checksum_type, checksum = self._checksums[idx]
-        if checksum_type is None:
-            hasher = None
-        else:
-            hasher = hashlib.new(checksum_type)
 
-        tmp_file = self._tmp_local_file(local_file)
+        if tmp_file.exists() and tmp_file.stat().st_size >= self.size:
+            # Do not resume a download that is already complete, e.g. because
+            # the checksum was wrong.
+            tmp_file.unlink()
 
-        logger.debug("Downloading %s to %s", url, tmp_file)
         start_time = datetime.datetime.now()
-        response = requests.get(url,
-                                stream=True,
-                                timeout=TIMEOUT,
-                                cert=get_credentials())
-        response.raise_for_status()
-        with tmp_file.open("wb") as file:
-            for chunk in response.iter_content(chunk_size=None):
-                if hasher is not None:
-                    hasher.update(chunk)
-                file.write(chunk)
-
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                hasher = self._download_remaining(url, tmp_file,
+                                                  checksum_type,
+                                                  max_downloads_per_host)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout) as error:
+                if attempt == MAX_RETRIES:
+                    raise
+                logger.debug("Resuming interrupted download of %s: %s", url,
+                             error)
+            else:
+                break
         duration = datetime.datetime.now() - start_time
 
         if hasher is None:
@@ -480,19 +668,62 @@ class ESGFFile:
         else:
             local_checksum = hasher.hexdigest()
             if local_checksum != checksum:
+                tmp_file.unlink()
                 raise DownloadError(
                     f"Wrong {checksum_type} checksum for file {tmp_file},"
                     f" downloaded from {url}: expected {checksum}, but got"
                     f" {local_checksum}. Try downloading the file again.")
 
         shutil.move(tmp_file, local_file)
-        log_speed(url, self.size, duration.total_seconds())
+        _STATISTICS.log_speed(url, self.size, duration.total_seconds())
         logger.info("Downloaded %s (%s) in %s (%s/s) from %s", local_file,
                     format_size(self.size),
                     format_timespan(duration.total_seconds()),
                     format_size(self.size / duration.total_seconds()),
                     urlparse(url).hostname)
 
+    @staticmethod
+    def _download_remaining(url, tmp_file, checksum_type,
+                            max_downloads_per_host):
+        """Download the part of a file that is not in `tmp_file` yet.
+
+        Returns
+        -------
+        hashlib._Hash or None
+            The hasher containing the checksum of the complete file.
+        """
+        offset = tmp_file.stat().st_size if tmp_file.exists() else 0
+        kwargs = {}
+        if offset:
+            kwargs['headers'] = {'Range': f'bytes={offset}-'}
+        logger.debug("Downloading %s to %s", url, tmp_file)
+        session = _get_session(url, max_downloads_per_host)
+        response = session.get(url,
+                               stream=True,
+                               timeout=TIMEOUT,
+                               cert=get_credentials(),
+                               **kwargs)
+        response.raise_for_status()
+        if offset and response.status_code != 206:
+            logger.debug("Unable to resume download of %s", url)
+            offset = 0
+
+        if checksum_type is None:
+            hasher = None
+        else:
+            hasher = hashlib.new(checksum_type)
+            if offset:
+                with tmp_file.open('rb') as file:
+                    for chunk in iter(lambda: file.read(2**20), b''):
+                        hasher.update(chunk)
+
+        with tmp_file.open('ab' if offset else 'wb') as file:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if hasher is not None:
+                    hasher.update(chunk)
+                file.write(chunk)
+        return hasher
+
 
 def get_download_message(files):
     """Create a log message describing what will be downloaded."""
@@ -510,7 +741,11 @@ def get_download_message(files):
     return "\n".join(lines)
 
 
-def download(files, dest_folder, n_jobs=4):
+def download(files,
+             dest_folder,
+             n_jobs=4,
+             ordered=False,
+             max_downloads_per_host=MAX_DOWNLOADS_PER_HOST):
     """Download multiple ESGFFiles in parallel.
 
     Arguments
@@ -521,6 +756,12 @@ def download(files, dest_folder, n_jobs=4):
         The destination folder.
     n_jobs: int
         The number of files to download in parallel.
+    ordered: bool
+        If True, start downloading the files in the order in which they are
+        given, otherwise in random order.
+    max_downloads_per_host: int
+        The maximum number of files that are downloaded from a single host at
+        the same time.
 
     Raises
     ------
@@ -536,19 +777,22 @@ def download(files, dest_folder, n_jobs=4):
                      " not downloading anything.")
         return
 
-    files = sorted(files)
-    logger.info(get_download_message(files))
+    files = list(dict.fromkeys(files))
+    logger.info(get_download_message(sorted(files)))
 
     def _download(file: ESGFFile):
         """Download file to dest_folder."""
-        file.download(dest_folder)
+        file.download(dest_folder,
+                      max_downloads_per_host=max_downloads_per_host)
 
     total_size = 0
     start_time = datetime.datetime.now()
 
     errors = []
-    random.shuffle(files)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=n_jobs) as executor:
+    if not ordered:
+        random.shuffle(files)
+    with _STATISTICS.batch(), concurrent.futures.ThreadPoolExecutor(
+            max_workers=n_jobs) as executor:
         future_to_file = {
             executor.submit(_download, file): file
             for file in files
@@ -1,11 +1,19 @@
 """Module for finding files on ESGF."""
 import itertools
+import json
 import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
 from functools import lru_cache
 
 import pyesgf.search
 import requests.exceptions
+from pyesgf.search.results import FileResult
 
+from ..config._config_object import USER_CONFIG_DIR
 from ..config._esgf_pyclient import get_esgf_config
 from ..local import (
     _get_start_end_date,
@@ -18,6 +26,21 @@ from .facets import DATASET_MAP, FACETS
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CACHE = USER_CONFIG_DIR / 'cache' / 'esgf-search.sqlite'
+"""File where search results are stored between runs."""
+
+DEFAULT_EXPIRE_AFTER = 86400
+"""Number of seconds after which cached search results expire by default."""
+
+INDEX_NODE_DELAY = 10
+"""Number of seconds to wait for an index node before also trying the next."""
+
+MAX_CONCURRENT_SEARCHES = 8
+"""Maximum number of searches that :func:`find_files_concurrently` runs."""
+
+_SEARCH_LOCKS: dict = {}
+_SEARCH_LOCKS_LOCK = threading.Lock()
+
 
 def get_esgf_facets(variable):
     """Translate variable to facets for searching on ESGF."""
@@ -101,37 +124,170 @@ def _search_index_nodes(facets):
     """
     cfg = get_esgf_config()
     search_args = dict(cfg["search_connection"])
-    urls = search_args.pop("urls")
+    urls = list(search_args.pop("urls"))
 
     global FIRST_ONLINE_INDEX_NODE
     if FIRST_ONLINE_INDEX_NODE:
         urls.insert(0, urls.pop(urls.index(FIRST_ONLINE_INDEX_NODE)))
 
-    errors = []
-    for url in urls:
-        connection = pyesgf.search.SearchConnection(url=url, **search_args)
-        context = connection.new_context(
-            pyesgf.search.context.FileSearchContext,
-            **facets,
-        )
-        logger.debug("Searching %s for datasets using facets=%s", url, facets)
-        try:
-            results = context.search(
-                batch_size=500,
-                ignore_facet_check=True,
-            )
-            FIRST_ONLINE_INDEX_NODE = url
-            return list(results)
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.HTTPError,
-            requests.exceptions.Timeout,
-        ) as error:
-            logger.debug("Unable to connect to %s due to %s", url, error)
-            errors.append(error)
+    # Start with the first index node and also try the next one if it fails
+    # or does not respond within INDEX_NODE_DELAY seconds. The first
+    # successful response is used.
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    remaining = iter(urls)
+    running = {}
+    errors = {}
+
+    def search_next():
+        url = next(remaining, None)
+        if url is not None:
+            future = executor.submit(_search_index_node, url, search_args,
+                                     facets)
+            running[future] = url
+
+    search_next()
+    try:
+        while running:
+            done, _ = wait(running,
+                           timeout=INDEX_NODE_DELAY,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                search_next()
+            for future in done:
+                url = running.pop(future)
+                try:
+                    results = future.result()
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.HTTPError,
+                    requests.exceptions.Timeout,
+                ) as error:
+                    logger.debug("Unable to connect to %s due to %s", url,
+                                 error)
+                    errors[url] = error
+                    search_next()
+                else:
+                    FIRST_ONLINE_INDEX_NODE = url
+                    return results
+    finally:
+        # Do not wait for slower index nodes that are still searching.
+        executor.shutdown(wait=False)
 
     raise FileNotFoundError("Failed to search ESGF, unable to connect:\n" +
-                            "\n".join(f"- {e}" for e in errors))
+                            "\n".join(f"- {errors[url]}" for url in urls))
+
+
+def _search_index_node(url, search_args, facets):
+    """Search a single index node for files on ESGF."""
+    connection = pyesgf.search.SearchConnection(url=url, **search_args)
+    context = connection.new_context(
+        pyesgf.search.context.FileSearchContext,
+        **facets,
+    )
+    logger.debug("Searching %s for datasets using facets=%s", url, facets)
+    results = context.search(
+        batch_size=500,
+        ignore_facet_check=True,
+    )
+    return list(results)
+
+
+def _connect_search_cache():
+    """Connect to the cache of search results."""
+    SEARCH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(SEARCH_CACHE)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS results (facets TEXT PRIMARY KEY, "
+        "timestamp REAL, results TEXT)")
+    return connection
+
+
+def _get_expire_after():
+    """Get the number of seconds after which cached results expire."""
+    cfg = get_esgf_config()['search_connection']
+    expire_after = cfg.get('expire_after', DEFAULT_EXPIRE_AFTER)
+    if hasattr(expire_after, 'total_seconds'):
+        expire_after = expire_after.total_seconds()
+    return expire_after
+
+
+def _search_with_cache(facets):
+    """Search for files on ESGF, re-using results from previous runs.
+
+    Search results are stored on disk in :obj:`SEARCH_CACHE`. Results that
+    are older than ``expire_after`` seconds, as configured in the
+    ``search_connection`` section of the esgf-pyclient configuration file,
+    are refreshed. If none of the index nodes can be reached, expired
+    results are used when available.
+
+    Parameters
+    ----------
+    facets: :obj:`dict` of :obj:`str`
+        Facets to constrain the search.
+
+    Returns
+    -------
+    list of :obj:`pyesgf.search.results.FileResult`
+        The search results.
+    """
+    key = json.dumps(facets, sort_keys=True)
+    # Avoid running the same search more than once at the same time.
+    with _SEARCH_LOCKS_LOCK:
+        lock = _SEARCH_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        return _read_or_search(facets, key)
+
+
+def _read_or_search(facets, key):
+    """Read search results from the cache or search ESGF if needed."""
+    try:
+        with closing(_connect_search_cache()) as connection:
+            row = connection.execute(
+                "SELECT timestamp, results FROM results WHERE facets = ?",
+                (key, )).fetchone()
+    except sqlite3.Error as exc:
+        logger.debug("Unable to use cache %s: %s", SEARCH_CACHE, exc)
+        return _search_index_nodes(facets)
+
+    if row is not None:
+        timestamp, cached = row
+        cached = [FileResult(json=j, context=None) for j in json.loads(cached)]
+        if time.time() - timestamp < _get_expire_after():
+            logger.debug("Using cached search results for facets=%s", facets)
+            return cached
+
+    try:
+        results = _search_index_nodes(facets)
+    except FileNotFoundError:
+        if row is None:
+            raise
+        logger.warning(
+            "Unable to connect to ESGF, using search results for facets=%s "
+            "from %s", facets, time.ctime(row[0]))
+        return cached
+
+    try:
+        with closing(_connect_search_cache()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps([r.json for r in results])),
+            )
+    except sqlite3.Error as exc:
+        logger.debug("Unable to update cache %s: %s", SEARCH_CACHE, exc)
+    return results
+
+
+def expire_search_cache():
+    """Mark all search results stored on disk as expired.
+
+    Expired results are searched for again, but can still be used if
+    ESGF cannot be reached.
+    """
+    if not SEARCH_CACHE.exists():
+        return
+    with closing(_connect_search_cache()) as connection, connection:
+        connection.execute("UPDATE results SET timestamp = 0")
+    cached_search.cache_clear()
 
 
 def esgf_search_files(facets):
@@ -147,7 +303,7 @@ def esgf_search_files(facets):
     list of :py:class:`~ESGFFile`
         The found files.
     """
-    results = _search_index_nodes(facets)
+    results = _search_with_cache(facets)
 
     files = ESGFFile._from_results(results, facets)
 
@@ -346,12 +502,56 @@ def find_files(*, project, short_name, dataset, **facets):
     return cached_search(**facets)
 
 
+def find_files_concurrently(facet_sets, max_workers=MAX_CONCURRENT_SEARCHES):
+    """Search for files on ESGF for many sets of facets at once.
+
+    This is much faster than calling :func:`find_files` for each set of
+    facets one after another.
+
+    Parameters
+    ----------
+    facet_sets: :obj:`list` of :obj:`dict`
+        Sets of facets, each of which is passed to :func:`find_files`.
+    max_workers: int
+        Maximum number of searches that run at the same time.
+
+    Examples
+    --------
+    Search for the same variable from several datasets:
+
+    >>> find_files_concurrently([
+    ...     {
+    ...         'project': 'CMIP6',
+    ...         'mip': 'Amon',
+    ...         'short_name': 'tas',
+    ...         'dataset': dataset,
+    ...         'exp': 'historical',
+    ...         'ensemble': 'r1i1p1f1',
+    ...     } for dataset in ['CanESM5', 'MPI-ESM1-2-LR']
+    ... ])  # doctest: +SKIP
+    [[ESGFFile:CMIP6/CMIP/CCCma/CanESM5/historical/r1i1p1f1/Amon/tas/gn/v20190429/tas_Amon_CanESM5_historical_r1i1p1f1_gn_185001-201412.nc],
+     [ESGFFile:CMIP6/CMIP/MPI-M/MPI-ESM1-2-LR/historical/r1i1p1f1/Amon/tas/gn/v20190710/tas_Amon_MPI-ESM1-2-LR_historical_r1i1p1f1_gn_185001-186912.nc,
+      ...]]
+
+    Returns
+    -------
+    :obj:`list` of :obj:`list` of :obj:`ESGFFile`
+        For each set of facets, a list of the files that have been found.
+    """  # pylint: disable=locally-disabled, line-too-long
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(find_files, **facets) for facets in facet_sets
+        ]
+    return [future.result() for future in futures]
+
+
 @lru_cache(10000)
 def cached_search(**facets):
     """Search for files on ESGF.
 
     A cached search function will speed up recipes that use the same
-    variable multiple times.
+    variable multiple times. Search results are also kept on disk between
+    runs, see :func:`_search_with_cache`.
     """
     esgf_facets = get_esgf_facets(facets)
     files = esgf_search_files(esgf_facets)
@@ -1,17 +1,25 @@
 """Find files on the local filesystem."""
 from __future__ import annotations
 
+import fnmatch
 import itertools
 import logging
 import os
 import re
-from glob import glob
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from glob import has_magic
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import cftime
 import iris
 import isodate
+import netCDF4
 
+from ._local_index import LocalIndex
 from .config import CFG
 from .config._config import get_project_config
 from .exceptions import RecipeError
@@ -20,6 +28,28 @@ from .typing import Facets, FacetValue
 logger = logging.getLogger(__name__)
 
 
+# Regular expressions for finding dates in file names
+_TIME_PATTERN = (r"(?P<hour>[0-2][0-9]"
+                 r"(?P<minute>[0-5][0-9]"
+                 r"(?P<second>[0-5][0-9])?)?Z?)")
+_DATE_PATTERN = (r"(?P<year>[0-9]{4})"
+                 r"(?P<month>[01][0-9]"
+                 r"(?P<day>[0-3][0-9]"
+                 rf"(T?{_TIME_PATTERN})?)?)?")
+_DATETIME_PATTERN = rf"(?P<datetime>{_DATE_PATTERN})"
+
+# Name of the cache of the dates read from files that do not have dates in
+# their name, see the configuration option ``file_dates_cache_dir``.
+_FILE_DATES_CACHE = 'file-dates.sqlite'
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a regular expression and keep it for re-use."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=100_000)
 def _get_from_pattern(pattern, date_range_pattern, stem, group):
     """Get time, date or datetime from date range patterns in file names."""
     #
@@ -30,13 +60,13 @@ def _get_from_pattern(pattern, date_range_pattern, stem, group):
     #
     # First check for a block of two potential dates
     date_range_pattern_with_context = context + date_range_pattern + context
-    daterange = re.search(date_range_pattern_with_context, stem)
+    daterange = _compile(date_range_pattern_with_context).search(stem)
     if not daterange:
         # Retry with extended context for CMIP3
         context = r"(?:^|[-_.]|$)"
         date_range_pattern_with_context = (context + date_range_pattern +
                                            context)
-        daterange = re.search(date_range_pattern_with_context, stem)
+        daterange = _compile(date_range_pattern_with_context).search(stem)
     if daterange:
         start_point = daterange.group(group)
         end_group = '_'.join([group, 'end'])
@@ -44,13 +74,13 @@ def _get_from_pattern(pattern, date_range_pattern, stem, group):
     else:
         # Check for single dates in the filename
         single_date_pattern = context + pattern + context
-        dates = re.findall(single_date_pattern, stem)
+        dates = _compile(single_date_pattern).findall(stem)
         if len(dates) == 1:
             start_point = end_point = dates[0][0]
         elif len(dates) > 1:
             # Check for dates at start or (exclusive or) end of filename
-            start = re.search(r'^' + pattern, stem)
-            end = re.search(pattern + r'$', stem)
+            start = _compile(r'^' + pattern).search(stem)
+            end = _compile(pattern + r'$').search(stem)
             if start and not end:
                 start_point = end_point = start.group(group)
             elif end:
@@ -59,6 +89,136 @@ def _get_from_pattern(pattern, date_range_pattern, stem, group):
     return start_point, end_point
 
 
+def _get_start_end_date_from_filename(filename):
+    """Get the start and end dates as a string from a file name only.
+
+    Returns ``(None, None)`` if the file name does not contain dates. See
+    :func:`_get_start_end_date` for the supported formats.
+    """
+    stem = Path(filename).stem
+    end_datetime_pattern = _DATETIME_PATTERN.replace(">", "_end>")
+    date_range_pattern = _DATETIME_PATTERN + r"[-_]" + end_datetime_pattern
+    return _get_from_pattern(_DATETIME_PATTERN, date_range_pattern, stem,
+                             'datetime')
+
+
+def _find_time_variable(dataset):
+    """Find the variable describing the time coordinate in a NetCDF file.
+
+    The variable is identified by its name in the same way as
+    ``cube.coord('time')`` would do.
+    """
+    for variable in dataset.variables.values():
+        attrs = variable.ncattrs()
+        if 'standard_name' in attrs:
+            name = variable.standard_name
+        elif 'long_name' in attrs:
+            name = variable.long_name
+        else:
+            name = variable.name
+        if name == 'time' and 'units' in attrs and variable.size > 0:
+            return variable
+    return None
+
+
+def _read_start_end_date(filename):
+    """Read the first and last time point from a file.
+
+    For NetCDF files, only the first and last value of the time variable
+    are read. Other file formats are loaded with :mod:`iris`.
+    """
+    try:
+        dataset = netCDF4.Dataset(filename)
+    except OSError:
+        dataset = None
+
+    points = []
+    if dataset is not None:
+        with dataset:
+            time = _find_time_variable(dataset)
+            if time is not None:
+                time.set_auto_mask(False)
+                calendar = getattr(time, 'calendar', 'standard')
+                for index in (0, -1):
+                    points.append(
+                        cftime.num2date(
+                            time[(index, ) * time.ndim],
+                            time.units,
+                            calendar=calendar,
+                            only_use_cftime_datetimes=True,
+                        ))
+    else:
+        logger.debug("Must load file %s for daterange ", filename)
+        for cube in iris.load(filename):
+            try:
+                time = cube.coord('time')
+            except iris.exceptions.CoordinateNotFoundError:
+                continue
+            points = [time.cell(0).point, time.cell(-1).point]
+            break
+
+    if not points:
+        return None, None
+    return tuple(
+        isodate.date_isoformat(p, format=isodate.isostrf.DATE_BAS_COMPLETE)
+        for p in points)
+
+
+def _connect_file_dates_cache(cache_dir: Path) -> sqlite3.Connection:
+    """Connect to the cache of dates read from files."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(cache_dir / _FILE_DATES_CACHE)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS dates (path TEXT PRIMARY KEY, "
+        "mtime_ns INTEGER, size INTEGER, start_date TEXT, end_date TEXT)")
+    return connection
+
+
+@lru_cache(maxsize=10_000)
+def _get_start_end_date_from_file(path, mtime_ns, size):
+    """Get the start and end dates as a string from the contents of a file.
+
+    If the configuration option ``file_dates_cache_dir`` is set, the dates
+    are also stored in a cache on disk, so files only need to be read again
+    when they are modified.
+    """
+    cache_dir = CFG.get('file_dates_cache_dir')
+    if cache_dir is None:
+        return _read_start_end_date(path)
+    key = (path, mtime_ns, size)
+    try:
+        with closing(_connect_file_dates_cache(cache_dir)) as connection:
+            row = connection.execute(
+                "SELECT start_date, end_date FROM dates WHERE path = ? "
+                "AND mtime_ns = ? AND size = ?", key).fetchone()
+            if row is not None:
+                return tuple(row)
+            dates = _read_start_end_date(path)
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO dates VALUES (?, ?, ?, ?, ?)",
+                    (*key, *dates))
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Unable to use cache %s: %s",
+                     cache_dir / _FILE_DATES_CACHE, exc)
+        dates = _read_start_end_date(path)
+    return dates
+
+
+def _get_start_end_date_from_contents(filename):
+    """Get the start and end dates as a string from the contents of a file.
+
+    Returns ``(None, None)`` if the file does not exist or does not contain
+    a time coordinate.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None, None
+    return _get_start_end_date_from_file(os.path.abspath(filename),
+                                         stat.st_mtime_ns, stat.st_size)
+
+
 def _get_start_end_date(filename):
     """Get the start and end dates as a string from a file name.
 
@@ -72,41 +232,11 @@ def _get_start_end_date(filename):
     Look first for two dates separated by - or _, then for one single
     date, and if they are multiple, for one date at start or end.
     """
-    stem = Path(filename).stem
-    start_date = end_date = None
-    #
-    time_pattern = (r"(?P<hour>[0-2][0-9]"
-                    r"(?P<minute>[0-5][0-9]"
-                    r"(?P<second>[0-5][0-9])?)?Z?)")
-    date_pattern = (r"(?P<year>[0-9]{4})"
-                    r"(?P<month>[01][0-9]"
-                    r"(?P<day>[0-3][0-9]"
-                    rf"(T?{time_pattern})?)?)?")
-    datetime_pattern = (rf"(?P<datetime>{date_pattern})")
-    #
-    end_datetime_pattern = datetime_pattern.replace(">", "_end>")
-    date_range_pattern = datetime_pattern + r"[-_]" + end_datetime_pattern
-    start_date, end_date = _get_from_pattern(datetime_pattern,
-                                             date_range_pattern, stem,
-                                             'datetime')
+    start_date, end_date = _get_start_end_date_from_filename(filename)
 
     # As final resort, try to get the dates from the file contents
-    if (start_date is None or end_date is None) and Path(filename).exists():
-        logger.debug("Must load file %s for daterange ", filename)
-        cubes = iris.load(filename)
-
-        for cube in cubes:
-            logger.debug(cube)
-            try:
-                time = cube.coord('time')
-            except iris.exceptions.CoordinateNotFoundError:
-                continue
-            start_date = isodate.date_isoformat(
-                time.cell(0).point, format=isodate.isostrf.DATE_BAS_COMPLETE)
-
-            end_date = isodate.date_isoformat(
-                time.cell(-1).point, format=isodate.isostrf.DATE_BAS_COMPLETE)
-            break
+    if start_date is None or end_date is None:
+        start_date, end_date = _get_start_end_date_from_contents(filename)
 
     if start_date is None or end_date is None:
         raise ValueError(f'File {filename} dates do not match a recognized '
@@ -191,35 +321,19 @@ def _get_start_end_year(file):
         When start or end year cannot be determined.
 
     """
-    start_year = end_year = None
-
-    time_pattern = (r"(?P<hour>[0-2][0-9]"
-                    r"(?P<minute>[0-5][0-9]"
-                    r"(?P<second>[0-5][0-9])?)?Z?)")
-    date_pattern = (r"(?P<year>[0-9]{4})"
-                    r"(?P<month>[01][0-9]"
-                    r"(?P<day>[0-3][0-9]"
-                    rf"(T?{time_pattern})?)?)?")
-
-    end_date_pattern = date_pattern.replace(">", "_end>")
-    date_range_pattern = date_pattern + r"[-_]" + end_date_pattern
-    start_year, end_year = _get_from_pattern(date_pattern, date_range_pattern,
+    end_date_pattern = _DATE_PATTERN.replace(">", "_end>")
+    date_range_pattern = _DATE_PATTERN + r"[-_]" + end_date_pattern
+    start_year, end_year = _get_from_pattern(_DATE_PATTERN,
+                                             date_range_pattern,
                                              Path(file.name).stem, 'year')
     # As final resort, try to get the dates from the file contents
-    if ((start_year is None or end_year is None) and isinstance(file, Path)
-            and file.exists()):
-        logger.debug("Must load file %s for daterange ", file)
-        cubes = iris.load(file)
-
-        for cube in cubes:
-            logger.debug(cube)
-            try:
-                time = cube.coord('time')
-            except iris.exceptions.CoordinateNotFoundError:
-                continue
-            start_year = time.cell(0).point.year
-            end_year = time.cell(-1).point.year
-            break
+    if ((start_year is None or end_year is None)
+            and isinstance(file, Path)):
+        start_date, end_date = _get_start_end_date_from_contents(file)
+        if start_date is not None and end_date is not None:
+            # Dates are formatted as YYYYMMDD
+            start_year = start_date[:-4]
+            end_year = end_date[:-4]
 
     if start_year is None or end_year is None:
         raise ValueError(f'File {file} dates do not match a recognized '
@@ -300,7 +414,7 @@ def _truncate_dates(date, file_date):
     return int(date), int(file_date)
 
 
-def _select_files(filenames, timerange):
+def _select_files(filenames, timerange, dates=None):
     """Select files containing data between a given timerange.
 
     If the timerange is given as a period, the file selection
@@ -308,6 +422,9 @@ def _select_files(filenames, timerange):
 
     Otherwise, the file selection occurs taking into account
     the time resolution of the file.
+
+    The start and end dates of the files are read from ``dates``, a
+    dictionary that maps file names to start and end dates, if available.
     """
     if '*' in timerange:
         # TODO: support * combined with a period
@@ -317,7 +434,9 @@ def _select_files(filenames, timerange):
 
     for filename in filenames:
         start_date, end_date = _parse_period(timerange)
-        start, end = _get_start_end_date(filename)
+        start, end = (dates or {}).get(filename, (None, None))
+        if start is None or end is None:
+            start, end = _get_start_end_date(filename)
 
         start_date, end = _truncate_dates(start_date, end)
         end_date, start = _truncate_dates(end_date, start)
@@ -448,7 +567,167 @@ def _get_globs(variable):
     return globs
 
 
-def _get_input_filelist(variable):
+_DirectoryListings = Dict[str, Tuple[int, List[str], List[str]]]
+
+
+def _list_directory(
+    directory: str,
+    listings: _DirectoryListings,
+) -> tuple[list[str], list[str]]:
+    """List the files and subdirectories in a directory.
+
+    The listing is stored in ``listings`` and re-used as long as the
+    modification time of the directory does not change.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return [], []
+    listing = listings.get(directory)
+    if listing is not None and listing[0] == mtime:
+        return listing[1], listing[2]
+
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (subdirs if is_dir else files).append(entry.name)
+    except OSError:
+        return [], []
+    listings[directory] = (mtime, files, subdirs)
+    return files, subdirs
+
+
+def _split_literal(parts: tuple[str, ...]) -> int:
+    """Get the number of leading path components without wildcards."""
+    for i, part in enumerate(parts):
+        if has_magic(part):
+            return i
+    return len(parts)
+
+
+def _filter_names(names: list[str], pattern: str) -> list[str]:
+    """Select the names that match a pattern like :func:`glob.glob` does."""
+    if not pattern.startswith('.'):
+        names = [n for n in names if not n.startswith('.')]
+    return fnmatch.filter(names, pattern)
+
+
+def _glob(
+    patterns: Iterable[Path],
+    listings: Optional[_DirectoryListings] = None,
+) -> dict[Path, list[Path]]:
+    """Find the paths matching multiple :func:`glob.glob` patterns at once.
+
+    The patterns are expanded one path component at a time. At every step,
+    the directories that need to be listed for all patterns are
+    de-duplicated and listed concurrently, which is much faster than
+    expanding the patterns one by one on (parallel) network filesystems.
+
+    Parameters
+    ----------
+    patterns:
+        The glob patterns.
+    listings:
+        Directory listings from previous searches, see
+        :func:`_list_directory`.
+
+    Returns
+    -------
+    dict[pathlib.Path, list[pathlib.Path]]
+        The paths matching each pattern.
+    """
+    if listings is None:
+        listings = {}
+    results: dict[Path, list[Path]] = {}
+    # Items are (pattern, directory to list, remaining path components)
+    pending: list[tuple[Path, str, tuple[str, ...]]] = []
+    for pattern in patterns:
+        pattern = Path(pattern)
+        results[pattern] = []
+        parts = pattern.parts
+        n_literal = _split_literal(parts)
+        if n_literal == len(parts):
+            if os.path.lexists(pattern):
+                results[pattern].append(pattern)
+        else:
+            directory = os.path.join(*parts[:n_literal] or ['.'])
+            pending.append((pattern, directory, parts[n_literal:]))
+
+    with ThreadPoolExecutor() as executor:
+        while pending:
+            directories = list(dict.fromkeys(d for _, d, _ in pending))
+            found = dict(
+                zip(
+                    directories,
+                    executor.map(_list_directory, directories,
+                                 [listings] * len(directories)),
+                ))
+            next_pending = []
+            for pattern, directory, parts in pending:
+                files, subdirs = found[directory]
+                # Only directories can match intermediate path components.
+                names = subdirs if len(parts) > 1 else files + subdirs
+                for name in _filter_names(names, parts[0]):
+                    path = os.path.join(directory, name)
+                    remaining = parts[1:]
+                    n_literal = _split_literal(remaining)
+                    path = os.path.join(path, *remaining[:n_literal])
+                    remaining = remaining[n_literal:]
+                    if remaining:
+                        next_pending.append((pattern, path, remaining))
+                    elif n_literal == 0 or os.path.lexists(path):
+                        results[pattern].append(Path(path))
+            pending = next_pending
+
+    return results
+
+
+def _prefetch_directories(
+    facet_sets: Iterable[Facets],
+    listings: _DirectoryListings,
+) -> None:
+    """List the directories that will be searched for files concurrently.
+
+    Searching for files for each of the ``facet_sets`` afterwards with the
+    same ``listings`` will then only need to check if the directories were
+    modified.
+    """
+    globs = []
+    for facets in facet_sets:
+        facets = dict(facets)
+        if 'original_short_name' in facets:
+            facets['short_name'] = facets['original_short_name']
+        try:
+            globs.extend(_get_globs(facets))
+        except (KeyError, RecipeError):
+            # Not enough facets to search for files
+            continue
+    index = _get_local_index()
+    if index is not None:
+        globs = [g for g in globs if not index.covers(g)]
+    _glob(dict.fromkeys(globs), listings)
+
+
+def _get_local_index() -> LocalIndex | None:
+    """Get the index of local files if it is configured and available."""
+    path = CFG['local_file_index']
+    if path is None:
+        return None
+    if not path.exists():
+        logger.debug(
+            "Local file index %s does not exist, run `esmvaltool data index` "
+            "to create it", path)
+        return None
+    return LocalIndex(path)
+
+
+def _get_input_filelist(variable, listings=None):
     """Return the full path to input files."""
     variable = dict(variable)
     if 'original_short_name' in variable:
@@ -460,11 +739,23 @@ def _get_input_filelist(variable):
         "\n".join(str(g) for g in globs),
     )
 
-    files = list(Path(file) for glob_ in globs for file in glob(str(glob_)))
+    index = _get_local_index()
+    files = []
+    dates = {}
+    unindexed_globs = []
+    for glob_ in globs:
+        if index is not None and index.covers(glob_):
+            found = index.glob_with_dates(glob_)
+            dates.update(found)
+            files.extend(found)
+        else:
+            unindexed_globs.append(glob_)
+    for found in _glob(unindexed_globs, listings).values():
+        files.extend(found)
     files.sort()  # sorting makes it easier to see what was found
 
     if 'timerange' in variable:
-        files = _select_files(files, variable['timerange'])
+        files = _select_files(files, variable['timerange'], dates)
 
     return files, globs
 
@@ -635,7 +926,20 @@ def find_files(
     list[LocalFile]
         The files that were found.
     """  # pylint: disable=line-too-long
-    filenames, globs = _get_input_filelist(facets)
+    return _find_files(facets, debug=debug)
+
+
+def _find_files(
+    facets: Facets,
+    debug: bool = False,
+    listings: Optional[_DirectoryListings] = None,
+) -> Union[list[LocalFile], tuple[list[LocalFile], list[Path]]]:
+    """Find files on the local filesystem.
+
+    See :func:`find_files` for a description of the arguments. Directory
+    listings from previous searches are re-used from ``listings``.
+    """
+    filenames, globs = _get_input_filelist(facets, listings)
     drs = _select_drs('input_dir', facets['project'])
     if isinstance(drs, list):
         # Not sure how to handle a list of DRSs
@@ -2,30 +2,30 @@
 from __future__ import annotations
 
 import copy
+import importlib
 import inspect
 import logging
+import os
+import shutil
+import tempfile
 from pathlib import Path
 from pprint import pformat
 from typing import Any, Iterable
 
+import dask
+import iris
 from iris.cube import Cube
 
+from .._data_cache import DataCache, get_key
 from .._provenance import TrackedFile
 from .._task import BaseTask
-from ..cmor.check import cmor_check_data, cmor_check_metadata
-from ..cmor.fix import fix_data, fix_file, fix_metadata
-from ._area import (
-    area_statistics,
-    extract_named_regions,
-    extract_region,
-    extract_shape,
-    meridional_statistics,
-    zonal_statistics,
+from ..cmor._fixes.overlay import FileOverlay
+from ..cmor.check import (
+    _defer_data_checks,
+    cmor_check_data,
+    cmor_check_metadata,
 )
-from ._bias import bias
-from ._cycles import amplitude
-from ._derive import derive
-from ._detrend import detrend
+from ..cmor.fix import fix_data, fix_file, fix_metadata
 from ._io import (
     _get_debug_filename,
     cleanup,
@@ -34,62 +34,83 @@ from ._io import (
     save,
     write_metadata,
 )
-from ._mask import (
-    mask_above_threshold,
-    mask_below_threshold,
-    mask_fillvalues,
-    mask_glaciated,
-    mask_inside_range,
-    mask_landsea,
-    mask_landseaice,
-    mask_multimodel,
-    mask_outside_range,
-)
-from ._multimodel import ensemble_statistics, multi_model_statistics
-from ._other import clip
-from ._regrid import (
-    extract_coordinate_points,
-    extract_levels,
-    extract_location,
-    extract_point,
-    regrid,
-)
-from ._rolling_window import rolling_window_statistics
-from ._supplementary_vars import (
-    add_fx_variables,
-    add_supplementary_variables,
-    remove_fx_variables,
-    remove_supplementary_variables,
-)
-from ._time import (
-    annual_statistics,
-    anomalies,
-    climate_statistics,
-    clip_timerange,
-    daily_statistics,
-    decadal_statistics,
-    extract_month,
-    extract_season,
-    extract_time,
-    hourly_statistics,
-    monthly_statistics,
-    regrid_time,
-    resample_hours,
-    resample_time,
-    seasonal_statistics,
-    timeseries_filter,
-)
-from ._trend import linear_trend, linear_trend_stderr
-from ._units import accumulate_coordinate, convert_units
-from ._volume import (
-    axis_statistics,
-    depth_integration,
-    extract_trajectory,
-    extract_transect,
-    extract_volume,
-    volume_statistics,
-)
-from ._weighting import weighting_landsea_fraction
+
+# The other preprocessor functions are imported when they are first used,
+# because their modules depend on many (slow to import) packages.
+_LAZY_FUNCTIONS = {
+    '._area': (
+        'area_statistics',
+        'extract_named_regions',
+        'extract_region',
+        'extract_shape',
+        'meridional_statistics',
+        'zonal_statistics',
+    ),
+    '._bias': ('bias', ),
+    '._cycles': ('amplitude', ),
+    '._derive': ('derive', ),
+    '._detrend': ('detrend', ),
+    '._mask': (
+        'mask_above_threshold',
+        'mask_below_threshold',
+        'mask_fillvalues',
+        'mask_glaciated',
+        'mask_inside_range',
+        'mask_landsea',
+        'mask_landseaice',
+        'mask_multimodel',
+        'mask_outside_range',
+    ),
+    '._multimodel': ('ensemble_statistics', 'multi_model_statistics'),
+    '._other': ('clip', ),
+    '._regrid': (
+        'extract_coordinate_points',
+        'extract_levels',
+        'extract_location',
+        'extract_point',
+        'regrid',
+    ),
+    '._rolling_window': ('rolling_window_statistics', ),
+    '._supplementary_vars': (
+        'add_fx_variables',
+        'add_supplementary_variables',
+        'remove_fx_variables',
+        'remove_supplementary_variables',
+    ),
+    '._time': (
+        'annual_statistics',
+        'anomalies',
+        'climate_statistics',
+        'clip_timerange',
+        'daily_statistics',
+        'decadal_statistics',
+        'extract_month',
+        'extract_season',
+        'extract_time',
+        'hourly_statistics',
+        'monthly_statistics',
+        'regrid_time',
+        'resample_hours',
+        'resample_time',
+        'seasonal_statistics',
+        'timeseries_filter',
+    ),
+    '._trend': ('linear_trend', 'linear_trend_stderr'),
+    '._units': ('accumulate_coordinate', 'convert_units'),
+    '._volume': (
+        'axis_statistics',
+        'depth_integration',
+        'extract_trajectory',
+        'extract_transect',
+        'extract_volume',
+        'volume_statistics',
+    ),
+    '._weighting': ('weighting_landsea_fraction', ),
+}
+_FUNCTION_MODULES = {
+    name: module
+    for module, names in _LAZY_FUNCTIONS.items() for name in names
+}
 
 logger = logging.getLogger(__name__)
 
@@ -220,6 +241,15 @@ INITIAL_STEPS = DEFAULT_ORDER[:DEFAULT_ORDER.index(
 FINAL_STEPS = DEFAULT_ORDER[DEFAULT_ORDER.index(
     'remove_supplementary_variables'):]
 
+# The result of applying the steps up to and including one of these (expensive)
+# steps is stored in the preprocessor cache, if it is enabled.
+CHECKPOINT_STEPS = {
+    'derive',
+    'extract_levels',
+    'extract_shape',
+    'regrid',
+}
+
 MULTI_MODEL_FUNCTIONS = {
     'bias',
     'ensemble_statistics',
@@ -229,9 +259,43 @@ MULTI_MODEL_FUNCTIONS = {
 }
 
 
+def __getattr__(name):
+    """Import preprocessor functions when they are first used."""
+    if name in _FUNCTION_MODULES:
+        module = importlib.import_module(_FUNCTION_MODULES[name], __name__)
+        function = getattr(module, name)
+        globals()[name] = function
+        return function
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the module attributes, including not yet imported functions."""
+    return sorted(set(globals()) | set(_FUNCTION_MODULES))
+
+
+def _get_function(step):
+    """Get the preprocessor function implementing ``step``."""
+    if step in globals():
+        return globals()[step]
+    return __getattr__(step)
+
+
+def _get_supplementaries(step):
+    """Get the supplementary variables registered for ``step``, if any.
+
+    The supplementary variables are registered when the module implementing
+    the preprocessor function is imported, so the function is imported first.
+    """
+    from ._supplementary_vars import PREPROCESSOR_SUPPLEMENTARIES
+    if step in _FUNCTION_MODULES:
+        _get_function(step)
+    return PREPROCESSOR_SUPPLEMENTARIES.get(step)
+
+
 def _get_itype(step):
     """Get the input type of a preprocessor function."""
-    function = globals()[step]
+    function = _get_function(step)
     itype = inspect.getfullargspec(function).args[0]
     return itype
 
@@ -245,7 +309,7 @@ def check_preprocessor_settings(settings):
                 f"{', '.join(DEFAULT_ORDER)}"
             )
 
-        function = function = globals()[step]
+        function = _get_function(step)
         argspec = inspect.getfullargspec(function)
         args = argspec.args[1:]
         if not (argspec.varargs or argspec.varkw):
@@ -338,7 +402,7 @@ def _run_preproc_function(function, items, kwargs, input_files=None):
                         f"here; refer to the debug log for a full list)")
 
         # Make sure that the arguments are indexable
-        if isinstance(items, (PreprocessorFile, Cube, str, Path)):
+        if isinstance(items, (PreprocessorFile, Cube, str, Path, FileOverlay)):
             items = [items]
         if isinstance(items, set):
             items = list(items)
@@ -367,7 +431,7 @@ def preprocess(
 ):
     """Run preprocessor."""
     logger.debug("Running preprocessor step %s", step)
-    function = globals()[step]
+    function = _get_function(step)
     itype = _get_itype(step)
 
     result = []
@@ -381,7 +445,9 @@ def preprocess(
 
     items = []
     for item in result:
-        if isinstance(item, (PreprocessorFile, Cube, str, Path)):
+        if (isinstance(item,
+                       (PreprocessorFile, Cube, str, Path, FileOverlay))
+                or dask.is_dask_collection(item)):
             items.append(item)
         else:
             items.extend(item)
@@ -437,6 +503,9 @@ class PreprocessorFile(TrackedFile):
         self.datasets = datasets
         self._cubes = None
         self._input_files = input_files
+        # Checks of the data values that are computed together with the
+        # final data, see esmvalcore.cmor.check._defer_data_checks.
+        self._data_checks: list = []
 
         # Set some preprocessor settings (move all defaults here?)
         if settings is None:
@@ -473,39 +542,165 @@ class PreprocessorFile(TrackedFile):
                                 debug=debug,
                                 **self.settings[step])
 
+    def apply_steps(self, steps: list[str], debug: bool = False):
+        """Apply preprocessor steps to product.
+
+        If the preprocessor cache is enabled and the data has not been loaded
+        yet, the result of the longest sequence of ``steps`` that ends with
+        one of the :const:`CHECKPOINT_STEPS` is loaded from the cache if it
+        is available. The result of every step in :const:`CHECKPOINT_STEPS`
+        that needs to be run is stored in the cache.
+        """
+        cache = self._get_cache()
+        if cache is None or self._cubes is not None:
+            for step in steps:
+                self.apply(step, debug)
+            return
+
+        checkpoints = [
+            i + 1 for i, step in enumerate(steps) if step in CHECKPOINT_STEPS
+        ]
+        start = 0
+        for end in reversed(checkpoints):
+            cube = cache.load(self._get_cache_key(steps[:end]))
+            if cube is not None:
+                logger.info("Using cached result of steps %s for %s",
+                            ', '.join(steps[:end]), self.filename)
+                self.cubes = [cube]
+                start = end
+                break
+
+        for end, step in enumerate(steps[start:], start=start + 1):
+            self.apply(step, debug)
+            if end in checkpoints and len(self.cubes) == 1:
+                cube = cache.save(self._get_cache_key(steps[:end]),
+                                  self.cubes[0], self.pop_data_checks())
+                self.cubes = [cube]
+
+    def _get_cache(self) -> DataCache | None:
+        """Get the preprocessor cache if it is enabled."""
+        if not self.datasets:
+            return None
+        session = self.datasets[0].session
+        if session['preprocessor_cache_dir'] is None:
+            return None
+        return DataCache(
+            session['preprocessor_cache_dir'],
+            max_size=session['preprocessor_cache_size'] * 2**30,
+        )
+
+    def _get_cache_key(self, steps: list[str]) -> str:
+        """Get the key for caching the result of applying ``steps``."""
+        datasets = [[ds, *ds.supplementaries] for ds in self.datasets]
+        settings = [(step, self.settings[step])
+                    for step in ['load', *steps] if step in self.settings]
+        return get_key(datasets, settings)
+
     @property
     def cubes(self):
         """Cubes."""
         if self._cubes is None:
             callback = self.settings.get('load', {}).get('callback')
-            self._cubes = [
-                ds._load_with_callback(callback) for ds in self.datasets
-            ]
+            with _defer_data_checks() as checks:
+                self._cubes = [
+                    ds._load_with_callback(callback) for ds in self.datasets
+                ]
+            self._data_checks.extend(checks)
         return self._cubes
 
     @cubes.setter
     def cubes(self, value):
         self._cubes = value
 
-    def save(self):
-        """Save cubes to disk."""
-        preprocess(self._cubes,
-                   'save',
-                   input_files=self._input_files,
-                   **self.settings['save'])
+    def save(self) -> list:
+        """Save cubes to disk.
+
+        Returns
+        -------
+        list
+            Dask collections that write the data to disk when computed. This
+            is only non-empty if the ``compute`` argument of the ``save``
+            step is False.
+        """
+        result = preprocess(self._cubes,
+                            'save',
+                            input_files=self._input_files,
+                            **self.settings['save'])
+        delayeds = [item for item in result if dask.is_dask_collection(item)]
+        delayeds.extend(self.pop_data_checks())
         if 'cleanup' in self.settings:
+            # The input files may be removed, so finish writing first.
+            dask.compute(*delayeds)
+            delayeds = []
             preprocess([],
                        'cleanup',
                        input_files=self._input_files,
                        **self.settings['cleanup'])
+        return delayeds
+
+    def close(self) -> list:
+        """Close the file.
 
-    def close(self):
-        """Close the file."""
+        Returns
+        -------
+        list
+            Dask collections that write the data to disk when computed.
+        """
+        delayeds = []
         if self._cubes is not None:
             self._update_attributes()
-            self.save()
+            delayeds = self.save()
             self._cubes = None
             self.save_provenance()
+        return delayeds
+
+    def pop_data_checks(self) -> list:
+        """Remove and return the deferred checks of the data values.
+
+        Returns
+        -------
+        list
+            Dask collections that check the values of the loaded data when
+            computed.
+        """
+        checks = self._data_checks
+        self._data_checks = []
+        return checks
+
+    def get_realized_size(self) -> int:
+        """Get the size in bytes of the cube data that is held in memory."""
+        if self._cubes is None:
+            return 0
+        return sum(cube.core_data().nbytes for cube in self._cubes
+                   if not cube.has_lazy_data())
+
+    def spill(self, directory: Path) -> None:
+        """Write the cubes to disk and continue with lazy data.
+
+        Parameters
+        ----------
+        directory:
+            Directory where the cubes are written.
+        """
+        if self._cubes is None:
+            return
+        cubes = []
+        for i, cube in enumerate(self._cubes):
+            if cube.has_lazy_data():
+                cubes.append(cube)
+                continue
+            # Use a new file every time, because the cubes of other products
+            # may still use the data of previously spilled cubes.
+            fd, path = tempfile.mkstemp(
+                suffix='.nc',
+                prefix=f'{Path(self.filename).stem}_{i}_',
+                dir=directory,
+            )
+            os.close(fd)
+            logger.debug("Writing data of %s to %s", self.filename, path)
+            save([cube], path)
+            cubes.append(iris.load_cube(str(path)))
+        self._cubes = cubes
 
     def _update_attributes(self):
         """Update product attributes from cube metadata."""
@@ -567,6 +762,17 @@ class PreprocessorFile(TrackedFile):
         return '_'.join(identifier)
 
 
+def _get_file_size(file) -> int:
+    """Get the size of a (possibly not yet downloaded) input file in bytes."""
+    size = getattr(file, 'size', None)
+    if size is None:
+        try:
+            size = os.path.getsize(file)
+        except OSError:
+            size = 0
+    return size
+
+
 def _apply_multimodel(products, step, debug):
     """Apply multi model step to products."""
     settings, exclude = _get_multi_model_settings(products, step)
@@ -596,6 +802,7 @@ class PreprocessingTask(BaseTask):
         order: Iterable[str] = DEFAULT_ORDER,
         debug: bool | None = None,
         write_ncl_interface: bool = False,
+        memory_budget: float | None = None,
     ):
         """Initialize."""
         _check_multi_model_settings(products)
@@ -603,6 +810,8 @@ class PreprocessingTask(BaseTask):
         self.order = list(order)
         self.debug = debug
         self.write_ncl_interface = write_ncl_interface
+        self.memory_budget = memory_budget
+        self._spill_dir: Path | None = None
 
     def _initialize_product_provenance(self):
         """Initialize product provenance."""
@@ -645,8 +854,64 @@ class PreprocessingTask(BaseTask):
         for product in products:
             product.initialize_provenance(self.activity)
 
+    def estimate_memory(self) -> int:
+        """Estimate the amount of memory needed to run the task in bytes.
+
+        The estimate is the total size of the input files of all products.
+        """
+        input_files = {
+            file
+            for product in self.products
+            for file in product._input_files
+        }
+        return sum(_get_file_size(file) for file in input_files)
+
+    def _spill_products(self) -> None:
+        """Write data held in memory to disk if the memory budget is exceeded.
+
+        The products with the largest amount of realized data are written to
+        a temporary directory next to the output files and loaded again with
+        lazy data until the data held in memory fits in `memory_budget` (in
+        GB).
+        """
+        if self.memory_budget is None:
+            return
+        budget = self.memory_budget * 2**30
+        sizes = {
+            product: product.get_realized_size()
+            for product in self.products
+        }
+        total = sum(sizes.values())
+        if total <= budget:
+            return
+        if self._spill_dir is None:
+            output_dir = Path(min(self.products).filename).parent
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._spill_dir = Path(
+                tempfile.mkdtemp(prefix='.spill_', dir=output_dir))
+        logger.info(
+            "Data held in memory by task %s (%.1f GB) exceeds the memory "
+            "budget of %.1f GB, writing data to %s", self.name,
+            total / 2**30, self.memory_budget, self._spill_dir)
+        for product, size in sorted(sizes.items(),
+                                    key=lambda item: item[1],
+                                    reverse=True):
+            if total <= budget or size == 0:
+                break
+            product.spill(self._spill_dir)
+            total -= size
+
     def _run(self, _):
         """Run the preprocessor."""
+        try:
+            return self._run_blocks()
+        finally:
+            if self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    def _run_blocks(self):
+        """Run the preprocessor steps block by block."""
         self._initialize_product_provenance()
 
         steps = {
@@ -654,30 +919,48 @@ class PreprocessingTask(BaseTask):
             for product in self.products for step in product.settings
         }
         blocks = get_step_blocks(steps, self.order)
+        # Writing the data of the output files is delayed until all of them
+        # have been processed, so they can be written concurrently.
+        delayeds = []
         if not blocks:
             # If no preprocessing is configured, just load the data and save.
             for product in self.products:
                 product.cubes  # pylint: disable=pointless-statement
-                product.close()
+                delayeds.extend(product.close())
 
         for block in blocks:
             logger.debug("Running block %s", block)
+            # Cubes are kept in memory until the last block, unless they
+            # exceed the memory budget.
             if block[0] in MULTI_MODEL_FUNCTIONS:
                 for step in block:
+                    products = self.products
                     self.products = _apply_multimodel(self.products, step,
                                                       self.debug)
+                    # Keep the checks of the data of products that are no
+                    # longer needed
+                    for product in set(products) - set(self.products):
+                        delayeds.extend(product.pop_data_checks())
+                    if block != blocks[-1]:
+                        self._spill_products()
             else:
                 for product in self.products:
                     logger.debug("Applying single-model steps to %s", product)
-                    for step in block:
-                        if step in product.settings:
-                            product.apply(step, self.debug)
+                    steps = [
+                        step for step in block if step in product.settings
+                    ]
+                    product.apply_steps(steps, self.debug)
                     if block == blocks[-1]:
                         product.cubes  # pylint: disable=pointless-statement
-                        product.close()
+                        delayeds.extend(product.close())
+                    else:
+                        self._spill_products()
 
         for product in self.products:
-            product.close()
+            delayeds.extend(product.close())
+        if delayeds:
+            logger.debug("Writing data of %s output files", len(delayeds))
+            dask.compute(*delayeds)
         metadata_files = write_metadata(self.products,
                                         self.write_ncl_interface)
         return metadata_files
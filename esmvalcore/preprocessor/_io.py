@@ -1,28 +1,56 @@
 """Functions for loading and saving cubes."""
 import copy
+import hashlib
 import logging
 import os
 import shutil
+import threading
 import warnings
+from collections import OrderedDict
 from itertools import groupby
 from warnings import catch_warnings, filterwarnings
 
+import dask.array as da
 import iris
 import iris.aux_factory
 import iris.exceptions
+import netCDF4
+import numpy as np
 import yaml
 from cf_units import suppress_errors
+from iris.fileformats.netcdf import NetCDFDataProxy
 
+from esmvalcore.cmor._fixes.overlay import FileOverlay
 from esmvalcore.exceptions import ESMValCoreDeprecationWarning
 from esmvalcore.iris_helpers import merge_cube_attributes
+from esmvalcore.local import _find_time_variable
 
 from .._task import write_ncl_settings
-from ._time import extract_time
+
+try:
+    # Use the same lock as iris, because the netCDF library is not thread-safe
+    from iris.fileformats.netcdf._thread_safe_nc import (
+        _GLOBAL_NETCDF4_LOCK as _NETCDF4_LOCK,
+    )
+except ImportError:  # iris < 3.5
+    _NETCDF4_LOCK = threading.Lock()
 
 logger = logging.getLogger(__name__)
 
 GLOBAL_FILL_VALUE = 1e+20
 
+MAX_TEMPLATES = 100
+"""Maximum number of file templates kept in memory for re-use."""
+
+# Loaded cubes that can be re-used for files with the same structure, see
+# _load_from_template.
+_TEMPLATES: OrderedDict = OrderedDict()
+_TEMPLATES_LOCK = threading.Lock()
+
+# Attributes that differ between files, but are removed by
+# concatenate_callback
+_CALLBACK_ATTRIBUTES = ('creation_date', 'tracking_id', 'history', 'comment')
+
 DATASET_KEYS = {
     'mip',
 }
@@ -114,13 +142,14 @@ def _delete_attributes(iris_object, atts):
             del iris_object.attributes[att]
 
 
-def load(file, callback=None, ignore_warnings=None):
+def load(file, callback=None, ignore_warnings=None, reuse_metadata=False):
     """Load iris cubes from files.
 
     Parameters
     ----------
-    file: str
-        File to be loaded.
+    file: str or esmvalcore.cmor._fixes.overlay.FileOverlay
+        File to be loaded. If a :class:`FileOverlay` is given, the changes it
+        describes are applied to the file while loading it.
     callback: callable or None, optional (default: None)
         Callback function passed to :func:`iris.load_raw`.
 
@@ -130,6 +159,13 @@ def load(file, callback=None, ignore_warnings=None):
         Keyword arguments passed to :func:`warnings.filterwarnings` used to
         ignore warnings issued by :func:`iris.load_raw`. Each list element
         corresponds to one call to :func:`warnings.filterwarnings`.
+    reuse_metadata: bool, optional (default: False)
+        If True, a NetCDF file that has the same structure as a file that was
+        loaded before is loaded by re-using the cubes loaded from that file.
+        Only the time coordinate is read from the file and the data is
+        loaded lazily from it. Files have the same structure if they only
+        differ in the length and values of the time coordinate and in the
+        attributes removed by the default callback.
 
     Returns
     -------
@@ -148,6 +184,10 @@ def load(file, callback=None, ignore_warnings=None):
         warnings.warn(msg, ESMValCoreDeprecationWarning)
     if callback == 'default':
         callback = concatenate_callback
+    overlay = None
+    if isinstance(file, FileOverlay):
+        overlay = file
+        file = overlay.filepath
     file = str(file)
     logger.debug("Loading:\n%s", file)
     if ignore_warnings is None:
@@ -178,7 +218,16 @@ def load(file, callback=None, ignore_warnings=None):
         # warnings.filterwarnings
         # (see https://github.com/SciTools/cf-units/issues/240)
         with suppress_errors():
-            raw_cubes = iris.load_raw(file, callback=callback)
+            raw_cubes = None
+            if overlay is not None:
+                with overlay.open() as dataset:
+                    raw_cubes = iris.load_raw(dataset, callback=callback)
+            elif reuse_metadata:
+                raw_cubes = _load_from_template(file, callback)
+            if raw_cubes is None:
+                raw_cubes = iris.load_raw(file, callback=callback)
+                if reuse_metadata:
+                    _add_template(file, callback, raw_cubes)
     logger.debug("Done with loading %s", file)
     if not raw_cubes:
         raise ValueError(f'Can not load cubes from {file}')
@@ -187,17 +236,184 @@ def load(file, callback=None, ignore_warnings=None):
     return raw_cubes
 
 
-def _by_two_concatenation(cubes):
-    """Perform a by-2 concatenation to avoid gaps."""
-    concatenated = iris.cube.CubeList(cubes).concatenate()
-    if len(concatenated) == 1:
-        return concatenated[0]
+def _read_structure(file, callback):
+    """Read the structure of a NetCDF file.
 
-    concatenated = _concatenate_overlapping_cubes(concatenated)
-    if len(concatenated) == 2:
-        _get_concatenation_error(concatenated)
+    Returns ``None`` if the file cannot be loaded from a template. Otherwise,
+    a key identifying the structure of the file and a dictionary describing
+    the time coordinate and the variables depending on time is returned.
+    """
+    if callback is concatenate_callback:
+        # The callback removes these attributes from the cube and 'history'
+        # from the coordinates.
+        ignore_cube = _CALLBACK_ATTRIBUTES
+        ignore_coord = ('history', )
+    elif callback is None:
+        ignore_cube = ignore_coord = ()
+    else:
+        # Other callbacks may modify the cubes depending on the file.
+        return None
+
+    def get_attributes(item, ignore):
+        return [(name, np.asarray(item.getncattr(name)).tolist())
+                for name in item.ncattrs() if name not in ignore]
+
+    with _NETCDF4_LOCK:
+        try:
+            dataset = netCDF4.Dataset(file)
+        except OSError:
+            return None
+        with dataset:
+            time = _find_time_variable(dataset)
+            if time is None or time.ndim != 1:
+                return None
+            time_dim = time.dimensions[0]
+
+            # Everything except the values of the variables depending on time
+            # and the length of the time dimension is part of the key.
+            key = hashlib.sha256()
+            key.update(repr(get_attributes(dataset, ignore_cube)).encode())
+            for name, dim in dataset.dimensions.items():
+                size = None if name == time_dim else len(dim)
+                key.update(repr((name, size)).encode())
+            bounds = getattr(time, 'bounds', getattr(time, 'climatology',
+                                                     None))
+            variables = {}
+            for name, variable in dataset.variables.items():
+                if (time_dim in variable.dimensions
+                        and name not in (time.name, bounds)):
+                    ignore = ignore_cube
+                else:
+                    ignore = ignore_coord
+                key.update(
+                    repr((name, variable.dimensions, str(variable.dtype),
+                          get_attributes(variable, ignore))).encode())
+                if time_dim in variable.dimensions:
+                    variables[name] = (
+                        variable.shape,
+                        getattr(variable, '_FillValue',
+                                netCDF4.default_fillvals.get(
+                                    variable.dtype.str[1:])),
+                    )
+                else:
+                    values = np.ma.asarray(variable[:])
+                    key.update(np.ma.getmaskarray(values).tobytes())
+                    data = np.ma.getdata(values)
+                    if data.dtype == object:
+                        # Variable length strings
+                        key.update(repr(data.tolist()).encode())
+                    else:
+                        key.update(data.tobytes())
+            structure = {
+                'time': time.name,
+                'time_bounds': bounds,
+                'points': time[:],
+                'bounds': None if bounds is None else dataset[bounds][:],
+                'variables': variables,
+            }
+    if any(np.ma.is_masked(structure[k]) for k in ('points', 'bounds')):
+        return None
+    structure['points'] = np.ma.getdata(structure['points'])
+    if structure['bounds'] is not None:
+        structure['bounds'] = np.ma.getdata(structure['bounds'])
+    return (callback, key.hexdigest()), structure
+
+
+def _is_template(cube, structure):
+    """Check if a cube can be re-used for other files."""
+    if cube.var_name not in structure['variables'] or cube.aux_factories:
+        return False
+    time = cube.coords(var_name=structure['time'], dim_coords=True)
+    if not time:
+        return False
+    time_dim = cube.coord_dims(time[0])[0]
+    # Only the time coordinate and the data may depend on time.
+    dims = [cube.coord_dims(c) for c in cube.coords()]
+    dims.extend(cube.cell_measure_dims(m) for m in cube.cell_measures())
+    dims.extend(
+        cube.ancillary_variable_dims(a) for a in cube.ancillary_variables())
+    return sum(time_dim in d for d in dims) == 1
+
+
+def _add_template(file, callback, cubes):
+    """Keep the cubes loaded from file for files with the same structure."""
+    result = _read_structure(file, callback)
+    if result is None:
+        return
+    key, structure = result
+    if not all(_is_template(cube, structure) for cube in cubes):
+        return
+    allowed = {structure['time'], structure['time_bounds']}
+    allowed.update(cube.var_name for cube in cubes)
+    if not allowed.issuperset(structure['variables']):
+        return
+    with _TEMPLATES_LOCK:
+        _TEMPLATES[key] = [cube.copy() for cube in cubes]
+        while len(_TEMPLATES) > MAX_TEMPLATES:
+            _TEMPLATES.popitem(last=False)
+
+
+def _load_from_template(file, callback):
+    """Load cubes from file re-using cubes of a file with the same structure.
+
+    Returns ``None`` if no such cubes are available.
+    """
+    result = _read_structure(file, callback)
+    if result is None:
+        return None
+    key, structure = result
+    with _TEMPLATES_LOCK:
+        templates = _TEMPLATES.get(key)
+        if templates is None:
+            return None
+        _TEMPLATES.move_to_end(key)
+
+    cubes = iris.cube.CubeList()
+    for template in templates:
+        try:
+            cube = _cube_from_template(template, file, structure)
+        except ValueError as exc:
+            # For example, if the time points are not monotonic.
+            logger.debug("Unable to load %s from template: %s", file, exc)
+            return None
+        cubes.append(cube)
+    logger.debug("Loaded %s from template", file)
+    return cubes
+
+
+def _cube_from_template(template, file, structure):
+    """Create a cube with the time coordinate and data from file."""
+    time = template.coord(var_name=structure['time'], dim_coords=True)
+    shape, fill_value = structure['variables'][template.var_name]
+
+    proxy = NetCDFDataProxy(shape, template.dtype, file, template.var_name,
+                            fill_value)
+    if template.has_lazy_data():
+        chunks = tuple(c[0] for c in template.lazy_data().chunks)
     else:
-        return concatenated[0]
+        chunks = shape
+    meta = np.ma.array(np.empty((0, ) * len(shape), dtype=template.dtype),
+                       mask=True)
+    data = da.from_array(proxy, chunks=chunks, asarray=False, meta=meta)
+
+    cube = iris.cube.Cube(data, **copy.deepcopy(template.metadata._asdict()))
+    for coord in template.dim_coords:
+        dims = template.coord_dims(coord)
+        if coord is time:
+            coord = time.copy(points=structure['points'],
+                              bounds=structure['bounds'])
+        else:
+            coord = coord.copy()
+        cube.add_dim_coord(coord, dims)
+    for coord in template.aux_coords:
+        cube.add_aux_coord(coord.copy(), template.coord_dims(coord))
+    for measure in template.cell_measures():
+        cube.add_cell_measure(measure.copy(),
+                              template.cell_measure_dims(measure))
+    for ancillary in template.ancillary_variables():
+        dims = template.ancillary_variable_dims(ancillary)
+        cube.add_ancillary_variable(ancillary.copy(), dims)
+    return cube
 
 
 def _get_concatenation_error(cubes):
@@ -217,8 +433,81 @@ def _get_concatenation_error(cubes):
     raise ValueError(f'Can not concatenate cubes: {msg}')
 
 
+def _sort_cubes_by_time(cubes):
+    """Sort cubes by their first time point."""
+    try:
+        times = [cube.coord('time') for cube in cubes]
+    except iris.exceptions.CoordinateNotFoundError as exc:
+        msg = "One or more cubes {} are missing".format(cubes) + \
+              " time coordinate: {}".format(str(exc))
+        raise ValueError(msg)
+
+    # The time points can only be compared if all cubes use the same units
+    for cube, time in zip(cubes[1:], times[1:]):
+        if time.units != times[0].units:
+            raise ValueError(
+                f"Cubes\n{cubes[0]}\nand\n{cube}\ncan not be concatenated: "
+                f"time units {times[0].units}, calendar "
+                f"{times[0].units.calendar} and {time.units}, calendar "
+                f"{time.units.calendar} differ")
+
+    order = sorted(range(len(cubes)), key=lambda i: times[i].points[0])
+    return [cubes[i] for i in order]
+
+
+def _remove_time_overlaps(cubes):
+    """Remove time points that overlap between cubes sorted by time.
+
+    If a cube overlaps with the previous one, the data from the cube that
+    starts later is used and the previous cube is shortened, unless the
+    cube ends before the previous one. In that case, the cube is not used if
+    it has time points in common with the previous cube. Otherwise, both
+    cubes are kept, so concatenating them fails.
+    """
+    result = []
+    for cube in cubes:
+        points = cube.coord('time').points
+        if result:
+            previous, previous_points = result[-1]
+            if points[0] <= previous_points[-1]:
+                if points[-1] < previous_points[-1]:
+                    if np.isin(points, previous_points).any():
+                        logger.debug("Using only data from %s instead of %s",
+                                     previous, cube)
+                        continue
+                    result.append((cube, points))
+                    continue
+                overlap = np.isin(previous_points, points)
+                if overlap.any():
+                    # Only keep the time points before the first common one
+                    end = overlap.argmax()
+                    logger.debug(
+                        "Using %s of %s time points from cube %s to "
+                        "concatenate it with cube %s", end,
+                        len(previous_points), previous, cube)
+                    result.pop()
+                    if end > 0:
+                        previous = _slice_time(previous, end)
+                        result.append((previous, previous_points[:end]))
+        result.append((cube, points))
+    return [cube for cube, _ in result]
+
+
+def _slice_time(cube, end):
+    """Select the first `end` time points from cube."""
+    slices = [slice(None)] * cube.ndim
+    slices[cube.coord_dims('time')[0]] = slice(0, end)
+    return cube[tuple(slices)]
+
+
 def concatenate(cubes):
-    """Concatenate all cubes after fixing metadata."""
+    """Concatenate all cubes after fixing metadata.
+
+    Cubes are sorted by time and overlapping time points are removed in a
+    single pass, after which all cubes are concatenated at once. This
+    keeps the cost linear in the number of cubes, which matters for data
+    that is split over many files.
+    """
     if not cubes:
         return cubes
     if len(cubes) == 1:
@@ -226,19 +515,13 @@ def concatenate(cubes):
 
     merge_cube_attributes(cubes)
 
-    if len(cubes) > 1:
-        # order cubes by first time point
-        try:
-            cubes = sorted(cubes, key=lambda c: c.coord("time").cell(0).point)
-        except iris.exceptions.CoordinateNotFoundError as exc:
-            msg = "One or more cubes {} are missing".format(cubes) + \
-                  " time coordinate: {}".format(str(exc))
-            raise ValueError(msg)
+    cubes = _sort_cubes_by_time(cubes)
+    cubes = _remove_time_overlaps(cubes)
 
-        # iteratively concatenate starting with first cube
-        result = cubes[0]
-        for cube in cubes[1:]:
-            result = _by_two_concatenation([result, cube])
+    concatenated = iris.cube.CubeList(cubes).concatenate()
+    if len(concatenated) > 1:
+        _get_concatenation_error(concatenated)
+    result = concatenated[0]
 
     _fix_aux_factories(result)
 
@@ -250,6 +533,11 @@ def save(cubes,
          optimize_access='',
          compress=False,
          alias='',
+         chunks=None,
+         compression_level=None,
+         shuffle=True,
+         least_significant_digit=None,
+         compute=True,
          **kwargs):
     """Save iris cubes to file.
 
@@ -259,7 +547,9 @@ def save(cubes,
         Data cubes to be saved
 
     filename: str
-        Name of target file
+        Name of target file. If it ends in ``.zarr``, the cubes are saved to
+        a Zarr store instead of a NetCDF file. Only the chunking options
+        below are used for Zarr stores.
 
     optimize_access: str
         Set internal NetCDF chunking to favour a reading scheme
@@ -276,22 +566,59 @@ def save(cubes,
     alias: str, optional
         Var name to use when saving instead of the one in the cube.
 
+    chunks: str or float, optional
+        Set internal NetCDF chunking from the chunks of the data. If
+        ``'dask'``, the chunks of the (lazy) data are used. If a number, the
+        chunks are chosen such that they are about this size in MB, while
+        following the chunks of the data as much as possible. Cannot be used
+        together with ``optimize_access``.
+
+    compression_level: int, optional
+        Compression level between 1 and 9. Only used if ``compress`` is
+        True. If not specified, the NetCDF library default is used.
+
+    shuffle: bool, optional
+        Apply the HDF5 shuffle filter before compressing. Only used if
+        ``compress`` is True.
+
+    least_significant_digit: int, optional
+        Quantize the data such that a precision of
+        ``10**-least_significant_digit`` is retained, which improves
+        compression at the cost of losing some precision. Only used if
+        ``compress`` is True.
+
+    compute: bool, optional
+        If False, only the metadata is written to the file and a dask
+        collection that writes the data when computed is returned. This
+        allows writing several files at once.
+
     Returns
     -------
-    str
-        filename
+    str or dask.delayed.Delayed or dask.array.Array
+        filename, or a dask collection that writes the data if ``compute`` is
+        False and the file is saved.
 
     Raises
     ------
     ValueError
-        cubes is empty.
+        cubes is empty or both ``optimize_access`` and ``chunks`` are
+        specified.
     """
     if not cubes:
         raise ValueError(f"Cannot save empty cubes '{cubes}'")
+    if optimize_access and chunks is not None:
+        raise ValueError(
+            "Cannot use both `optimize_access` and `chunks` when saving")
 
     # Rename some arguments
     kwargs['target'] = filename
     kwargs['zlib'] = compress
+    if compress:
+        kwargs['shuffle'] = shuffle
+        if compression_level is not None:
+            kwargs['complevel'] = compression_level
+        if least_significant_digit is not None:
+            kwargs['least_significant_digit'] = least_significant_digit
 
     dirname = os.path.dirname(filename)
     if not os.path.exists(dirname):
@@ -322,6 +649,8 @@ def save(cubes,
         kwargs['chunksizes'] = tuple(
             length if index in dims else 1
             for index, length in enumerate(cube.shape))
+    elif chunks is not None:
+        kwargs['chunksizes'] = _get_chunksizes(cubes[0], chunks)
 
     kwargs['fill_value'] = GLOBAL_FILL_VALUE
     if alias:
@@ -330,9 +659,206 @@ def save(cubes,
             logger.debug('Changing var_name from %s to %s', cube.var_name,
                          alias)
             cube.var_name = alias
-    iris.save(cubes, **kwargs)
+    if os.path.splitext(filename)[1] == '.zarr':
+        return _save_zarr(cubes,
+                          filename,
+                          chunksizes=kwargs.get('chunksizes'),
+                          compute=compute)
+    if not compute:
+        kwargs['compute'] = False
+    result = iris.save(cubes, **kwargs)
 
-    return filename
+    return filename if compute else result
+
+
+def _save_zarr(cubes, filename, chunksizes=None, compute=True):
+    """Save iris cubes to a Zarr store.
+
+    The store uses the same conventions as :mod:`xarray`, so it can be
+    opened with :func:`xarray.open_zarr`. The data is written directly from
+    the chunks of the (lazy) data, so many chunks and stores can be written
+    at the same time. Requires the :mod:`zarr` package.
+
+    Parameters
+    ----------
+    cubes: iterable of iris.cube.Cube
+        Data cubes to be saved.
+    filename: str
+        Path of the Zarr store (a directory).
+    chunksizes: tuple of int, optional
+        Chunk sizes of the stored data. By default, the chunks of the
+        (lazy) data are used.
+    compute: bool, optional
+        If False, only the metadata and coordinates are written and a dask
+        collection that writes the data when computed is returned.
+
+    Returns
+    -------
+    str or dask.array.Array or dask.delayed.Delayed
+        filename, or a dask collection that writes the data if ``compute`` is
+        False.
+    """
+    import zarr  # pylint: disable=import-outside-toplevel
+
+    # xarray reads the dimension names from the `_ARRAY_DIMENSIONS` attribute
+    # used in version 2 of the Zarr format, so always write that version.
+    zarr_kwargs = {}
+    if int(zarr.__version__.split('.')[0]) >= 3:
+        zarr_kwargs['zarr_format'] = 2
+
+    filename = str(filename)
+    group = zarr.open_group(filename, mode='w', **zarr_kwargs)
+    global_attributes = _get_common_attributes(cubes)
+    group.attrs.update(global_attributes)
+
+    sources = []
+    targets = []
+    written = set()
+
+    def write(name, values, dims, attributes, chunks=None):
+        """Write a variable to the store."""
+        if name in written:
+            return
+        written.add(name)
+        if np.issubdtype(values.dtype, np.floating):
+            fill_value = GLOBAL_FILL_VALUE
+        else:
+            fill_value = netCDF4.default_fillvals.get(values.dtype.str[1:])
+        if isinstance(values, da.Array):
+            if chunks is None:
+                chunks = tuple(max(max(c), 1) for c in values.chunks)
+            values = da.ma.filled(values.rechunk(chunks), fill_value)
+        else:
+            values = np.ma.filled(values, fill_value)
+        array = zarr.open_array(
+            filename,
+            mode='w',
+            path=name,
+            shape=values.shape,
+            dtype=values.dtype,
+            chunks=chunks or values.shape or None,
+            fill_value=fill_value,
+            **zarr_kwargs,
+        )
+        array.attrs.update(attributes)
+        array.attrs['_ARRAY_DIMENSIONS'] = list(dims)
+        if isinstance(values, da.Array):
+            sources.append(values)
+            targets.append(array)
+        else:
+            array[...] = values
+
+    for cube in cubes:
+        dim_names = [f'dim{i}' for i in range(cube.ndim)]
+        for coord in cube.dim_coords:
+            dim_names[cube.coord_dims(coord)[0]] = (coord.var_name
+                                                    or coord.name())
+        coord_names = []
+        for coord in cube.coords():
+            name = coord.var_name or coord.name()
+            dims = [dim_names[i] for i in cube.coord_dims(coord)]
+            attributes = _get_variable_attributes(coord)
+            attributes.update(
+                (k, _get_json_value(v)) for k, v in coord.attributes.items())
+            # Scalar coordinates have shape (1, ) in iris
+            shape = tuple(cube.shape[i] for i in cube.coord_dims(coord))
+            if coord.has_bounds():
+                bounds_dim = ('bnds' if coord.nbounds == 2 else
+                              f'nv{coord.nbounds}')
+                attributes['bounds'] = f'{name}_bnds'
+                write(f'{name}_bnds',
+                      coord.core_bounds().reshape(shape + (coord.nbounds, )),
+                      dims + [bounds_dim], {})
+            write(name, coord.core_points().reshape(shape), dims, attributes)
+            if coord not in cube.dim_coords:
+                coord_names.append(name)
+
+        attributes = _get_variable_attributes(cube)
+        for key, value in cube.attributes.items():
+            if key not in global_attributes:
+                attributes[key] = _get_json_value(value)
+        if coord_names:
+            attributes['coordinates'] = ' '.join(coord_names)
+        if cube.cell_methods:
+            attributes['cell_methods'] = ' '.join(
+                _format_cell_method(m) for m in cube.cell_methods)
+        write(cube.var_name or cube.name(), cube.core_data(), dim_names,
+              attributes, chunksizes)
+
+    if not sources:
+        return filename
+    result = da.store(sources, targets, compute=compute, lock=False)
+    return filename if compute else result
+
+
+def _get_json_value(value):
+    """Convert an attribute value to a value that can be stored as JSON."""
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return np.asarray(value).tolist()
+
+
+def _get_common_attributes(cubes):
+    """Get the attributes that are the same for all cubes."""
+    attributes = {}
+    for key, value in cubes[0].attributes.items():
+        value = _get_json_value(value)
+        if all(key in cube.attributes
+               and _get_json_value(cube.attributes[key]) == value
+               for cube in cubes[1:]):
+            attributes[key] = value
+    return attributes
+
+
+def _get_variable_attributes(item):
+    """Get the names and units of a coordinate or cube as CF attributes."""
+    attributes = {}
+    if item.standard_name:
+        attributes['standard_name'] = item.standard_name
+    if item.long_name:
+        attributes['long_name'] = item.long_name
+    if not (item.units.is_unknown() or item.units.is_no_unit()):
+        attributes['units'] = str(item.units)
+    if item.units.calendar:
+        attributes['calendar'] = item.units.calendar
+    return attributes
+
+
+def _format_cell_method(cell_method):
+    """Format a cell method according to the CF conventions."""
+    text = ' '.join(f'{name}:' for name in cell_method.coord_names)
+    text = f'{text} {cell_method.method}'
+    extra = [f'interval: {i}' for i in cell_method.intervals]
+    extra.extend(f'comment: {c}' for c in cell_method.comments)
+    if extra:
+        text = f"{text} ({' '.join(extra)})"
+    return text.strip()
+
+
+def _get_chunksizes(cube, chunks):
+    """Get NetCDF chunk sizes from the chunks of the data."""
+    if not cube.shape:
+        return None
+    if cube.has_lazy_data():
+        data_chunks = cube.lazy_data().chunks
+    else:
+        data_chunks = tuple((length, ) for length in cube.shape)
+    if chunks == 'dask':
+        return tuple(c[0] for c in data_chunks)
+    try:
+        limit = float(chunks) * 2**20
+    except ValueError as exc:
+        raise ValueError(
+            f"Expected 'dask' or a chunk size in MB for `chunks`, got "
+            f"'{chunks}'") from exc
+    new_chunks = da.core.normalize_chunks(
+        'auto',
+        shape=cube.shape,
+        limit=limit,
+        dtype=cube.dtype,
+        previous_chunks=tuple(c[0] for c in data_chunks),
+    )
+    return tuple(c[0] for c in new_chunks)
 
 
 def _get_debug_filename(filename, step):
@@ -448,98 +974,3 @@ def _write_ncl_metadata(output_dir, metadata):
     write_ncl_settings(info, filename)
 
     return filename
-
-
-def _concatenate_overlapping_cubes(cubes):
-    """Concatenate time-overlapping cubes (two cubes only)."""
-    # we arrange [cube1, cube2] so that cube1.start <= cube2.start
-    if cubes[0].coord('time').points[0] <= cubes[1].coord('time').points[0]:
-        cubes = [cubes[0], cubes[1]]
-        logger.debug(
-            "Will attempt to concatenate cubes %s "
-            "and %s in this order", cubes[0], cubes[1])
-    else:
-        cubes = [cubes[1], cubes[0]]
-        logger.debug(
-            "Will attempt to concatenate cubes %s "
-            "and %s in this order", cubes[1], cubes[0])
-
-    # get time end points
-    time_1 = cubes[0].coord('time')
-    time_2 = cubes[1].coord('time')
-    if time_1.units != time_2.units:
-        raise ValueError(
-            f"Cubes\n{cubes[0]}\nand\n{cubes[1]}\ncan not be concatenated: "
-            f"time units {time_1.units}, calendar {time_1.units.calendar} "
-            f"and {time_2.units}, calendar {time_2.units.calendar} differ")
-    data_start_1 = time_1.cell(0).point
-    data_start_2 = time_2.cell(0).point
-    data_end_1 = time_1.cell(-1).point
-    data_end_2 = time_2.cell(-1).point
-
-    # case 1: both cubes start at the same time -> return longer cube
-    if data_start_1 == data_start_2:
-        if data_end_1 <= data_end_2:
-            logger.debug(
-                "Both cubes start at the same time but cube %s "
-                "ends before %s", cubes[0], cubes[1])
-            logger.debug("Cube %s contains all needed data so using it fully",
-                         cubes[1])
-            cubes = [cubes[1]]
-        else:
-            logger.debug(
-                "Both cubes start at the same time but cube %s "
-                "ends before %s", cubes[1], cubes[0])
-            logger.debug("Cube %s contains all needed data so using it fully",
-                         cubes[0])
-            cubes = [cubes[0]]
-
-    # case 2: cube1 starts before cube2
-    else:
-        # find time overlap, if any
-        start_overlap = next((time_1.units.num2date(t)
-                              for t in time_1.points if t in time_2.points),
-                             None)
-        # case 2.0: no overlap (new iris implementation does allow
-        # concatenation of cubes with no overlap)
-        if not start_overlap:
-            logger.debug(
-                "Unable to concatenate non-overlapping cubes\n%s\nand\n%s"
-                "separated in time.", cubes[0], cubes[1])
-        # case 2.1: cube1 ends after cube2 -> return cube1
-        elif data_end_1 > data_end_2:
-            cubes = [cubes[0]]
-            logger.debug("Using only data from %s", cubes[0])
-        # case 2.2: cube1 ends before cube2 -> use full cube2 and shorten cube1
-        else:
-            logger.debug(
-                "Extracting time slice between %s and %s from cube %s to use "
-                "it for concatenation with cube %s", "-".join([
-                    str(data_start_1.year),
-                    str(data_start_1.month),
-                    str(data_start_1.day)
-                ]), "-".join([
-                    str(start_overlap.year),
-                    str(start_overlap.month),
-                    str(start_overlap.day)
-                ]), cubes[0], cubes[1])
-            c1_delta = extract_time(cubes[0], data_start_1.year,
-                                    data_start_1.month, data_start_1.day,
-                                    start_overlap.year, start_overlap.month,
-                                    start_overlap.day)
-            # convert c1_delta scalar cube to vector cube, if needed
-            if c1_delta.data.shape == ():
-                c1_delta = iris.util.new_axis(c1_delta, scalar_coord="time")
-            cubes = iris.cube.CubeList([c1_delta, cubes[1]])
-            logger.debug("Attempting concatenatenation of %s with %s",
-                         c1_delta, cubes[1])
-            try:
-                cubes = [iris.cube.CubeList(cubes).concatenate_cube()]
-            except iris.exceptions.ConcatenateError as ex:
-                logger.error('Can not concatenate cubes: %s', ex)
-                logger.error('Cubes:')
-                for cube in cubes:
-                    logger.error(cube)
-                raise ex
-
-    return cubes
@@ -3,6 +3,7 @@
 
 import collections
 
+import dask.array as da
 import iris
 import numpy as np
 
@@ -180,6 +181,35 @@ def get_slice_coords(cube):
     return slice_coords
 
 
+def _get_mapped_dims(src, src_rep):
+    """Get the dimensions of the source cube that are mapped and kept."""
+    ref_to_slice = get_slice_coords(src_rep)
+    src_slice_dims = ref_to_dims_index(src, ref_to_slice)
+    src_keep_dims = list(set(range(src.ndim)) - set(src_slice_dims))
+    return src_slice_dims, src_keep_dims
+
+
+def _create_mapped_cube(src, src_keep_dims, dst_rep, data):
+    """Create the cube that results from mapping slices of a cube."""
+    src_keep_spec = get_slice_spec(src, src_keep_dims)
+    dim_coords = src_keep_spec[1] + dst_rep.coords(dim_coords=True)
+    dim_coords_and_dims = [(c, i) for i, c in enumerate(dim_coords)]
+    aux_coords_and_dims = [(c, src.coord_dims(c)) for c in src_keep_spec[2]]
+    aux_coords_and_dims += [(c, src.coord_dims(c)) for c in dst_rep.aux_coords]
+    dst = iris.cube.Cube(
+        data=data,
+        standard_name=src.standard_name,
+        long_name=src.long_name,
+        var_name=src.var_name,
+        units=src.units,
+        attributes=src.attributes,
+        cell_methods=src.cell_methods,
+        dim_coords_and_dims=dim_coords_and_dims,
+        aux_coords_and_dims=aux_coords_and_dims,
+    )
+    return dst
+
+
 def map_slices(src, func, src_rep, dst_rep):
     """
     Map slices of a cube, replacing them with different slices.
@@ -213,27 +243,61 @@ def map_slices(src, func, src_rep, dst_rep):
         :class:`iris.coords.DimCoord` for the new dimensions are taken from
         `dst_rep`.
     """
-    ref_to_slice = get_slice_coords(src_rep)
-    src_slice_dims = ref_to_dims_index(src, ref_to_slice)
-    src_keep_dims = list(set(range(src.ndim)) - set(src_slice_dims))
-    src_keep_spec = get_slice_spec(src, src_keep_dims)
-    res_shape = src_keep_spec[0] + dst_rep.shape
-    dim_coords = src_keep_spec[1] + dst_rep.coords(dim_coords=True)
-    dim_coords_and_dims = [(c, i) for i, c in enumerate(dim_coords)]
-    aux_coords_and_dims = [(c, src.coord_dims(c)) for c in src_keep_spec[2]]
-    aux_coords_and_dims += [(c, src.coord_dims(c)) for c in dst_rep.aux_coords]
-    dst = iris.cube.Cube(
-        data=get_empty_data(res_shape, dtype=src.dtype),
-        standard_name=src.standard_name,
-        long_name=src.long_name,
-        var_name=src.var_name,
-        units=src.units,
-        attributes=src.attributes,
-        cell_methods=src.cell_methods,
-        dim_coords_and_dims=dim_coords_and_dims,
-        aux_coords_and_dims=aux_coords_and_dims,
-    )
+    src_slice_dims, src_keep_dims = _get_mapped_dims(src, src_rep)
+    res_shape = tuple(src.shape[d] for d in src_keep_dims) + dst_rep.shape
+    dst = _create_mapped_cube(src, src_keep_dims, dst_rep,
+                              get_empty_data(res_shape, dtype=src.dtype))
     for src_ind, dst_ind in index_iterator(src_slice_dims, src.shape):
         res = func(src[src_ind])
         dst.data[dst_ind] = res
     return dst
+
+
+def map_blocks(src, func, src_rep, dst_rep, **kwargs):
+    """
+    Map blocks of a cube lazily, replacing the sliced dimensions.
+
+    This is the lazy equivalent of :func:`map_slices`. Instead of calling
+    ``func`` on every slice of the cube, the (lazy) data is rearranged such
+    that the dimensions to be replaced are the last dimensions and form a
+    single chunk, and ``func`` is applied to every chunk with
+    :func:`dask.array.map_blocks`.
+
+    Parameters
+    ----------
+    src: :class:`iris.cube.Cube`
+        Source cube to be mapped.
+    func: callable
+        Callable that takes a (masked) numpy array, of which the last
+        dimensions correspond to the dimensions of ``src_rep``, and returns an
+        array of which the last dimensions have the shape of ``dst_rep``.
+    src_rep: :class:`iris.cube.Cube`
+        Source representant that specifies the dimensions to be removed from
+        the source cube.
+    dst_rep: :class:`iris.cube.Cube`
+        Destination representant that specifies the shape of the new
+        dimensions.
+    **kwargs:
+        Keyword arguments passed to ``func``.
+
+    Returns
+    -------
+    :class:`iris.cube.Cube`:
+        New cube with lazy data that has the shape of the source cube with the
+        removed dimensions replaced with the destination dimensions.
+    """
+    src_slice_dims, src_keep_dims = _get_mapped_dims(src, src_rep)
+    n_keep = len(src_keep_dims)
+    data = da.transpose(src.lazy_data(),
+                        src_keep_dims + sorted(src_slice_dims))
+    data = data.rechunk(
+        {d: 'auto' if d < n_keep else -1 for d in range(data.ndim)})
+    res_data = da.map_blocks(
+        func,
+        data,
+        chunks=data.chunks[:n_keep] + tuple((n, ) for n in dst_rep.shape),
+        dtype=src.dtype,
+        meta=np.ma.array(np.empty((0, ) * data.ndim, dtype=src.dtype)),
+        **kwargs,
+    )
+    return _create_mapped_cube(src, src_keep_dims, dst_rep, res_data)
@@ -14,6 +14,7 @@ from datetime import datetime
 from functools import reduce
 
 import cf_units
+import dask.array as da
 import iris
 import iris.coord_categorisation
 import numpy as np
@@ -53,6 +54,18 @@ STATISTIC_MAPPING = {
 
 CONCAT_DIM = 'multi-model'
 
+# Statistics that can be computed together in a single pass over the data
+FUSED_STATISTICS = {
+    iris.analysis.MAX: 'max',
+    iris.analysis.MEAN: 'mean',
+    iris.analysis.MEDIAN: 'median',
+    iris.analysis.MIN: 'min',
+    iris.analysis.PERCENTILE: 'percentile',
+    iris.analysis.STD_DEV: 'std_dev',
+    iris.analysis.SUM: 'sum',
+    iris.analysis.VARIANCE: 'variance',
+}
+
 
 def _resolve_operator(statistic: str):
     """Find the operator corresponding to the statistic."""
@@ -487,12 +500,199 @@ def _compute_slices(cubes):
         yield slice(start, end)
 
 
-def _compute_eager(cubes: list, *, operator: iris.analysis.Aggregator,
-                   ignore_scalar_coords=False, **kwargs):
-    """Compute statistics one slice at a time."""
+def _collapse(cube, operator, **kwargs):
+    """Collapse the multi-model dimension of a combined cube."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            'ignore',
+            message=(
+                "Collapsing a non-contiguous coordinate. "
+                f"Metadata may not be fully descriptive for '{CONCAT_DIM}."
+            ),
+            category=UserWarning,
+            module='iris',
+        )
+        warnings.filterwarnings(
+            'ignore',
+            message=(
+                f"Cannot check if coordinate is contiguous: Invalid "
+                f"operation for '{CONCAT_DIM}'"
+            ),
+            category=UserWarning,
+            module='iris',
+        )
+        return cube.collapsed(CONCAT_DIM, operator, **kwargs)
+
+
+def _update_cell_methods(result_cube, n_cubes):
+    """Add the number of input cubes to the cell method of the result."""
+    if result_cube.cell_methods:
+        cell_method = result_cube.cell_methods[0]
+        result_cube.cell_methods = None
+        updated_method = iris.coords.CellMethod(
+            method=cell_method.method,
+            coords=cell_method.coord_names,
+            intervals=cell_method.intervals,
+            comments=f'input_cubes: {n_cubes}')
+        result_cube.add_cell_method(updated_method)
+
+
+def _percentile_from_sorted(sorted_data, count, percent):
+    """Compute a percentile from data sorted along the first axis.
+
+    Masked values must be sorted to the end. The percentile is linearly
+    interpolated between the closest ranks, as done by
+    :func:`scipy.stats.mstats.mquantiles` with ``alphap=1`` and ``betap=1``.
+    """
+    position = (count - 1) * percent / 100.
+    lower = np.clip(np.floor(position).astype(int), 0, None)
+    upper = np.clip(np.ceil(position).astype(int), 0, None)
+    values = sorted_data.filled(0.)
+    lower_values = np.take_along_axis(values, lower[np.newaxis], axis=0)[0]
+    upper_values = np.take_along_axis(values, upper[np.newaxis], axis=0)[0]
+    result = lower_values + (upper_values - lower_values) * (position - lower)
+    return np.ma.masked_where(count == 0, result)
+
+
+def _compute_statistics_block(data, statistics):
+    """Compute several statistics along the first axis of a block of data.
+
+    Intermediate results (e.g. sums, squared anomalies, sorted values) are
+    shared between the statistics, so the data only needs to be traversed
+    once.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        (Masked) data with the different models along the first axis.
+    statistics: list of tuple
+        Pairs of statistic name (a value of :const:`FUSED_STATISTICS`) and
+        keyword arguments of the corresponding operator.
+
+    Returns
+    -------
+    np.ma.MaskedArray
+        The statistics stacked along the first axis.
+    """
+    data = np.ma.array(data, dtype=np.float64)
+    count = data.count(axis=0)
+    total = data.sum(axis=0)
+    mean = total / count
+    squared_anomalies = None
+    sorted_data = None
+
+    results = []
+    for name, kwargs in statistics:
+        if name == 'sum':
+            result = total
+        elif name == 'mean':
+            result = mean
+        elif name in ('std_dev', 'variance'):
+            if squared_anomalies is None:
+                squared_anomalies = ((data - mean)**2).sum(axis=0)
+            result = squared_anomalies / (count - 1)
+            if name == 'std_dev':
+                result = np.ma.sqrt(result)
+        elif name == 'min':
+            result = data.min(axis=0)
+        elif name == 'max':
+            result = data.max(axis=0)
+        else:
+            if sorted_data is None:
+                sorted_data = np.ma.sort(data, axis=0, endwith=True)
+            percent = kwargs.get('percent', 50.)
+            result = _percentile_from_sorted(sorted_data, count, percent)
+        results.append(np.ma.asarray(result))
+
+    return np.ma.stack(results).astype(np.float32)
+
+
+def _get_result_cube(combined_cube, data, operator, **kwargs):
+    """Create the cube of a statistic computed over the multi-model dimension.
+
+    The metadata is updated in the same way as done by
+    :meth:`iris.cube.Cube.collapsed`, but the (lazy) data is taken from
+    ``data``.
+    """
+    concat_coord = combined_cube.coord(CONCAT_DIM)
+    result_cube = combined_cube[0]
+    for coord in combined_cube.coords(dimensions=0):
+        result_cube.replace_coord(coord.collapsed())
+    result_cube.data = data
+    operator.update_metadata(result_cube, [concat_coord], **kwargs)
+    return operator.post_process(result_cube, data, [concat_coord], **kwargs)
+
+
+def _resolve_operators(statistics):
+    """Resolve the operators and find the statistics that can be fused."""
+    operators = {}
+    fused_statistics = []
+    for statistic in statistics:
+        operator, kwargs = _resolve_operator(statistic)
+        operators[statistic] = (operator, kwargs)
+        if operator in FUSED_STATISTICS:
+            fused_statistics.append((FUSED_STATISTICS[operator], kwargs))
+    return operators, fused_statistics
+
+
+def _compute_lazy(cubes: list, statistics: list, ignore_scalar_coords=False):
+    """Compute statistics lazily.
+
+    The data of all cubes is stacked along a new (multi-model) dimension
+    into a single Dask array that is chunked such that every chunk contains
+    all models. All statistics that support it are then computed from one
+    pass over each chunk, so the memory needed is determined by the chunk
+    size rather than by the number of models.
+    """
+    for cube in cubes:
+        cube.data = cube.lazy_data()
+    combined_cube = _combine(cubes, ignore_scalar_coords=ignore_scalar_coords)
+
+    data = combined_cube.lazy_data()
+    data = data.rechunk({0: -1, **{i: 'auto' for i in range(1, data.ndim)}})
+
+    operators, fused_statistics = _resolve_operators(statistics)
+    if fused_statistics:
+        fused_data = da.map_blocks(
+            _compute_statistics_block,
+            data,
+            statistics=fused_statistics,
+            chunks=((len(fused_statistics), ), *data.chunks[1:]),
+            dtype=np.float32,
+            meta=np.ma.array(np.empty((0, ) * data.ndim, dtype=np.float32)),
+        )
+
+    statistics_cubes = {}
+    idx = 0
+    for statistic in statistics:
+        logger.debug('Multicube statistics: computing: %s', statistic)
+        operator, kwargs = operators[statistic]
+        if operator in FUSED_STATISTICS:
+            result_cube = _get_result_cube(combined_cube, fused_data[idx],
+                                           operator, **kwargs)
+            idx += 1
+        else:
+            result_cube = _collapse(combined_cube, operator, **kwargs)
+            result_cube.data = result_cube.lazy_data().astype(np.float32)
+        result_cube.remove_coord(CONCAT_DIM)
+        _update_cell_methods(result_cube, len(cubes))
+        statistics_cubes[statistic] = result_cube
+
+    return statistics_cubes
+
+
+def _compute_eager(cubes: list, statistics: list, ignore_scalar_coords=False):
+    """Compute statistics one slice at a time.
+
+    Every slice is combined only once. All statistics that support it are
+    computed together from the combined slice, the remaining statistics are
+    computed with :meth:`iris.cube.Cube.collapsed`.
+    """
     _ = [cube.data for cube in cubes]  # make sure the cubes' data are realized
 
-    result_slices = []
+    operators, fused_statistics = _resolve_operators(statistics)
+
+    result_slices = {statistic: [] for statistic in statistics}
     for chunk in _compute_slices(cubes):
         if chunk is None:
             single_model_slices = cubes  # scalar cubes
@@ -502,56 +702,49 @@ def _compute_eager(cubes: list, *, operator: iris.analysis.Aggregator,
             single_model_slices,
             ignore_scalar_coords=ignore_scalar_coords,
         )
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                'ignore',
-                message=(
-                    "Collapsing a non-contiguous coordinate. "
-                    f"Metadata may not be fully descriptive for '{CONCAT_DIM}."
-                ),
-                category=UserWarning,
-                module='iris',
-            )
-            warnings.filterwarnings(
-                'ignore',
-                message=(
-                    f"Cannot check if coordinate is contiguous: Invalid "
-                    f"operation for '{CONCAT_DIM}'"
-                ),
-                category=UserWarning,
-                module='iris',
-            )
-            collapsed_slice = combined_slice.collapsed(CONCAT_DIM, operator,
-                                                       **kwargs)
 
-        # some iris aggregators modify dtype, see e.g.
-        # https://numpy.org/doc/stable/reference/generated/numpy.ma.average.html
-        collapsed_slice.data = collapsed_slice.data.astype(np.float32)
+        if fused_statistics:
+            fused_data = _compute_statistics_block(combined_slice.data,
+                                                   fused_statistics)
 
-        result_slices.append(collapsed_slice)
+        idx = 0
+        for statistic in statistics:
+            operator, kwargs = operators[statistic]
+            if operator in FUSED_STATISTICS:
+                collapsed_slice = _get_result_cube(combined_slice,
+                                                   fused_data[idx], operator,
+                                                   **kwargs)
+                idx += 1
+            else:
+                collapsed_slice = _collapse(combined_slice, operator,
+                                            **kwargs)
 
-    try:
-        result_cube = CubeList(result_slices).concatenate_cube()
-    except Exception as excinfo:
-        raise ValueError(
-            f"Multi-model statistics failed to concatenate results into a "
-            f"single array. This happened for operator {operator} "
-            f"with computed statistics {result_slices}. "
-            f"This can happen e.g. if the calculation results in inconsistent "
-            f"dtypes") from excinfo
-
-    result_cube.data = np.ma.array(result_cube.data)
-    result_cube.remove_coord(CONCAT_DIM)
-    if result_cube.cell_methods:
-        cell_method = result_cube.cell_methods[0]
-        result_cube.cell_methods = None
-        updated_method = iris.coords.CellMethod(
-            method=cell_method.method,
-            coords=cell_method.coord_names,
-            intervals=cell_method.intervals,
-            comments=f'input_cubes: {len(cubes)}')
-        result_cube.add_cell_method(updated_method)
-    return result_cube
+                # some iris aggregators modify dtype, see e.g.
+                # https://numpy.org/doc/stable/reference/generated/numpy.ma.average.html
+                collapsed_slice.data = collapsed_slice.data.astype(np.float32)
+
+            result_slices[statistic].append(collapsed_slice)
+
+    statistics_cubes = {}
+    for statistic in statistics:
+        logger.debug('Multicube statistics: computing: %s', statistic)
+        operator, _ = operators[statistic]
+        try:
+            result_cube = CubeList(result_slices[statistic]).concatenate_cube()
+        except Exception as excinfo:
+            raise ValueError(
+                f"Multi-model statistics failed to concatenate results into a "
+                f"single array. This happened for operator {operator} "
+                f"with computed statistics {result_slices[statistic]}. "
+                f"This can happen e.g. if the calculation results in "
+                f"inconsistent dtypes") from excinfo
+
+        result_cube.data = np.ma.array(result_cube.data)
+        result_cube.remove_coord(CONCAT_DIM)
+        _update_cell_methods(result_cube, len(cubes))
+        statistics_cubes[statistic] = result_cube
+
+    return statistics_cubes
 
 
 def _multicube_statistics(cubes, statistics, span, ignore_scalar_coords=False):
@@ -560,7 +753,9 @@ def _multicube_statistics(cubes, statistics, span, ignore_scalar_coords=False):
     Can be used e.g. for ensemble or multi-model statistics.
 
     Cubes are merged and subsequently collapsed along a new auxiliary
-    coordinate. Inconsistent attributes will be removed.
+    coordinate. Inconsistent attributes will be removed. If all input cubes
+    have lazy data, the statistics are computed lazily, otherwise the data is
+    realized.
     """
     if not cubes:
         raise ValueError(
@@ -585,18 +780,14 @@ def _multicube_statistics(cubes, statistics, span, ignore_scalar_coords=False):
         )
 
     # Calculate statistics
-    statistics_cubes = {}
-    for statistic in statistics:
-        logger.debug('Multicube statistics: computing: %s', statistic)
-        operator, kwargs = _resolve_operator(statistic)
-
-        result_cube = _compute_eager(aligned_cubes,
-                                     operator=operator,
-                                     ignore_scalar_coords=ignore_scalar_coords,
-                                     **kwargs)
-        statistics_cubes[statistic] = result_cube
+    if all(cube.has_lazy_data() for cube in cubes):
+        return _compute_lazy(aligned_cubes,
+                             statistics,
+                             ignore_scalar_coords=ignore_scalar_coords)
 
-    return statistics_cubes
+    return _compute_eager(aligned_cubes,
+                          statistics,
+                          ignore_scalar_coords=ignore_scalar_coords)
 
 
 def _multiproduct_statistics(products,
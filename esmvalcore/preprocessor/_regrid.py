@@ -20,6 +20,7 @@ from iris.util import broadcast_to_shape
 
 from ..cmor._fixes.shared import add_altitude_from_plev, add_plev_from_altitude
 from ..cmor.table import CMOR_TABLES
+from ._regrid_cache import LRUCache, get_grid_hash
 from ._regrid_esmpy import ESMF_REGRID_METHODS
 from ._regrid_esmpy import regrid as esmpy_regrid
 from ._supplementary_vars import add_ancillary_variable, add_cell_measure
@@ -49,6 +50,9 @@ _LON_RANGE = _LON_MAX - _LON_MIN
 # A cached stock of standard horizontal target grids.
 _CACHE: Dict[str, iris.cube.Cube] = {}
 
+# Cached regridders, keyed on scheme, source grid and target grid.
+_REGRIDDER_CACHE = LRUCache()
+
 # Supported point interpolation schemes.
 POINT_INTERPOLATION_SCHEMES = {
     'linear': Linear(extrapolation_mode='mask'),
@@ -578,6 +582,7 @@ def regrid(cube, target_grid, scheme, lat_offset=True, lon_offset=True):
         raise ValueError(f'Expecting a cube, got {target_grid}.')
 
     if isinstance(scheme, dict):
+        scheme_key = repr(sorted(scheme.items()))
         scheme = dict(scheme)  # do not overwrite original scheme
         try:
             object_ref = scheme.pop("reference")
@@ -602,10 +607,14 @@ def regrid(cube, target_grid, scheme, lat_offset=True, lon_offset=True):
             scheme['src_cube'] = cube
         if 'grid_cube' in scheme_args:
             scheme['grid_cube'] = target_grid
+        if 'src_cube' in scheme or 'grid_cube' in scheme:
+            # The scheme is specific to these cubes, do not cache it
+            scheme_key = None
 
         loaded_scheme = obj(**scheme)
     else:
-        loaded_scheme = HORIZONTAL_SCHEMES.get(scheme.lower())
+        scheme_key = scheme.lower()
+        loaded_scheme = HORIZONTAL_SCHEMES.get(scheme_key)
 
     if loaded_scheme is None:
         emsg = 'Unknown regridding scheme, got {!r}.'
@@ -637,12 +646,30 @@ def regrid(cube, target_grid, scheme, lat_offset=True, lon_offset=True):
         # Return regridded cube in cases in which the
         # scheme is a function f(src_cube, grid_cube) -> Cube
         cube = loaded_scheme
+    elif scheme_key is not None and hasattr(loaded_scheme, 'regridder'):
+        regridder = _get_regridder(cube, target_grid, loaded_scheme,
+                                   scheme_key)
+        cube = regridder(cube)
     else:
         cube = cube.regrid(target_grid, loaded_scheme)
 
     return cube
 
 
+def _get_regridder(src_cube, tgt_cube, scheme, scheme_key):
+    """Get a regridder from the cache or create a new one.
+
+    Iris regridders can be re-used for all cubes that are defined on the same
+    horizontal grid as the cube that was used to create them, so there is no
+    need to recompute e.g. the weights of area weighted regridding every time.
+    """
+    key = (scheme_key, get_grid_hash(src_cube), get_grid_hash(tgt_cube))
+    return _REGRIDDER_CACHE.get(
+        key,
+        lambda: scheme.regridder(src_cube, tgt_cube),
+    )
+
+
 def _horizontal_grid_is_close(cube1, cube2):
     """Check if two cubes have the same horizontal grid definition.
 
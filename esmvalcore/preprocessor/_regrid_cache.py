@@ -0,0 +1,147 @@
+"""Caching of regridders and regridding weights.
+
+Regridders (and the weights they contain) only depend on the source grid,
+the target grid, the regridding scheme and, for some schemes, the mask of
+the source data. Since the same grids are typically regridded many times in
+a single run, the regridders are cached using a key that is computed from the
+content of these inputs.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default maximum number of items that are kept in a cache.
+CACHE_SIZE = 64
+
+
+class LRUCache:
+    """Least recently used cache.
+
+    The cache can be used from multiple threads. Items with the same key are
+    only created once, while items with different keys can be created
+    concurrently.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of items kept in the cache. If more items are added,
+        the least recently used items are discarded.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        # Locks of the items that are being created
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up an item, the lock needs to be held by the caller."""
+        if key in self._items:
+            self._items.move_to_end(key)
+            return True, self._items[key]
+        return False, None
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get an item from the cache or create it if it is not available.
+
+        Parameters
+        ----------
+        key:
+            Key of the item.
+        factory:
+            Function without arguments that is used to create the item if it
+            is not in the cache.
+
+        Returns
+        -------
+        Any
+            The cached item.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # The item is created without holding the lock of the cache, so other
+        # items can be retrieved or created in the meantime.
+        with key_lock:
+            with self._lock:
+                found, value = self._lookup(key)
+            if found:
+                return value
+            try:
+                value = factory()
+            except BaseException:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+                raise
+            with self._lock:
+                self._items[key] = value
+                self._key_locks.pop(key, None)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove all items from the cache."""
+        with self._lock:
+            self._items.clear()
+
+
+def _update_with_array(hasher, array) -> None:
+    """Update a hash with the content of an array."""
+    array = np.ascontiguousarray(array)
+    hasher.update(f"{array.dtype}{array.shape}".encode())
+    hasher.update(array.tobytes())
+
+
+def get_array_hash(array) -> str:
+    """Compute a hash from the content of a (masked) array."""
+    hasher = hashlib.sha256()
+    _update_with_array(hasher, np.ma.getdata(array))
+    _update_with_array(hasher, np.ma.getmaskarray(array))
+    return hasher.hexdigest()
+
+
+def get_coords_hash(coords) -> str:
+    """Compute a hash from the content of coordinates.
+
+    The hash takes into account the full metadata (names, units, attributes,
+    coordinate system, circularity, etc.), points and bounds of the
+    coordinates, because iris regridders can only be re-used for cubes with
+    identical coordinates.
+    """
+    hasher = hashlib.sha256()
+    for coord in coords:
+        metadata = coord.metadata._asdict()
+        attributes = metadata.pop('attributes')
+        hasher.update(repr(sorted(metadata.items())).encode())
+        hasher.update(repr(sorted(attributes.items())).encode())
+        _update_with_array(hasher, coord.points)
+        if coord.has_bounds():
+            _update_with_array(hasher, coord.bounds)
+    return hasher.hexdigest()
+
+
+def get_grid_hash(cube) -> str:
+    """Compute a hash from the horizontal grid of a cube."""
+    coords = cube.coords(axis='x') + cube.coords(axis='y')
+    return get_coords_hash(coords)
@@ -9,10 +9,22 @@ except ImportError as exc:
         import ESMF as esmpy  # noqa: N811
     except ImportError:
         raise exc
+import functools
+import hashlib
+import logging
+import os
+from pathlib import Path
+
 import iris
 import numpy as np
+import scipy.sparse
+
+from esmvalcore.config import CFG
+
+from ._mapping import get_empty_data, map_blocks, ref_to_dims_index
+from ._regrid_cache import LRUCache, get_coords_hash
 
-from ._mapping import get_empty_data, map_slices, ref_to_dims_index
+logger = logging.getLogger(__name__)
 
 ESMF_MANAGER = esmpy.Manager(debug=False)
 
@@ -24,12 +36,6 @@ ESMF_REGRID_METHODS = {
     'nearest': esmpy.RegridMethod.NEAREST_STOD,
 }
 
-MASK_REGRIDDING_MASK_VALUE = {
-    esmpy.RegridMethod.BILINEAR: np.array([1]),
-    esmpy.RegridMethod.CONSERVE: np.array([1]),
-    esmpy.RegridMethod.NEAREST_STOD: np.array([]),
-}
-
 # ESMF_REGRID_METHODS = {
 #     'bilinear': esmpy.RegridMethod.BILINEAR,
 #     'patch': esmpy.RegridMethod.PATCH,
@@ -38,6 +44,10 @@ MASK_REGRIDDING_MASK_VALUE = {
 #     'nearest_dtos': esmpy.RegridMethod.NEAREST_DTOS,
 # }
 
+# Cached regridding weights, keyed on the source grid, the target grid and the
+# regridding method.
+_WEIGHTS_CACHE = LRUCache()
+
 
 def cf_2d_bounds_to_esmpy_corners(bounds, circular):
     """Convert cf style 2d bounds to normal (esmpy style) corners."""
@@ -151,94 +161,164 @@ def get_representant(cube, ref_to_slice):
     return cube[rep_ind]
 
 
-def regrid_mask_2d(src_data, regridding_arguments, mask_threshold):
-    """Regrid the mask from the source field to the destination grid."""
-    src_field = regridding_arguments['srcfield']
-    dst_field = regridding_arguments['dstfield']
-    regrid_method = regridding_arguments['regrid_method']
-    original_src_mask = np.ma.getmaskarray(src_data)
-    src_field.data[...] = ~original_src_mask.T
-    src_mask = src_field.grid.get_item(esmpy.GridItem.MASK,
-                                       esmpy.StaggerLoc.CENTER)
-    src_mask[...] = original_src_mask.T
-    center_mask = dst_field.grid.get_item(esmpy.GridItem.MASK,
-                                          esmpy.StaggerLoc.CENTER)
-    center_mask[...] = 0
-    mask_regridder = esmpy.Regrid(
-        src_mask_values=MASK_REGRIDDING_MASK_VALUE[regrid_method],
-        dst_mask_values=np.array([]),
-        **regridding_arguments)
-    regr_field = mask_regridder(src_field, dst_field)
-    dst_mask = regr_field.data[...].T < mask_threshold
-    center_mask[...] = dst_mask.T
-    if not dst_mask.any():
-        dst_mask = np.ma.nomask
-    return dst_mask
-
-
-def build_regridder_2d(src_rep, dst_rep, regrid_method, mask_threshold):
-    """Build regridder for 2d regridding."""
-    dst_field = cube_to_empty_field(dst_rep)
+def compute_regridding_weights(src_rep, dst_rep, regrid_method):
+    """Compute the weights for 2d regridding.
+
+    Returns
+    -------
+    :class:`scipy.sparse.csr_matrix`
+        The weights that map the flattened source data onto the flattened
+        target data.
+    """
     src_field = cube_to_empty_field(src_rep)
-    regridding_arguments = {
-        'srcfield': src_field,
-        'dstfield': dst_field,
-        'regrid_method': regrid_method,
-        'unmapped_action': esmpy.UnmappedAction.IGNORE,
-        'ignore_degenerate': True,
-    }
-    dst_mask = regrid_mask_2d(src_rep.data,
-                              regridding_arguments, mask_threshold)
-    field_regridder = esmpy.Regrid(src_mask_values=np.array([1]),
-                                   dst_mask_values=np.array([1]),
-                                   **regridding_arguments)
-
-    def regridder(src):
-        """Regrid 2d for irregular grids."""
-        res = get_empty_data(dst_rep.shape, src.dtype)
-        data = src.data
-        if np.ma.is_masked(data):
-            data = data.data
-        src_field.data[...] = data.T
-        regr_field = field_regridder(src_field, dst_field)
-        res.data[...] = regr_field.data[...].T
-        res.mask[...] = dst_mask
-        return res
-
-    return regridder
-
-
-def build_regridder_3d(src_rep, dst_rep, regrid_method, mask_threshold):
-    # The necessary refactoring will be done for the full 3d regridding.
-    """Build regridder for 2.5d regridding."""
-    esmf_regridders = []
-    no_levels = src_rep.shape[0]
-    for level in range(no_levels):
-        esmf_regridders.append(
-            build_regridder_2d(src_rep[level], dst_rep[level],
-                               regrid_method, mask_threshold)
+    dst_field = cube_to_empty_field(dst_rep)
+    field_regridder = esmpy.Regrid(
+        srcfield=src_field,
+        dstfield=dst_field,
+        regrid_method=regrid_method,
+        unmapped_action=esmpy.UnmappedAction.IGNORE,
+        ignore_degenerate=True,
+        factors=True,
+    )
+    # ESMF uses 1-based sequence indices into the Fortran-ordered
+    # (lon, lat) field data, which correspond to the indices into the
+    # C-ordered (lat, lon) cube data.
+    weights_dict = field_regridder.get_weights_dict(deep_copy=True)
+    field_regridder.destroy()
+    weights = scipy.sparse.csr_matrix(
+        (
+            weights_dict['weights'],
+            (weights_dict['row_dst'] - 1, weights_dict['col_src'] - 1),
+        ),
+        shape=(dst_field.data.size, src_field.data.size),
+    )
+    return weights
+
+
+def _get_weights_key(src_rep, dst_rep, regrid_method):
+    """Compute the cache key for regridding weights."""
+    horizontal_coords = ['latitude', 'longitude']
+    src_coords = [src_rep.coord(name) for name in horizontal_coords]
+    dst_coords = [dst_rep.coord(name) for name in horizontal_coords]
+    return (
+        str(regrid_method),
+        get_coords_hash(src_coords),
+        get_coords_hash(dst_coords),
+    )
+
+
+def _load_weights(path):
+    """Load regridding weights from a file."""
+    with np.load(path) as npz:
+        weights = scipy.sparse.csr_matrix(
+            (npz['data'], npz['indices'], npz['indptr']),
+            shape=tuple(npz['shape']),
         )
+    return weights
+
+
+def _save_weights(path, weights):
+    """Save regridding weights to a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first, so other processes never read a
+    # partially written file.
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp.npz')
+    np.savez(
+        tmp_path,
+        data=weights.data,
+        indices=weights.indices,
+        indptr=weights.indptr,
+        shape=np.array(weights.shape),
+    )
+    tmp_path.replace(path)
 
-    def regridder(src):
-        """Regrid 2.5d for irregular grids."""
-        res = get_empty_data(dst_rep.shape, src.dtype)
-        for i, esmf_regridder in enumerate(esmf_regridders):
-            res[i, ...] = esmf_regridder(src[i])
-        return res
 
-    return regridder
+def get_regridding_weights(src_rep, dst_rep, regrid_method):
+    """Get the (cached) weights for 2d regridding.
+
+    The weights are cached in memory. If the configuration option
+    ``regrid_weights_cache_dir`` is set, they are also stored in that
+    directory so they can be re-used in later runs.
+    """
+    key = _get_weights_key(src_rep, dst_rep, regrid_method)
+
+    def compute():
+        cache_dir = CFG.get('regrid_weights_cache_dir')
+        if cache_dir is None:
+            return compute_regridding_weights(src_rep, dst_rep, regrid_method)
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        path = Path(cache_dir) / f'{name}.npz'
+        if path.exists():
+            logger.debug("Loading regridding weights from %s", path)
+            return _load_weights(path)
+        weights = compute_regridding_weights(src_rep, dst_rep, regrid_method)
+        logger.debug("Saving regridding weights to %s", path)
+        _save_weights(path, weights)
+        return weights
+
+    return _WEIGHTS_CACHE.get(key, compute)
+
+
+def regrid_block(block, weights, mask_threshold, dst_shape):
+    """Regrid a block of data with the horizontal dimensions last.
+
+    The mask is regridded along with the data: target points that receive
+    less than a fraction ``mask_threshold`` of their weight from unmasked
+    source points are masked. The values at the other target points are
+    computed from the unmasked source points only.
+
+    Parameters
+    ----------
+    block: np.ndarray
+        (Masked) data with the two horizontal dimensions last.
+    weights: :class:`scipy.sparse.csr_matrix`
+        Weights that map the flattened source grid onto the flattened target
+        grid.
+    mask_threshold: float
+        Minimum fraction of the weights that needs to come from unmasked
+        source points for a target point to be unmasked.
+    dst_shape: tuple
+        Shape of the target grid.
+
+    Returns
+    -------
+    np.ma.MaskedArray
+        The regridded data.
+    """
+    leading_shape = block.shape[:-2]
+    src_data = block.reshape(-1, block.shape[-2] * block.shape[-1]).T
+    src_valid = ~np.ma.getmaskarray(src_data)
+    coverage = np.asarray(weights.sum(axis=1))
+    res = weights @ np.where(src_valid, np.ma.getdata(src_data), 0)
+    if src_valid.all():
+        valid_coverage = coverage
+    else:
+        valid_coverage = weights @ src_valid.astype(np.float64)
+    mask = np.broadcast_to(valid_coverage < mask_threshold, res.shape).copy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Normalize by the weights of the unmasked source points
+        res = np.where(mask, 0., res * (coverage / valid_coverage))
+    res = np.ma.masked_array(res, mask).T
+    return res.reshape(leading_shape + tuple(dst_shape)).astype(block.dtype)
 
 
 def build_regridder(src_rep, dst_rep, method, mask_threshold=.99):
-    """Build regridders from representants."""
+    """Build a regridder for blocks of data from representants.
+
+    The regridding weights only depend on the horizontal grids, so they are
+    shared between all vertical levels.
+    """
     regrid_method = ESMF_REGRID_METHODS[method]
-    if src_rep.ndim == 2:
-        regridder = build_regridder_2d(src_rep, dst_rep,
-                                       regrid_method, mask_threshold)
-    elif src_rep.ndim == 3:
-        regridder = build_regridder_3d(src_rep, dst_rep,
-                                       regrid_method, mask_threshold)
-    return regridder
+    if src_rep.ndim == 3:
+        src_rep = src_rep[0]
+        dst_rep = dst_rep[0]
+    weights = get_regridding_weights(src_rep, dst_rep, regrid_method)
+    return functools.partial(
+        regrid_block,
+        weights=weights,
+        mask_threshold=mask_threshold,
+        dst_shape=dst_rep.shape,
+    )
 
 
 def get_grid_representant(cube, horizontal_only=False):
@@ -324,7 +404,10 @@ def regrid(src, dst, method='linear'):
     """
     Regrid src_cube to the grid defined by dst_cube.
 
-    Regrid the data in src_cube onto the grid defined by dst_cube.
+    Regrid the data in src_cube onto the grid defined by dst_cube. The
+    regridding weights are computed once with ESMF and applied lazily as a
+    sparse matrix product to chunks of the data that contain the complete
+    horizontal grid, so the data is processed with constant memory use.
 
     Parameters
     ----------
@@ -350,5 +433,7 @@ def regrid(src, dst, method='linear'):
     """
     src_rep, dst_rep = get_grid_representants(src, dst)
     regridder = build_regridder(src_rep, dst_rep, method)
-    res = map_slices(src, regridder, src_rep, dst_rep)
+    res = map_blocks(src, regridder, src_rep, dst_rep)
+    if not src.has_lazy_data():
+        res.data = res.core_data().compute()
     return res
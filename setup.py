@@ -30,7 +30,7 @@ REQUIREMENTS = {
         'cartopy',
         # see https://github.com/SciTools/cf-units/issues/218
         'cf-units',
-        'dask[array]',
+        'dask[array,distributed]',
         'esgf-pyclient>=0.3.1',
         'esmf-regrid',
         # see github.com/ESMValGroup/ESMValCore/issues/1208
@@ -57,11 +57,16 @@ REQUIREMENTS = {
         'pyyaml',
         'requests',
         'scipy>=1.6',
-        'scitools-iris>=3.4.0',
+        'scitools-iris>=3.6.0',
         'shapely[vectorized]',
         'stratify',
         'yamale',
     ],
+    # Optional dependencies
+    # Use pip install .[zarr] to write preprocessor output to Zarr stores
+    'zarr': [
+        'zarr',
+    ],
     # Test dependencies
     'test': [
         'flake8',
@@ -231,14 +236,16 @@ setup(
     include_package_data=True,
     setup_requires=REQUIREMENTS['setup'],
     install_requires=REQUIREMENTS['install'],
-    tests_require=REQUIREMENTS['test'],
+    tests_require=REQUIREMENTS['test'] + REQUIREMENTS['zarr'],
     extras_require={
-        'develop':
-        REQUIREMENTS['develop'] + REQUIREMENTS['test'] + REQUIREMENTS['doc'],
+        'develop': (REQUIREMENTS['develop'] + REQUIREMENTS['test'] +
+                    REQUIREMENTS['zarr'] + REQUIREMENTS['doc']),
         'test':
-        REQUIREMENTS['test'],
+        REQUIREMENTS['test'] + REQUIREMENTS['zarr'],
         'doc':
         REQUIREMENTS['doc'],
+        'zarr':
+        REQUIREMENTS['zarr'],
     },
     entry_points={
         'console_scripts': [
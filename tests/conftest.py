@@ -0,0 +1,16 @@
+import pytest
+
+import esmvalcore.cmor.table
+from esmvalcore.config import CFG
+
+
+@pytest.fixture(autouse=True)
+def disable_cmor_tables_cache(monkeypatch):
+    """Do not store parsed CMOR tables in the user's cache."""
+    monkeypatch.setattr(esmvalcore.cmor.table, 'CMOR_TABLES_CACHE_DIR', None)
+
+
+@pytest.fixture(autouse=True)
+def disable_file_dates_cache(monkeypatch):
+    """Do not store the dates read from files in the user's cache."""
+    monkeypatch.setitem(CFG, 'file_dates_cache_dir', None)
@@ -1,7 +1,5 @@
 """Tests for the fixes of CESM2."""
-import os
 import sys
-import unittest.mock
 
 import iris
 import numpy as np
@@ -19,6 +17,7 @@ from esmvalcore.cmor._fixes.cmip6.cesm2 import (
     Tos,
 )
 from esmvalcore.cmor._fixes.common import SiconcFixScalarCoord
+from esmvalcore.cmor._fixes.overlay import FileOverlay
 from esmvalcore.cmor.fix import Fix
 from esmvalcore.cmor.table import get_var_info
 
@@ -64,10 +63,7 @@ AIR_PRESSURE_BOUNDS = np.array([[[[[0.0, 1.5],
 @pytest.mark.sequential
 @pytest.mark.skipif(sys.version_info < (3, 7, 6),
                     reason="requires python3.7.6 or newer")
-@unittest.mock.patch(
-    'esmvalcore.cmor._fixes.cmip6.cesm2.Fix.get_fixed_filepath',
-    autospec=True)
-def test_cl_fix_file(mock_get_filepath, tmp_path, test_data_path):
+def test_cl_fix_file(tmp_path, test_data_path):
     """Test ``fix_file`` for ``cl``."""
     nc_path = test_data_path / 'cesm2_cl.nc'
     cubes = iris.load(str(nc_path))
@@ -86,14 +82,13 @@ def test_cl_fix_file(mock_get_filepath, tmp_path, test_data_path):
     assert not raw_cube.coords('air_pressure')
 
     # Apply fix
-    mock_get_filepath.return_value = os.path.join(tmp_path,
-                                                  'fixed_cesm2_cl.nc')
     fix = Cl(None)
     fixed_file = fix.fix_file(nc_path, tmp_path)
-    mock_get_filepath.assert_called_once_with(
-        tmp_path, nc_path, add_unique_suffix=False
-    )
-    fixed_cubes = iris.load(fixed_file)
+    assert isinstance(fixed_file, FileOverlay)
+    assert fixed_file.filepath == nc_path
+    assert not list(tmp_path.iterdir())
+    with fixed_file.open() as dataset:
+        fixed_cubes = iris.load(dataset)
     assert len(fixed_cubes) == 2
     var_names = [cube.var_name for cube in fixed_cubes]
     assert 'cl' in var_names
@@ -1,7 +1,5 @@
 """Tests for the fixes of CESM2-WACCM."""
-import os
 import sys
-import unittest.mock
 
 import iris
 import numpy as np
@@ -20,6 +18,7 @@ from esmvalcore.cmor._fixes.cmip6.cesm2_waccm import (
     Tas,
 )
 from esmvalcore.cmor._fixes.common import SiconcFixScalarCoord
+from esmvalcore.cmor._fixes.overlay import FileOverlay
 from esmvalcore.cmor.fix import Fix
 
 
@@ -36,20 +35,16 @@ def test_cl_fix():
 
 @pytest.mark.skipif(sys.version_info < (3, 7, 6),
                     reason="requires python3.7.6 or newer")
-@unittest.mock.patch(
-    'esmvalcore.cmor._fixes.cmip6.cesm2.Fix.get_fixed_filepath',
-    autospec=True)
-def test_cl_fix_file(mock_get_filepath, tmp_path, test_data_path):
+def test_cl_fix_file(tmp_path, test_data_path):
     """Test ``fix_file`` for ``cl``."""
     nc_path = test_data_path / 'cesm2_waccm_cl.nc'
-    mock_get_filepath.return_value = os.path.join(tmp_path,
-                                                  'fixed_cesm2_waccm_cl.nc')
     fix = Cl(None)
     fixed_file = fix.fix_file(nc_path, tmp_path)
-    mock_get_filepath.assert_called_once_with(
-        tmp_path, nc_path, add_unique_suffix=False
-    )
-    fixed_cube = iris.load_cube(fixed_file)
+    assert isinstance(fixed_file, FileOverlay)
+    assert fixed_file.filepath == nc_path
+    assert not list(tmp_path.iterdir())
+    with fixed_file.open() as dataset:
+        fixed_cube = iris.load_cube(dataset)
     lev_coord = fixed_cube.coord(var_name='lev')
     a_coord = fixed_cube.coord(var_name='a')
     b_coord = fixed_cube.coord(var_name='b')
@@ -41,6 +41,7 @@ from esmvalcore.cmor._fixes.emac.emac import (
     Toz,
     Zg,
 )
+from esmvalcore.cmor._fixes.overlay import FileOverlay
 from esmvalcore.cmor.fix import Fix
 from esmvalcore.cmor.table import get_var_info
 from esmvalcore.config._config import get_extra_facets
@@ -800,9 +801,12 @@ def test_sample_data_ta_alevel(test_data_path, tmp_path):
 
     filepath = test_data_path / 'emac.nc'
     fixed_path = fix.fix_file(filepath, tmp_path)
-    assert fixed_path != filepath
+    assert isinstance(fixed_path, FileOverlay)
+    assert fixed_path.filepath == filepath
+    assert not list(tmp_path.iterdir())
 
-    cubes = iris.load(str(fixed_path))
+    with fixed_path.open() as dataset:
+        cubes = iris.load(dataset)
     assert cubes.extract(NameConstraint(var_name='hyam'))
     assert cubes.extract(NameConstraint(var_name='hybm'))
     assert cubes.extract(NameConstraint(var_name='hyai'))
@@ -2598,14 +2602,12 @@ def test_zg_fix(cubes_3d):
 # Test ``AllVars.fix_file``
 
 
-@mock.patch('esmvalcore.cmor._fixes.emac.emac.copyfile', autospec=True)
-def test_fix_file_no_alevel(mock_copyfile):
+def test_fix_file_no_alevel():
     """Test fix."""
     fix = get_allvars_fix('Amon', 'ta')
     new_path = fix.fix_file(mock.sentinel.filepath, mock.sentinel.output_dir)
 
     assert new_path == mock.sentinel.filepath
-    mock_copyfile.assert_not_called()
 
 
 # Test ``AllVars._fix_plev``
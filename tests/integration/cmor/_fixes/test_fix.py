@@ -1,6 +1,8 @@
 """Integration tests for fixes."""
 
+import importlib
 import os
+import unittest.mock
 from pathlib import Path
 
 import pytest
@@ -60,6 +62,27 @@ def test_get_fix_no_project():
         Fix.get_fixes('BAD_PROJECT', 'BNU-ESM', 'Amon', 'ch4')
 
 
+def test_get_fixes_cached(monkeypatch):
+    """Test that fixes are only looked up once per dataset and variable."""
+    Fix.get_fixes('CMIP5', 'CanESM2', 'Amon', 'fgco2')
+    import_module = unittest.mock.Mock(side_effect=AssertionError)
+    monkeypatch.setattr(importlib, 'import_module', import_module)
+
+    fixes = Fix.get_fixes('CMIP5', 'CanESM2', 'Amon', 'fgco2')
+
+    assert fixes == [FgCo2(None)]
+    import_module.assert_not_called()
+
+
+def test_get_fixes_dataset_without_fixes(monkeypatch):
+    """Test that no import is attempted for datasets without fixes."""
+    import_module = unittest.mock.Mock(side_effect=ImportError)
+    monkeypatch.setattr(importlib, 'import_module', import_module)
+
+    assert Fix.get_fixes('CMIP6', 'Not-A-Dataset', 'Amon', 'tas') == []
+    import_module.assert_not_called()
+
+
 def test_get_fix_no_model():
     assert Fix.get_fixes('CMIP5', 'BAD_MODEL', 'Amon', 'ch4') == []
 
@@ -1,11 +1,13 @@
+import shutil
 from pathlib import Path
 
 import pytest
 import yaml
 
+from esmvalcore.cmor import table as cmor_table
 from esmvalcore.cmor.table import CMOR_TABLES
 from esmvalcore.cmor.table import __file__ as root
-from esmvalcore.cmor.table import read_cmor_tables
+from esmvalcore.cmor.table import get_var_info, read_cmor_tables
 
 CUSTOM_CFG_DEVELOPER = {
     'custom': {'cmor_path': Path(root).parent / 'tables' / 'custom'},
@@ -72,3 +74,83 @@ def test_read_custom_cmor_tables(tmp_path, behaviour):
 
     # Restore default tables
     read_cmor_tables()
+
+
+def test_read_cmor_tables_from_cache(tmp_path, monkeypatch):
+    """Test that parsed CMOR tables are stored and re-used."""
+    monkeypatch.setattr(cmor_table, 'CMOR_TABLES_CACHE_DIR', tmp_path)
+    cfg_file = Path(root).parents[1] / 'config-developer.yml'
+    expected = get_var_info('CMIP6', 'Amon', 'tas')
+
+    cmor_table._read_cmor_tables.cache_clear()
+    cmor_table._read_cmor_tables(cfg_file, 0)
+    assert len(list(tmp_path.glob('*.pickle'))) == 1
+
+    cmor_table._read_cmor_tables.cache_clear()
+    monkeypatch.setattr(cmor_table, '_parse_cmor_tables', None)
+    cmor_tables = cmor_table._read_cmor_tables(cfg_file, 0)
+
+    tables = cmor_tables['CMIP6'].tables
+    assert isinstance(dict.__getitem__(tables, 'Amon'), bytes)
+    var_info = cmor_tables['CMIP6'].get_variable('Amon', 'tas')
+    assert isinstance(dict.__getitem__(tables, 'Amon'),
+                      cmor_table.TableInfo)
+    assert isinstance(dict.__getitem__(tables, 'Omon'), bytes)
+    assert var_info.short_name == expected.short_name
+    assert var_info.frequency == expected.frequency
+    assert list(var_info.coordinates) == list(expected.coordinates)
+    assert cmor_tables['CMIP6'].default is cmor_tables['custom']
+    cmor_table._read_cmor_tables.cache_clear()
+
+
+def test_read_cmor_tables_no_cache(tmp_path, monkeypatch):
+    """Test that parsed CMOR tables are not stored if the cache is off."""
+    monkeypatch.setattr(cmor_table, 'CMOR_TABLES_CACHE_DIR', None)
+    monkeypatch.setattr(cmor_table, '_load_cached_tables', None)
+    monkeypatch.setattr(cmor_table, '_save_cached_tables', None)
+    cfg_file = Path(root).parents[1] / 'config-developer.yml'
+
+    cmor_table._read_cmor_tables.cache_clear()
+    cmor_tables = cmor_table._read_cmor_tables(cfg_file, 0)
+    assert cmor_tables['CMIP6'].get_variable('Amon', 'tas') is not None
+    cmor_table._read_cmor_tables.cache_clear()
+
+
+@pytest.mark.parametrize('value,expected', [
+    (None, Path.home() / '.esmvaltool' / 'cache' / 'cmor-tables'),
+    ('', None),
+    ('~/cmor-tables', Path.home() / 'cmor-tables'),
+])
+def test_get_cmor_tables_cache_dir(monkeypatch, value, expected):
+    """Test that the cache directory can be set with an environment var."""
+    if value is None:
+        monkeypatch.delenv('ESMVALTOOL_CMOR_TABLES_CACHE_DIR', raising=False)
+    else:
+        monkeypatch.setenv('ESMVALTOOL_CMOR_TABLES_CACHE_DIR', value)
+    assert cmor_table._get_cmor_tables_cache_dir() == expected
+
+
+def test_read_cmor_tables_cache_invalidated(tmp_path, monkeypatch):
+    """Test that the cache is not used when a table file changes."""
+    monkeypatch.setattr(cmor_table, 'CMOR_TABLES_CACHE_DIR',
+                        tmp_path / 'cache')
+    custom_dir = tmp_path / 'custom'
+    shutil.copytree(Path(root).parent / 'tables' / 'custom', custom_dir)
+    cfg_developer = dict(CUSTOM_CFG_DEVELOPER)
+    cfg_developer['custom'] = {'cmor_path': str(custom_dir)}
+    cfg_file = tmp_path / 'config-developer.yml'
+    with cfg_file.open('w', encoding='utf-8') as file:
+        yaml.safe_dump(cfg_developer, file)
+
+    cmor_table._read_cmor_tables.cache_clear()
+    cmor_tables = cmor_table._read_cmor_tables(cfg_file, 0)
+    assert cmor_tables['custom'].get_variable('custom', 'newvar') is None
+
+    (custom_dir / 'CMOR_newvar.dat').write_text(
+        (custom_dir / 'CMOR_tasaga.dat').read_text().replace(
+            'tasaga', 'newvar'))
+    cmor_table._read_cmor_tables.cache_clear()
+    cmor_tables = cmor_table._read_cmor_tables(cfg_file, 0)
+    assert cmor_tables['custom'].get_variable('custom', 'newvar') is not None
+    assert len(list((tmp_path / 'cache').glob('*.pickle'))) == 2
+    cmor_table._read_cmor_tables.cache_clear()
@@ -65,6 +65,17 @@ def _get_filenames(root_path, filename, tracking_id):
     return filenames
 
 
+def _patch_glob(monkeypatch, glob):
+    """Replace the batched file search by a function of a single glob."""
+    def _glob(patterns, listings=None):
+        return {
+            Path(pattern): [Path(f) for f in glob(str(pattern))]
+            for pattern in patterns
+        }
+
+    monkeypatch.setattr(esmvalcore.local, '_glob', _glob)
+
+
 @pytest.fixture
 def patched_datafinder(tmp_path, monkeypatch):
     def tracking_ids(i=0):
@@ -77,7 +88,7 @@ def patched_datafinder(tmp_path, monkeypatch):
     def glob(file_glob):
         return _get_filenames(tmp_path, file_glob, tracking_id)
 
-    monkeypatch.setattr(esmvalcore.local, 'glob', glob)
+    _patch_glob(monkeypatch, glob)
 
 
 @pytest.fixture
@@ -101,4 +112,4 @@ def patched_failing_datafinder(tmp_path, monkeypatch):
             return []
         return _get_filenames(tmp_path, filename, tracking_id)
 
-    monkeypatch.setattr(esmvalcore.local, 'glob', glob)
+    _patch_glob(monkeypatch, glob)
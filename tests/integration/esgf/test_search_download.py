@@ -8,6 +8,13 @@ from pyesgf.search.results import FileResult
 
 from esmvalcore.esgf import _search, download, find_files
 
+
+@pytest.fixture(autouse=True)
+def search_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(_search, 'SEARCH_CACHE',
+                        tmp_path / 'cache' / 'esgf-search.sqlite')
+
+
 VARIABLES = [{
     'dataset': 'cccma_cgcm3_1',
     'ensemble': 'run1',
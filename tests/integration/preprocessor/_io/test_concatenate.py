@@ -4,6 +4,7 @@ import unittest
 import warnings
 from unittest.mock import call
 
+import dask.array as da
 import numpy as np
 import pytest
 from cf_units import Unit
@@ -357,6 +358,39 @@ class TestConcatenate(unittest.TestCase):
         np.testing.assert_array_equal(
             concatenated.coord('time').points, np.array([1., 7.]))
 
+    def test_concatenate_contained_cube(self):
+        """Test that a cube inside the time range of another is dropped."""
+        self._add_cube([33., 55.], [3., 4.])
+        concatenated = _io.concatenate(self.raw_cubes)
+        np.testing.assert_array_equal(
+            concatenated.coord('time').points, np.array([1, 2, 3, 4, 5, 6]))
+
+    def test_fail_concatenate_contained_cube_different_points(self):
+        """Test that a contained cube with other time points is not dropped."""
+        self._add_cube([33.], [3.5])
+        with self.assertRaises(ValueError):
+            _io.concatenate(self.raw_cubes)
+
+    def test_concatenate_many_with_overlaps(self):
+        """Test concatenation of many lazy cubes with some overlaps."""
+        raw_cubes = []
+        for start in range(0, 300, 3):
+            # Every tenth cube overlaps with the next one
+            end = start + (4 if start % 30 == 0 else 3)
+            points = np.arange(start, end, dtype=float)
+            raw_cubes.append(
+                Cube(da.from_array(points + 0.5, chunks=1),
+                     var_name='sample',
+                     dim_coords_and_dims=((self._model_coord.copy(points),
+                                           0), )))
+        raw_cubes.reverse()
+        concatenated = _io.concatenate(raw_cubes)
+        assert concatenated.has_lazy_data()
+        np.testing.assert_array_equal(
+            concatenated.coord('time').points, np.arange(300.))
+        np.testing.assert_array_equal(concatenated.data,
+                                      np.arange(300.) + 0.5)
+
     def test_concatenate_with_iris_exception(self):
         """Test a more generic case."""
         time_coord_1 = DimCoord([1.5, 5., 7.],
@@ -4,12 +4,15 @@ import os
 import tempfile
 import unittest
 import warnings
+from pathlib import Path
 
 import iris
 import numpy as np
 from iris.coords import DimCoord
 from iris.cube import Cube, CubeList
 
+import esmvalcore.preprocessor._io
+from esmvalcore.cmor._fixes.overlay import FileOverlay
 from esmvalcore.preprocessor._io import concatenate_callback, load
 
 
@@ -19,12 +22,33 @@ def _create_sample_cube():
     return cube
 
 
+def _create_sample_time_cube(start, tracking_id):
+    time = DimCoord(
+        np.arange(start, start + 3, dtype=np.float64) + 0.5,
+        bounds=[[t, t + 1] for t in range(start, start + 3)],
+        standard_name='time',
+        var_name='time',
+        units='days since 2000-01-01',
+    )
+    lat = DimCoord([1., 2.], standard_name='latitude', var_name='lat',
+                   units='degrees_north')
+    cube = Cube(
+        np.ma.masked_greater(np.arange(6.).reshape(3, 2) + start, start + 4),
+        var_name='sample',
+        units='K',
+        dim_coords_and_dims=((time, 0), (lat, 1)),
+        attributes={'tracking_id': tracking_id},
+    )
+    return cube
+
+
 class TestLoad(unittest.TestCase):
     """Tests for :func:`esmvalcore.preprocessor.load`."""
 
     def setUp(self):
         """Start tests."""
         self.temp_files = []
+        esmvalcore.preprocessor._io._TEMPLATES.clear()
 
     def tearDown(self):
         """Finish tests."""
@@ -102,6 +126,135 @@ class TestLoad(unittest.TestCase):
                                                                     2])).all())
         self.assertEqual(cube.coord('latitude').units, 'degrees_north')
 
+    def test_reuse_metadata(self):
+        """Test loading a file with the same structure from a template."""
+        first_file = self._save_cube(_create_sample_time_cube(0, 'a'))
+        second_file = self._save_cube(_create_sample_time_cube(3, 'b'))
+        load(first_file, callback='default', reuse_metadata=True)
+
+        with unittest.mock.patch('iris.load_raw',
+                                 wraps=iris.load_raw) as load_raw:
+            cubes = load(second_file, callback='default', reuse_metadata=True)
+            load_raw.assert_not_called()
+
+        expected = load(second_file, callback='default')
+        self.assertEqual(1, len(cubes))
+        self.assertTrue(cubes[0].has_lazy_data())
+        self.assertEqual(second_file, cubes[0].attributes['source_file'])
+        self.assertEqual(expected[0].attributes, cubes[0].attributes)
+        self.assertEqual(expected[0].var_name, cubes[0].var_name)
+        self.assertEqual(expected[0].units, cubes[0].units)
+        self.assertEqual(expected[0].coords(), cubes[0].coords())
+        self.assertEqual(expected[0].dtype, cubes[0].dtype)
+        np.testing.assert_array_equal(cubes[0].data, expected[0].data)
+        np.testing.assert_array_equal(cubes[0].data.mask,
+                                      expected[0].data.mask)
+
+    def test_reuse_metadata_different_structure(self):
+        """Test that a file with a different structure is fully loaded."""
+        first_file = self._save_cube(_create_sample_time_cube(0, 'a'))
+        cube = _create_sample_time_cube(3, 'b')
+        cube.coord('latitude').points = [3., 4.]
+        second_file = self._save_cube(cube)
+        load(first_file, callback='default', reuse_metadata=True)
+
+        with unittest.mock.patch('iris.load_raw',
+                                 wraps=iris.load_raw) as load_raw:
+            cubes = load(second_file, callback='default', reuse_metadata=True)
+            load_raw.assert_called_once()
+
+        np.testing.assert_array_equal(cubes[0].coord('latitude').points,
+                                      [3., 4.])
+
+    def test_load_overlay(self):
+        """Test loading a file with the changes described by an overlay."""
+        cube = _create_sample_time_cube(0, 'a')
+        cube.attributes['comment'] = 'original'
+        temp_file = self._save_cube(cube)
+
+        overlay = FileOverlay(temp_file)
+        overlay.set_attribute('long_name', 'Sample', variable='sample')
+        overlay.delete_attribute('comment')
+        overlay.rename_attribute('tracking_id', 'source_id')
+        overlay.set_data('lat', np.array([3., 4.]))
+        overlay.drop_variable('time_bnds')
+        overlay.delete_attribute('bounds', variable='time')
+        cubes = load(overlay)
+
+        self.assertEqual(1, len(cubes))
+        cube = cubes[0]
+        self.assertEqual(temp_file, cube.attributes['source_file'])
+        self.assertEqual('Sample', cube.long_name)
+        self.assertNotIn('comment', cube.attributes)
+        self.assertNotIn('tracking_id', cube.attributes)
+        self.assertEqual('a', cube.attributes['source_id'])
+        self.assertFalse(cube.coord('time').has_bounds())
+        np.testing.assert_array_equal(cube.coord('latitude').points,
+                                      [3., 4.])
+        np.testing.assert_array_equal(cube.data,
+                                      _create_sample_time_cube(0, 'a').data)
+
+        # The original file is not modified
+        cube = load(temp_file)[0]
+        self.assertEqual('original', cube.attributes['comment'])
+        self.assertIsNone(cube.long_name)
+        np.testing.assert_array_equal(cube.coord('latitude').points,
+                                      [1., 2.])
+
+    def test_write_overlay(self):
+        """Test writing a copy of a file with an overlay applied."""
+        cube = _create_sample_time_cube(0, 'a')
+        cube.attributes['comment'] = 'original'
+        temp_file = self._save_cube(cube)
+
+        overlay = FileOverlay(temp_file)
+        overlay.set_attribute('long_name', 'Sample', variable='sample')
+        overlay.delete_attribute('comment')
+        overlay.set_data('lat', np.array([3., 4.]))
+        overlay.rename_variable('sample', 'renamed')
+        overlay.drop_variable('time_bnds')
+        overlay.delete_attribute('bounds', variable='time')
+        descriptor, fixed_file = tempfile.mkstemp('.nc')
+        os.close(descriptor)
+        self.temp_files.append(fixed_file)
+        self.assertEqual(Path(fixed_file), overlay.write(fixed_file))
+
+        cube = load(fixed_file)[0]
+        expected = load(overlay)[0]
+        self.assertEqual('renamed', cube.var_name)
+        self.assertEqual('Sample', cube.long_name)
+        self.assertNotIn('comment', cube.attributes)
+        self.assertFalse(cube.coord('time').has_bounds())
+        self.assertEqual(expected.coords(), cube.coords())
+        np.testing.assert_array_equal(cube.coord('latitude').points,
+                                      [3., 4.])
+        np.testing.assert_array_equal(cube.data, expected.data)
+        np.testing.assert_array_equal(cube.data.mask, expected.data.mask)
+
+    def test_load_overlay_rename_variable(self):
+        """Test that renamed variables are read lazily from the file."""
+        lat = DimCoord(np.arange(1000.), var_name='lat',
+                       standard_name='latitude', units='degrees_north')
+        cube = Cube(np.arange(2000.).reshape(2, 1000), var_name='sample',
+                    dim_coords_and_dims=((lat, 1), ))
+        temp_file = self._save_cube(cube)
+
+        overlay = FileOverlay(temp_file)
+        overlay.rename_variable('sample', 'renamed')
+        overlay.rename_variable('lat', 'latitude')
+        overlay.set_attribute('coordinates', 'latitude', variable='renamed')
+        cubes = load(overlay)
+
+        self.assertEqual(1, len(cubes))
+        cube = cubes[0]
+        self.assertEqual('renamed', cube.var_name)
+        self.assertEqual('latitude', cube.coord('latitude').var_name)
+        self.assertTrue(cube.has_lazy_data())
+        np.testing.assert_array_equal(cube.data,
+                                      np.arange(2000.).reshape(2, 1000))
+        np.testing.assert_array_equal(cube.coord('latitude').points,
+                                      np.arange(1000.))
+
     @unittest.mock.patch('iris.load_raw', autospec=True)
     def test_fail_empty_cubes(self, mock_load_raw):
         """Test that ValueError is raised when cubes are empty."""
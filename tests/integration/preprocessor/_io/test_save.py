@@ -1,4 +1,5 @@
 """Integration tests for :func:`esmvalcore.preprocessor.save`"""
+import dask
 import iris
 import netCDF4
 import numpy as np
@@ -89,6 +90,33 @@ def test_save_zlib(cube, filename):
     assert sample_filters['complevel'] == 4
 
 
+def test_save_compression_options(cube, filename):
+    """Test save with compression level, shuffle and quantization."""
+    path = save([cube],
+                filename,
+                compress=True,
+                compression_level=9,
+                shuffle=False,
+                least_significant_digit=2)
+    loaded_cube = iris.load_cube(path)
+    np.testing.assert_allclose(cube.data, loaded_cube.data, atol=0.01)
+    with netCDF4.Dataset(path, 'r') as handler:
+        sample_filters = handler.variables['sample'].filters()
+    assert sample_filters['zlib'] is True
+    assert sample_filters['shuffle'] is False
+    assert sample_filters['complevel'] == 9
+
+
+def test_save_delayed(cube, filename):
+    """Test save without computing the data."""
+    cube.data = cube.lazy_data()
+    delayed = save([cube], filename, compute=False)
+    assert dask.is_dask_collection(delayed)
+    dask.compute(delayed)
+    loaded_cube = iris.load_cube(filename)
+    _compare_cubes(cube, loaded_cube)
+
+
 def test_fail_empty_cubes(filename):
     """Test save fails if empty cubes is provided."""
     empty_cubes = CubeList([])
@@ -133,3 +161,63 @@ def test_save_optimized_lon_time(cube, filename):
     loaded_cube = iris.load_cube(path)
     _compare_cubes(cube, loaded_cube)
     _check_chunks(path, [1, 2, 2])
+
+
+def test_save_dask_chunks(cube, filename):
+    """Test save with chunks from the lazy data."""
+    cube.data = cube.lazy_data().rechunk((1, 2, 2))
+    path = save([cube], filename, chunks='dask')
+    loaded_cube = iris.load_cube(path)
+    _compare_cubes(cube, loaded_cube)
+    _check_chunks(path, [1, 2, 2])
+
+
+def test_save_chunk_size(cube, filename):
+    """Test save with chunks of a target size."""
+    cube.data = cube.lazy_data().rechunk((1, 1, 2))
+    path = save([cube], filename, chunks=32 / 2**20)
+    loaded_cube = iris.load_cube(path)
+    _compare_cubes(cube, loaded_cube)
+    _check_chunks(path, [1, 1, 2])
+
+
+def test_fail_optimized_and_chunks(cube, filename):
+    """Test save fails if both optimize_access and chunks are provided."""
+    with pytest.raises(ValueError):
+        save([cube], filename, optimize_access='map', chunks='dask')
+
+
+def test_save_zarr(cube, tmp_path):
+    """Test saving to a Zarr store."""
+    zarr = pytest.importorskip('zarr')
+    filename = tmp_path / 'test.zarr'
+    cube.data = cube.lazy_data().rechunk((1, 2, 2))
+    cube.attributes['comment'] = 'test'
+    delayed = save([cube], filename, compute=False)
+    dask.compute(delayed)
+
+    group = zarr.open_group(str(filename), mode='r')
+    assert group.attrs['comment'] == 'test'
+    np.testing.assert_equal(group['sample'][...], cube.data)
+    assert group['sample'].chunks == (1, 2, 2)
+    assert group['sample'].attrs['_ARRAY_DIMENSIONS'] == [
+        'latitude', 'longitude', 'time']
+    np.testing.assert_equal(group['time'][...], cube.coord('time').points)
+    assert group['time'].attrs['units'] == 'days since 2000-1-1'
+    # Version 2 of the Zarr format is used, so xarray can read the store
+    assert (filename / '.zgroup').exists()
+    assert (filename / 'sample' / '.zarray').exists()
+
+
+def test_save_zarr_open_with_xarray(cube, tmp_path):
+    """Test that a saved Zarr store can be opened with xarray."""
+    pytest.importorskip('zarr')
+    xarray = pytest.importorskip('xarray')
+    filename = tmp_path / 'test.zarr'
+    save([cube], filename)
+
+    dataset = xarray.open_zarr(filename)
+    assert dataset['sample'].dims == ('latitude', 'longitude', 'time')
+    np.testing.assert_equal(dataset['sample'].values, cube.data)
+    np.testing.assert_equal(dataset['latitude'].values,
+                            cube.coord('latitude').points)
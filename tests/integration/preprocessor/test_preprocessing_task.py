@@ -1,8 +1,13 @@
 """Tests for `esmvalcore.preprocessor.PreprocessingTask`."""
+import unittest.mock
+
 import iris
 import iris.cube
+import numpy as np
 from prov.model import ProvDocument
 
+import esmvalcore.preprocessor
+
 from esmvalcore.dataset import Dataset
 from esmvalcore.preprocessor import PreprocessingTask, PreprocessorFile
 
@@ -40,3 +45,127 @@ def test_load_save_task(tmp_path):
 
     result.attributes.clear()
     assert result == cube
+
+
+def test_estimate_memory(tmp_path):
+    """Test that the memory estimate is the total size of the input files."""
+    in_file = tmp_path / 'tas_in.nc'
+    in_file.write_bytes(b'0' * 100)
+    esgf_file = unittest.mock.Mock(size=50)
+    dataset = Dataset(short_name='tas')
+    dataset.files = [in_file, esgf_file]
+
+    task = PreprocessingTask([
+        PreprocessorFile(
+            filename=tmp_path / f'tas_out{i}.nc',
+            settings={},
+            datasets=[dataset],
+        ) for i in range(2)
+    ])
+
+    assert task.estimate_memory() == 150
+
+
+def test_spill_products(tmp_path):
+    """Test that realized data exceeding the memory budget is spilled."""
+    products = []
+    for i, size in enumerate([10, 1000, 100]):
+        product = PreprocessorFile(
+            filename=tmp_path / 'preproc' / f'tas_out{i}.nc',
+            settings={},
+            datasets=[],
+        )
+        product.cubes = [
+            iris.cube.Cube(np.arange(size, dtype=np.float64), var_name='tas'),
+        ]
+        products.append(product)
+
+    task = PreprocessingTask(products, memory_budget=1500 / 2**30)
+    task._spill_products()
+
+    assert not products[0].cubes[0].has_lazy_data()
+    assert products[1].cubes[0].has_lazy_data()
+    assert not products[2].cubes[0].has_lazy_data()
+    np.testing.assert_array_equal(products[1].cubes[0].data, np.arange(1000))
+    assert products[1].cubes[0].var_name == 'tas'
+    assert task._spill_dir.parent == tmp_path / 'preproc'
+
+
+def test_spill_product_twice(tmp_path):
+    """Test that spilling a product again keeps the previously spilled data."""
+    product = PreprocessorFile(
+        filename=tmp_path / 'preproc' / 'tas_out.nc',
+        settings={},
+        datasets=[],
+    )
+    product.cubes = [iris.cube.Cube(np.arange(1000.), var_name='tas')]
+    task = PreprocessingTask([product], memory_budget=1 / 2**30)
+    task._spill_products()
+
+    # A multi-model product computed lazily from the spilled data
+    cube = product.cubes[0]
+    multimodel_product = PreprocessorFile(
+        filename=tmp_path / 'preproc' / 'MultiModelMean_tas.nc',
+        settings={},
+        datasets=[],
+    )
+    multimodel_product.cubes = [cube.copy(cube.core_data() * 2)]
+
+    product.cubes = [iris.cube.Cube(np.ones(1000), var_name='tas')]
+    task._spill_products()
+
+    assert product.cubes[0].has_lazy_data()
+    np.testing.assert_array_equal(product.cubes[0].data, np.ones(1000))
+    np.testing.assert_array_equal(multimodel_product.cubes[0].data,
+                                  2 * np.arange(1000.))
+    assert len(list(task._spill_dir.glob('tas_out_0_*.nc'))) == 2
+
+
+def test_spill_products_within_budget(tmp_path):
+    """Test that data is kept in memory if it fits in the memory budget."""
+    product = PreprocessorFile(
+        filename=tmp_path / 'tas_out.nc',
+        settings={},
+        datasets=[],
+    )
+    product.cubes = [iris.cube.Cube(np.zeros(10), var_name='tas')]
+
+    task = PreprocessingTask([product], memory_budget=1.)
+    task._spill_products()
+
+    assert not product.cubes[0].has_lazy_data()
+    assert task._spill_dir is None
+
+
+def test_run_removes_spilled_data(tmp_path, monkeypatch):
+    """Test that spilled data is removed after the task has run."""
+    cube = iris.cube.Cube(np.arange(10.), var_name='tas', units='K')
+    dataset = Dataset(short_name='tas')
+    dataset.files = []
+    dataset._load_with_callback = lambda _: cube.copy()
+    product = PreprocessorFile(
+        filename=tmp_path / 'preproc' / 'tas_out.nc',
+        settings={
+            'convert_units': {'units': 'degC'},
+            'multi_model_statistics': {},
+        },
+        datasets=[dataset],
+    )
+    task = PreprocessingTask([product], memory_budget=1 / 2**30)
+    monkeypatch.setattr(task, '_initialize_product_provenance',
+                        lambda: None)
+    monkeypatch.setattr(product, 'save_provenance', lambda: None)
+    monkeypatch.setattr(
+        esmvalcore.preprocessor,
+        '_apply_multimodel',
+        lambda products, *_: products,
+    )
+    spill = unittest.mock.Mock(wraps=product.spill)
+    monkeypatch.setattr(product, 'spill', spill)
+
+    task._run([])
+
+    spill.assert_called_once()
+    assert not list((tmp_path / 'preproc').glob('.spill_*'))
+    result = iris.load_cube(str(product.filename))
+    np.testing.assert_allclose(result.data, np.arange(10.) - 273.15)
@@ -1,5 +1,7 @@
 import os
 import re
+import subprocess
+import sys
 from collections import defaultdict
 from pathlib import Path
 from pprint import pformat
@@ -112,6 +114,7 @@ def _get_default_settings_for_chl(save_filename):
         'remove_supplementary_variables': {},
         'save': {
             'compress': False,
+            'compute': False,
             'filename': save_filename,
         }
     }
@@ -563,6 +566,7 @@ def test_default_fx_preprocessor(tmp_path, patched_datafinder, session):
         'remove_supplementary_variables': {},
         'save': {
             'compress': False,
+            'compute': False,
             'filename': product.filename,
         }
     }
@@ -1685,6 +1689,46 @@ def test_multi_model_statistics(tmp_path, patched_datafinder, session):
     assert next(iter(products)).provenance is not None
 
 
+def test_preprocessor_output_format_zarr(tmp_path, patched_datafinder,
+                                         session):
+    session['preprocessor_output_format'] = 'zarr'
+    content = dedent("""
+        preprocessors:
+          default:
+            multi_model_statistics:
+              span: overlap
+              statistics: [mean]
+
+        diagnostics:
+          diagnostic_name:
+            variables:
+              pr:
+                project: CMIP5
+                mip: Amon
+                exp: historical
+                start_year: 2000
+                end_year: 2002
+                ensemble: r1i1p1
+                preprocessor: default
+                additional_datasets:
+                  - {dataset: CanESM2}
+                  - {dataset: CCSM4}
+            scripts: null
+    """)
+
+    recipe = get_recipe(tmp_path, content, session)
+    task = next(iter(recipe.tasks))
+
+    assert len(task.products) == 2
+    for product in task.products:
+        assert Path(product.filename).suffix == '.zarr'
+        output_products = product.settings['multi_model_statistics'][
+            'output_products']
+        for statistic_products in output_products.values():
+            for statistic_product in statistic_products.values():
+                assert Path(statistic_product.filename).suffix == '.zarr'
+
+
 def test_multi_model_statistics_exclude(tmp_path, patched_datafinder, session):
     statistics = ['mean', 'max']
     diagnostic = 'diagnostic_name'
@@ -2066,6 +2110,32 @@ def test_landmask(tmp_path, patched_datafinder, session):
             assert len(dataset.supplementaries) == 2
 
 
+def test_supplementaries_in_new_interpreter():
+    """Test that supplementary variables are added in a new interpreter.
+
+    The supplementary variables of the preprocessor functions are registered
+    when the modules implementing them are imported, which is done lazily, so
+    these tests need to run without other tests importing them first.
+    """
+    tests = [
+        f'{__file__}::{name}' for name in (
+            'test_landmask',
+            'test_user_defined_fxvar',
+            'test_weighting_landsea_fraction',
+        )
+    ]
+    result = subprocess.run(
+        [
+            sys.executable, '-m', 'pytest', '-o', 'addopts=', '-p',
+            'no:cacheprovider', '-q', *tests
+        ],
+        capture_output=True,
+        cwd=Path(__file__).parents[3],
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout
+
+
 def test_empty_fxvar_none(tmp_path, patched_datafinder, session):
     """Test that no fx variables are added if explicitly specified."""
     content = dedent("""
@@ -3143,11 +3213,59 @@ def test_recipe_run(tmp_path, patched_datafinder, session, mocker):
     esmvalcore._recipe.recipe.esgf.download.assert_called_once_with(
         set(), session['download_dir'])
     recipe.tasks.run.assert_called_once_with(
-        max_parallel_tasks=session['max_parallel_tasks'])
+        max_parallel_tasks=session['max_parallel_tasks'],
+        task_scheduler=session['task_scheduler'],
+        dask_cluster=session['dask_cluster'],
+        memory_budget=session['task_memory_budget'],
+        is_available=None,
+        on_start=None,
+    )
     recipe.write_filled_recipe.assert_called_once()
     recipe.write_html_summary.assert_called_once()
 
 
+def test_recipe_run_while_downloading(tmp_path, patched_datafinder, session,
+                                      mocker):
+    content = dedent("""
+        diagnostics:
+          diagnostic_name:
+            variables:
+              areacella:
+                project: CMIP5
+                mip: fx
+                exp: historical
+                ensemble: r1i1p1
+                additional_datasets:
+                  - {dataset: BNU-ESM}
+            scripts: null
+        """)
+    session['download_dir'] = tmp_path / 'download_dir'
+    session['search_esgf'] = 'when_missing'
+    session['run_while_downloading'] = True
+
+    mocker.patch.object(esmvalcore._recipe.recipe.esgf,
+                        'download',
+                        create_autospec=True)
+
+    recipe = get_recipe(tmp_path, content, session)
+
+    def run_tasks(**kwargs):
+        # The download is only started by the task runner
+        esmvalcore._recipe.recipe.esgf.download.assert_not_called()
+        kwargs['on_start']()
+
+    recipe.tasks.run = mocker.Mock(side_effect=run_tasks)
+    recipe.write_filled_recipe = mocker.Mock()
+    recipe.write_html_summary = mocker.Mock()
+    recipe.run()
+
+    esmvalcore._recipe.recipe.esgf.download.assert_called_once_with(
+        [], session['download_dir'], ordered=True)
+    is_available = recipe.tasks.run.call_args.kwargs['is_available']
+    task = next(iter(recipe.tasks.flatten()))
+    assert is_available(task)
+
+
 def test_representative_dataset_regular_var(patched_datafinder, session):
     """Test ``_representative_dataset`` with regular variable."""
     variable = {
@@ -0,0 +1,80 @@
+"""Tests that keep the command line interface fast to start.
+
+Importing iris, dask, and the packages used by the preprocessor functions
+takes several seconds, so these should only be imported when needed.
+"""
+import subprocess
+import sys
+import time
+
+import pytest
+
+HEAVY_PACKAGES = (
+    'cartopy',
+    'dask',
+    'esmpy',
+    'fiona',
+    'iris',
+    'scipy',
+    'shapely',
+    'stratify',
+)
+
+
+def import_module(module):
+    """Import a module in a new interpreter.
+
+    Returns
+    -------
+    tuple[set[str], float]
+        The modules that were imported and the time needed in seconds.
+    """
+    code = (f"import sys, time; start = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - start); "
+            f"print(*sys.modules, sep='\\n')")
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    duration, *modules = result.stdout.split()
+    return set(modules), float(duration)
+
+
+@pytest.mark.parametrize('module', [
+    'esmvalcore._main',
+    'esmvalcore.config',
+    'esmvalcore.config._diagnostics',
+    'esmvalcore.config._logging',
+])
+def test_cli_imports_are_light(module):
+    """Test that commands like `esmvaltool config` do not import iris."""
+    start = time.perf_counter()
+    modules, duration = import_module(module)
+    print(f"Importing {module} took {duration:.2f} s "
+          f"({time.perf_counter() - start:.2f} s including startup)")
+    assert not modules & set(HEAVY_PACKAGES)
+
+
+def test_preprocessor_functions_are_imported_lazily():
+    """Test that importing the preprocessor does not import all functions."""
+    modules, duration = import_module('esmvalcore.preprocessor')
+    print(f"Importing esmvalcore.preprocessor took {duration:.2f} s")
+    submodules = {
+        m
+        for m in modules if m.startswith('esmvalcore.preprocessor._')
+    }
+    assert submodules == {'esmvalcore.preprocessor._io'}
+    assert 'stratify' not in modules
+
+
+def test_preprocessor_function_is_imported_on_access():
+    """Test that preprocessor functions can be used as before."""
+    import esmvalcore.preprocessor
+    from esmvalcore.preprocessor import _time
+
+    assert esmvalcore.preprocessor.extract_season is _time.extract_season
+    assert 'extract_season' in dir(esmvalcore.preprocessor)
+    with pytest.raises(AttributeError):
+        getattr(esmvalcore.preprocessor, 'not_a_function')
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
+from esmvalcore._local_index import LocalIndex
 from esmvalcore.config import CFG
 from esmvalcore.local import LocalFile, _get_output_file, find_files
 
@@ -71,8 +72,9 @@ def root(tmp_path):
     tree(dirname)
 
 
+@pytest.mark.parametrize('use_index', [False, True])
 @pytest.mark.parametrize('cfg', CONFIG['get_input_filelist'])
-def test_find_files(monkeypatch, root, cfg):
+def test_find_files(monkeypatch, root, cfg, use_index):
     """Test retrieving input filelist."""
     print(f"Testing DRS {cfg['drs']} with variable:\n",
           pprint.pformat(cfg['variable']))
@@ -81,6 +83,10 @@ def test_find_files(monkeypatch, root, cfg):
     monkeypatch.setitem(CFG, 'rootpath', {project: root})
     create_tree(root, cfg.get('available_files'),
                 cfg.get('available_symlinks'))
+    if use_index:
+        index_file = Path(root).parent / 'index.sqlite'
+        LocalIndex(index_file).update([root])
+        monkeypatch.setitem(CFG, 'local_file_index', index_file)
 
     # Find files
     input_filelist, globs = find_files(debug=True, **cfg['variable'])
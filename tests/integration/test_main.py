@@ -15,7 +15,8 @@ import pytest
 import yaml
 from fire.core import FireExit
 
-from esmvalcore._main import Config, ESMValTool, Recipes, run
+from esmvalcore._local_index import LocalIndex
+from esmvalcore._main import Config, Data, ESMValTool, Recipes, run
 from esmvalcore.exceptions import RecipeError
 
 
@@ -131,6 +132,13 @@ def test_run_with_search_esgf():
         run()
 
 
+@patch('esmvalcore._main.ESMValTool.run', new=wrapper(ESMValTool.run))
+def test_run_with_refresh_esgf_cache():
+    with arguments('esmvaltool', 'run', 'recipe.yml',
+                   '--refresh_esgf_cache'):
+        run()
+
+
 @patch('esmvalcore._main.ESMValTool.run', new=wrapper(ESMValTool.run))
 def test_run_with_check_level():
     with arguments('esmvaltool', 'run', 'recipe.yml', '--check_level=default'):
@@ -225,3 +233,30 @@ def test_get_config_user_bad_option_fails():
                    '--bad_option=path'):
         with pytest.raises(FireExit):
             run()
+
+
+@patch('esmvalcore._main.Data.index', new=wrapper(Data.index))
+def test_data_index():
+    """Test data index command."""
+    with arguments('esmvaltool', 'data', 'index'):
+        run()
+
+
+def test_data_index_create(tmp_path):
+    """Test that data index creates the index."""
+    rootpath = tmp_path / 'climate_data'
+    (rootpath / 'dir').mkdir(parents=True)
+    (rootpath / 'dir' / 'file.nc').touch()
+    index_file = tmp_path / 'index.sqlite'
+    config_file = tmp_path / 'config-user.yml'
+    config_file.write_text(
+        yaml.safe_dump({
+            'rootpath': {'default': str(rootpath)},
+            'local_file_index': str(index_file),
+        }))
+    with arguments('esmvaltool', 'data', 'index',
+                   f'--config_file={config_file}'):
+        run()
+    assert LocalIndex(index_file).glob(rootpath / '*' / '*.nc') == [
+        rootpath / 'dir' / 'file.nc'
+    ]
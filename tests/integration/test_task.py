@@ -1,6 +1,8 @@
 import multiprocessing
 import os
 import shutil
+import threading
+import time
 from functools import partial
 from multiprocessing.pool import ThreadPool
 
@@ -80,6 +82,25 @@ def test_run_tasks(monkeypatch, tmp_path, max_parallel_tasks, example_tasks,
         assert task.output_files
 
 
+@pytest.mark.parametrize('max_parallel_tasks', [1, 2, None])
+def test_run_tasks_distributed(max_parallel_tasks, example_tasks):
+    """Check that tasks are run correctly on a Dask distributed cluster."""
+    dask_cluster = {
+        'processes': False,
+        'n_workers': 1,
+        'threads_per_worker': 2,
+    }
+    example_tasks.run(
+        max_parallel_tasks=max_parallel_tasks,
+        task_scheduler='distributed',
+        dask_cluster=dask_cluster,
+    )
+
+    for task in example_tasks:
+        print(task.name, task.output_files)
+        assert task.output_files
+
+
 @pytest.mark.parametrize('runner', [
     TaskSet._run_sequential,
     partial(TaskSet._run_parallel, max_parallel_tasks=1),
@@ -102,6 +123,88 @@ def test_runner_uses_priority(monkeypatch, runner, example_tasks):
     assert order == sorted(order)
 
 
+def test_run_parallel_memory_budget(monkeypatch, example_tasks):
+    """Check that the memory budget limits the number of running tasks."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def _run(self, input_files):
+        with lock:
+            running.append(self)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(self)
+        return [f'{self.name}_test.nc']
+
+    monkeypatch.setattr(MockBaseTask, '_run', _run)
+    monkeypatch.setattr(MockBaseTask, 'estimate_memory', lambda _: 2**30)
+    monkeypatch.setattr(esmvalcore._task, 'Pool', ThreadPool)
+
+    example_tasks._run_parallel(max_parallel_tasks=4, memory_budget=2.5)
+
+    assert len(max_running) == 12
+    assert max(max_running) <= 2
+
+
+@pytest.mark.parametrize('runner', [
+    TaskSet._run_sequential,
+    partial(TaskSet._run_parallel, max_parallel_tasks=2),
+])
+def test_runner_waits_until_available(monkeypatch, runner, example_tasks):
+    """Check that tasks are only started once they are available."""
+    monkeypatch.setattr(esmvalcore._task, 'AVAILABILITY_INTERVAL', 0.01)
+    available = set()
+    started = []
+
+    def _run(self, input_files):
+        assert self.name in available
+        started.append(self.name)
+        return [f'{self.name}_test.nc']
+
+    def is_available(task):
+        # Tasks become available one at a time, in reverse order of priority
+        if task.name not in available:
+            names = sorted(t.name for t in example_tasks.flatten())
+            for name in reversed(names):
+                if name not in available:
+                    available.add(name)
+                    break
+        return task.name in available
+
+    monkeypatch.setattr(MockBaseTask, '_run', _run)
+    monkeypatch.setattr(esmvalcore._task, 'Pool', ThreadPool)
+
+    runner(example_tasks, is_available=is_available)
+
+    assert len(started) == 12
+
+
+@pytest.mark.parametrize('runner,expected', [
+    (TaskSet._run_sequential, ['start']),
+    (partial(TaskSet._run_parallel, max_parallel_tasks=2), ['pool', 'start']),
+])
+def test_runner_on_start(monkeypatch, runner, expected, example_tasks):
+    """Check that `on_start` is called after creating the pool of processes."""
+    events = []
+
+    def _run(self, input_files):
+        events.append('run')
+        return [f'{self.name}_test.nc']
+
+    def pool(*args, **kwargs):
+        events.append('pool')
+        return ThreadPool(*args, **kwargs)
+
+    monkeypatch.setattr(MockBaseTask, '_run', _run)
+    monkeypatch.setattr(esmvalcore._task, 'Pool', pool)
+
+    runner(example_tasks, on_start=lambda: events.append('start'))
+
+    assert events == expected + ['run'] * 12
+
+
 def test_py2ncl():
     """Test for _py2ncl func."""
     ncl_text = _py2ncl(None, 'tas')
@@ -16,6 +16,7 @@ from esmvalcore.cmor.check import (
     CheckLevels,
     CMORCheck,
     CMORCheckError,
+    _defer_data_checks,
     _get_cmor_checker,
 )
 
@@ -627,6 +628,63 @@ class TestCMORCheck(unittest.TestCase):
         self.assertTrue(self.cube.coord('longitude').has_lazy_points())
         self.assertTrue(self.cube.has_lazy_data())
 
+    def test_data_out_of_range(self):
+        """Warning if data values are above valid_max."""
+        self.cube.data[0] = 101.
+        self._check_warnings_on_data()
+
+    def test_data_out_of_range_relaxed(self):
+        """Warning if data values are above valid_max at relaxed level."""
+        self.cube.data[0] = 101.
+        self._check_warnings_on_data(check_level=CheckLevels.RELAXED)
+
+    def test_data_out_of_range_strict(self):
+        """Fail if data values are above valid_max at strict level."""
+        self.cube.data[0] = 101.
+        self._check_fails_on_data(check_level=CheckLevels.STRICT)
+
+    def test_data_not_finite(self):
+        """Warning if data contains non-finite values."""
+        self.cube.data[0] = np.nan
+        self._check_warnings_on_data()
+
+    def test_data_all_masked(self):
+        """Warning if all data values are masked."""
+        self.cube.data = np.ma.masked_all(self.cube.shape)
+        self._check_warnings_on_data()
+
+    def test_lazy_data_checks_deferred(self):
+        """Test checks of lazy data values are computed later."""
+        self.cube.data[0] = 101.
+        self.cube.data = self.cube.lazy_data()
+        checker = CMORCheck(self.cube, self.var_info,
+                            check_level=CheckLevels.STRICT)
+        checker.check_metadata()
+        with _defer_data_checks() as checks:
+            checker.check_data()
+        self.assertTrue(self.cube.has_lazy_data())
+        self.assertEqual(len(checks), 1)
+        with self.assertRaises(CMORCheckError):
+            checks[0].compute()
+
+    def test_lazy_data_checks_deferred_default(self):
+        """Test deferred checks of lazy data values do not fail."""
+        self.cube.data[0] = 101.
+        self.cube.data = self.cube.lazy_data()
+        checker = CMORCheck(self.cube, self.var_info)
+        checker.check_metadata()
+        with _defer_data_checks() as checks:
+            checker.check_data()
+        self.assertEqual(len(checks), 1)
+        checks[0].compute()
+
+    def test_lazy_data_checks_not_deferred(self):
+        """Test lazy data values are not checked outside of a context."""
+        self.cube.data[0] = 101.
+        self.cube.data = self.cube.lazy_data()
+        self._check_cube()
+        self.assertTrue(self.cube.has_lazy_data())
+
     def _check_fails_in_metadata(self, automatic_fixes=False, frequency=None,
                                  check_level=CheckLevels.DEFAULT):
         checker = CMORCheck(
@@ -823,6 +881,19 @@ class TestCMORCheck(unittest.TestCase):
         self.cube = self.cube.intersection(longitude=(-720., -360.))
         self._check_fails_in_metadata(automatic_fixes=True)
 
+    def test_lons_automatic_fix_lazy(self):
+        """Test automatic fixes for bad longitudes keep the data lazy."""
+        self.cube = self.cube.intersection(longitude=(-180., 180.))
+        self.cube.data = self.cube.lazy_data().rechunk((-1, -1, 5, -1, -1))
+        expected = self.cube.intersection(longitude=(0., 360.),
+                                          ignore_bounds=True)
+        self._check_cube(automatic_fixes=True)
+        self.assertTrue(self.cube.has_lazy_data())
+        self.assertEqual(self.cube.lazy_data().numblocks[2], 4)
+        self.assertEqual(self.cube.coord('longitude'),
+                         expected.coord('longitude'))
+        np.testing.assert_array_equal(self.cube.data, expected.data)
+
     def test_not_valid_min(self):
         """Fail if coordinate values below valid_min."""
         coord = self.cube.coord('latitude')
@@ -1130,14 +1201,14 @@ class TestCMORCheck(unittest.TestCase):
         self.assertTrue(isinstance(arr_out, da.core.Array))
         np.testing.assert_allclose(arr_out.compute(), arr_exp.compute())
 
-    def _check_fails_on_data(self):
-        checker = CMORCheck(self.cube, self.var_info)
+    def _check_fails_on_data(self, check_level=CheckLevels.DEFAULT):
+        checker = CMORCheck(self.cube, self.var_info, check_level=check_level)
         checker.check_metadata()
         with self.assertRaises(CMORCheckError):
             checker.check_data()
 
-    def _check_warnings_on_data(self):
-        checker = CMORCheck(self.cube, self.var_info)
+    def _check_warnings_on_data(self, check_level=CheckLevels.DEFAULT):
+        checker = CMORCheck(self.cube, self.var_info, check_level=check_level)
         checker.check_metadata()
         checker.check_data()
         self.assertTrue(checker.has_warnings())
@@ -2,8 +2,9 @@
 
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
+from esmvalcore.cmor._fixes.overlay import FileOverlay
 from esmvalcore.cmor.check import CheckLevels
 from esmvalcore.cmor.fix import Fix, fix_data, fix_file, fix_metadata
 
@@ -64,6 +65,47 @@ class TestFixFile(TestCase):
                 **self.expected_get_fixes_call
             )
 
+    def _fix_file_with_overlay(self, allow_overlay):
+        overlay = create_autospec(FileOverlay, instance=True)
+        overlay.filepath = Path('filename')
+        overlay.write.return_value = Path('output_dir') / 'filename'
+        self.mock_fix.fix_file.return_value = overlay
+        with patch('esmvalcore.cmor._fixes.fix.Fix.get_fixes',
+                   return_value=[self.mock_fix]):
+            file_returned = fix_file(
+                file='filename',
+                short_name='short_name',
+                project='project',
+                dataset='model',
+                mip='mip',
+                output_dir=Path('output_dir'),
+                allow_overlay=allow_overlay,
+            )
+        return overlay, file_returned
+
+    @patch('esmvalcore.cmor.fix.overlays_supported', return_value=True)
+    def test_fix_overlay(self, _):
+        """Check that an overlay is returned if allowed."""
+        overlay, file_returned = self._fix_file_with_overlay(True)
+        self.assertIs(file_returned, overlay)
+        overlay.write.assert_not_called()
+
+    @patch('esmvalcore.cmor.fix.overlays_supported', return_value=True)
+    @patch('esmvalcore.cmor._fixes.fix.Path.mkdir')
+    def test_fix_overlay_not_allowed(self, *_):
+        """Check that a fixed file is written if overlays are not allowed."""
+        overlay, file_returned = self._fix_file_with_overlay(False)
+        self.assertEqual(file_returned, Path('output_dir') / 'filename')
+        overlay.write.assert_called_once_with(Path('output_dir') / 'filename')
+
+    @patch('esmvalcore.cmor.fix.overlays_supported', return_value=False)
+    @patch('esmvalcore.cmor._fixes.fix.Path.mkdir')
+    def test_fix_overlay_not_supported(self, *_):
+        """Check that a fixed file is written if iris cannot load overlays."""
+        overlay, file_returned = self._fix_file_with_overlay(True)
+        self.assertEqual(file_returned, Path('output_dir') / 'filename')
+        overlay.write.assert_called_once_with(Path('output_dir') / 'filename')
+
 
 class TestGetCube(TestCase):
     """Test get cube by var_name method."""
@@ -157,6 +157,7 @@ def test_load_default_config(monkeypatch, default_config):
         'compress_netcdf': False,
         'config_developer_file': default_dev_file,
         'config_file': CONFIG_USER_FILE,
+        'dask_cluster': None,
         'diagnostics': None,
         'download_dir': Path.home() / 'climate_data',
         'drs': {
@@ -167,23 +168,37 @@ def test_load_default_config(monkeypatch, default_config):
             'obs4MIPs': 'ESGF'
         },
         'exit_on_warning': False,
+        'file_dates_cache_dir': None,
+        'fixed_data_cache_dir': None,
+        'fixed_data_cache_size': 100.0,
         'extra_facets_dir': tuple(),
+        'local_file_index': None,
         'log_level': 'info',
         'max_datasets': None,
         'max_parallel_tasks': None,
         'max_years': None,
         'output_dir': Path.home() / 'esmvaltool_output',
         'output_file_type': 'png',
+        'preprocessor_cache_dir': None,
+        'preprocessor_cache_size': 100.0,
+        'preprocessor_memory_budget': None,
+        'preprocessor_output_format': 'netcdf',
         'profile_diagnostic': False,
+        'refresh_esgf_cache': False,
+        'regrid_weights_cache_dir': None,
         'remove_preproc_dir': True,
         'resume_from': [],
+        'reuse_file_metadata': False,
         'rootpath': {
             'default': [Path.home() / 'climate_data']
         },
         'run_diagnostic': True,
+        'run_while_downloading': False,
         'search_esgf': 'never',
         'skip_nonexistent': False,
         'save_intermediary_cubes': False,
+        'task_memory_budget': None,
+        'task_scheduler': 'multiprocessing',
     }
 
     directory_attrs = {
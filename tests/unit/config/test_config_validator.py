@@ -1,3 +1,4 @@
+import importlib.util
 from pathlib import Path
 
 import numpy as np
@@ -12,15 +13,18 @@ from esmvalcore.config._config_validators import (
     validate_check_level,
     validate_diagnostics,
     validate_float,
+    validate_float_positive_or_none,
     validate_int,
     validate_int_or_none,
     validate_int_positive_or_none,
     validate_path,
     validate_path_or_none,
     validate_positive,
+    validate_preprocessor_output_format,
     validate_search_esgf,
     validate_string,
     validate_string_or_none,
+    validate_task_scheduler,
 )
 from esmvalcore.exceptions import (
     ESMValCoreDeprecationWarning,
@@ -111,6 +115,11 @@ def generate_validator_testcases(valid):
             'success': ((None, None), ),
             'fail': (),
         },
+        {
+            'validator': validate_float_positive_or_none,
+            'success': ((None, None), (2, 2.), ('1.5', 1.5)),
+            'fail': ((0, ValueError), (-1., ValueError)),
+        },
         {
             'validator':
             validate_path,
@@ -187,6 +196,28 @@ def generate_validator_testcases(valid):
                 ('fail', ValueError),
             ),
         },
+        {
+            'validator': validate_task_scheduler,
+            'success': (
+                ('multiprocessing', 'multiprocessing'),
+                ('Distributed', 'distributed'),
+            ),
+            'fail': (
+                (1, ValueError),
+                ('threads', ValueError),
+            ),
+        },
+        {
+            'validator': validate_preprocessor_output_format,
+            'success': (
+                ('NetCDF', 'netcdf'),
+                ('zarr', 'zarr'),
+            ),
+            'fail': (
+                (1, ValueError),
+                ('grib', ValueError),
+            ),
+        },
     )
 
     for validator_dict in validation_tests:
@@ -213,6 +244,19 @@ def test_validator_invalid(validator, arg, exception_type):
         validator(arg)
 
 
+def test_validate_preprocessor_output_format_no_zarr(monkeypatch):
+    """Test that the zarr format can only be used if zarr is installed."""
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        'find_spec',
+        lambda name, *args: None if name == 'zarr' else find_spec(name, *args),
+    )
+    assert validate_preprocessor_output_format('netcdf') == 'netcdf'
+    with pytest.raises(ValueError, match='requires the zarr package'):
+        validate_preprocessor_output_format('zarr')
+
+
 @pytest.mark.parametrize('remove_version', (current_version, '0.0.1', '9.9.9'))
 def test_handle_deprecation(remove_version):
     """Test ``_handle_deprecation``."""
@@ -1,9 +1,13 @@
 """Test `esmvalcore.esgf._download`."""
 import datetime
+import hashlib
+import http.server
 import logging
 import os
 import re
 import textwrap
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -67,6 +71,41 @@ def test_error(monkeypatch, tmp_path):
     assert result == expected
 
 
+def test_statistics_batch(monkeypatch, tmp_path):
+    hosts_file = tmp_path / '.esmvaltool' / 'cache' / 'esgf-hosts.yml'
+    monkeypatch.setattr(_download, 'HOSTS_FILE', hosts_file)
+    statistics = _download._HostStatistics()
+
+    megabyte = 10**6
+    with statistics.batch():
+        statistics.log_speed('http://somehost.org/a.nc', 3 * megabyte, 2)
+        statistics.log_error('http://otherhost.org/b.nc')
+        # Nothing is written until the batch is done
+        assert not hosts_file.exists()
+
+    result = yaml.safe_load(hosts_file.read_text())
+    expected = {
+        'somehost.org': {
+            'speed (MB/s)': 1.5,
+            'duration (s)': 2,
+            'size (bytes)': 3 * megabyte,
+            'error': False,
+        },
+        'otherhost.org': {
+            'speed (MB/s)': 0,
+            'duration (s)': 0,
+            'size (bytes)': 0,
+            'error': True,
+        },
+    }
+    assert result == expected
+
+    # Outside of a batch, statistics are written immediately
+    statistics.log_error('http://somehost.org/a.nc')
+    result = yaml.safe_load(hosts_file.read_text())
+    assert result['somehost.org']['error'] is True
+
+
 @pytest.mark.parametrize('age_in_hours', [0.5, 2])
 def test_get_preferred_hosts(monkeypatch, tmp_path, age_in_hours):
     hosts_file = tmp_path / 'esgf-hosts.yml'
@@ -409,10 +448,13 @@ def test_single_download(mocker, tmp_path, checksum):
                                       spec_set=True,
                                       instance=True)
     response.iter_content.return_value = [b'chunk1', b'chunk2']
-    get = mocker.patch.object(_download.requests,
-                              'get',
-                              autospec=True,
-                              return_value=response)
+    session = mocker.create_autospec(requests.Session, instance=True)
+    session.get.return_value = response
+    mocker.patch.object(_download,
+                        '_get_session',
+                        autospec=True,
+                        return_value=session)
+    get = session.get
 
     dest_folder = tmp_path
     filename = 'abc_2000-2001.nc'
@@ -459,7 +501,7 @@ def test_single_download(mocker, tmp_path, checksum):
     # We checked for a valid response
     response.raise_for_status.assert_called_once()
     # And requested a reasonable chunk size
-    response.iter_content.assert_called_with(chunk_size=None)
+    response.iter_content.assert_called_with(chunk_size=2**20)
 
 
 def test_download_skip_existing(tmp_path, caplog):
@@ -497,10 +539,12 @@ def test_single_download_fail(mocker, tmp_path):
                                       instance=True)
     response.raise_for_status.side_effect = (
         requests.exceptions.RequestException("test error"))
-    mocker.patch.object(_download.requests,
-                        'get',
+    session = mocker.create_autospec(requests.Session, instance=True)
+    session.get.return_value = response
+    mocker.patch.object(_download,
+                        '_get_session',
                         autospec=True,
-                        return_value=response)
+                        return_value=session)
 
     filename = 'test.nc'
     dataset = 'dataset'
@@ -573,10 +617,13 @@ def test_download(mocker, tmp_path, caplog):
         file.__lt__.return_value = False
 
     caplog.set_level(logging.INFO)
-    esmvalcore.esgf.download(test_files, dest_folder)
+    esmvalcore.esgf.download(test_files,
+                             dest_folder,
+                             max_downloads_per_host=2)
 
     for file in test_files:
-        file.download.assert_called_with(dest_folder)
+        file.download.assert_called_with(dest_folder,
+                                         max_downloads_per_host=2)
 
     print(caplog.text)
     assert "Downloaded 1 GB" in caplog.text
@@ -610,7 +657,8 @@ def test_download_fail(mocker, tmp_path, caplog):
     assert error0 in caplog.text
     assert error1 in caplog.text
     for file in test_files:
-        file.download.assert_called_with(dest_folder)
+        file.download.assert_called_with(dest_folder,
+                                         max_downloads_per_host=4)
 
 
 def test_download_noop(caplog):
@@ -621,3 +669,123 @@ def test_download_noop(caplog):
     msg = ("All required data is available locally,"
            " not downloading anything.")
     assert msg in caplog.text
+
+
+@pytest.fixture
+def http_server():
+    """Serve a file over HTTP and support requesting byte ranges."""
+    content = bytes(range(256)) * 4096 * 3
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        interrupt_after = None
+        ranges = []
+
+        def do_GET(self):
+            start = 0
+            if 'Range' in self.headers:
+                start = int(self.headers['Range'][len('bytes='):-1])
+            self.ranges.append(self.headers.get('Range'))
+            data = content[start:]
+            self.send_response(206 if start else 200)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            if Handler.interrupt_after is not None:
+                # Simulate a broken connection
+                data = data[:Handler.interrupt_after]
+                Handler.interrupt_after = None
+                self.close_connection = True
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('localhost', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, Handler, content
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('interrupt', [False, True])
+def test_single_download_http(mocker, tmp_path, http_server, interrupt):
+    """Test downloading and resuming a download from an HTTP server."""
+    server, handler, content = http_server
+    if interrupt:
+        handler.interrupt_after = 2**20 + 100
+    hosts_file = tmp_path / '.esmvaltool' / 'cache' / 'esgf-hosts.yml'
+    mocker.patch.object(_download, 'HOSTS_FILE', hosts_file)
+    mocker.patch.object(_download,
+                        'get_credentials',
+                        autospec=True,
+                        return_value=None)
+
+    filename = 'abc_2000-2001.nc'
+    url = f'http://localhost:{server.server_port}/{filename}'
+    json = {
+        'checksum': [hashlib.sha256(content).hexdigest()],
+        'checksum_type': ['SHA256'],
+        'dataset_id': 'CMIP6.ABC.v1|localhost',
+        'dataset_id_template_': ["%(mip_era)s.%(source_id)s"],
+        'project': ['CMIP6'],
+        'size': len(content),
+        'source_id': ['ABC'],
+        'title': filename,
+        'url': [url + '|application/netcdf|HTTPServer'],
+    }
+    file = _download.ESGFFile([FileResult(json=json, context=None)])
+
+    local_file = file.download(tmp_path)
+
+    assert local_file.read_bytes() == content
+    if interrupt:
+        assert handler.ranges == [None, f'bytes={2**20}-']
+    else:
+        assert handler.ranges == [None]
+    assert not list(local_file.parent.glob('*.tmp'))
+    assert yaml.safe_load(hosts_file.read_text())['localhost']['error'] is (
+        False)
+
+
+def test_host_slot():
+    """Test that the number of downloads per host can be configured."""
+    url = 'http://example.com/file.nc'
+    slot = _download._host_slot(url, 2)
+    assert slot is _download._host_slot('http://example.com/other.nc', 2)
+    assert slot is not _download._host_slot(url, 3)
+    assert slot.acquire(blocking=False)
+    assert slot.acquire(blocking=False)
+    assert not slot.acquire(blocking=False)
+    slot.release()
+    slot.release()
+
+
+def test_tmp_local_file(tmp_path):
+    """Test that the temporary file can be resumed if it is not locked."""
+    local_file = tmp_path / 'file.nc'
+    with _download.ESGFFile._tmp_local_file(local_file) as tmp_file:
+        assert tmp_file == tmp_path / 'file.nc.tmp'
+        assert (tmp_path / 'file.nc.lock').exists()
+        tmp_file.write_bytes(b'partial')
+
+        # A concurrent download uses a different file
+        with _download.ESGFFile._tmp_local_file(local_file) as other_file:
+            assert other_file != tmp_file
+            other_file.write_bytes(b'other')
+        assert not other_file.exists()
+
+    assert not (tmp_path / 'file.nc.lock').exists()
+    assert tmp_file.read_bytes() == b'partial'
+
+
+def test_tmp_local_file_stale_lock(tmp_path):
+    """Test that a stale lock is removed."""
+    local_file = tmp_path / 'file.nc'
+    lock_file = tmp_path / 'file.nc.lock'
+    lock_file.touch()
+    mtime = time.time() - _download.TIMEOUT - 1
+    os.utime(lock_file, (mtime, mtime))
+
+    with _download.ESGFFile._tmp_local_file(local_file) as tmp_file:
+        assert tmp_file == tmp_path / 'file.nc.tmp'
+    assert not lock_file.exists()
@@ -1,6 +1,7 @@
 """Test 1esmvalcore.esgf._search`."""
 import copy
 import textwrap
+import time
 
 import pyesgf.search
 import pytest
@@ -9,6 +10,14 @@ from pyesgf.search.results import FileResult
 
 from esmvalcore.esgf import ESGFFile, _search, find_files
 
+
+@pytest.fixture(autouse=True)
+def search_cache(tmp_path, monkeypatch):
+    cache = tmp_path / 'cache' / 'esgf-search.sqlite'
+    monkeypatch.setattr(_search, 'SEARCH_CACHE', cache)
+    return cache
+
+
 OUR_FACETS = (
     {
         'dataset': 'cccma_cgcm3_1',
@@ -278,6 +287,31 @@ def test_esgf_search_uses_second_index_node(mocker):
     assert result == search_result
 
 
+def test_esgf_search_uses_fastest_index_node(mocker):
+    """Test that the next index node is tried if the first is slow."""
+    search_results = {
+        'https://esgf-index1.example.com/esg-search': (0.5, ['slow']),
+        'https://esgf-index2.example.com/esg-search': (0, ['fast']),
+    }
+
+    def search_index_node(url, search_args, facets):
+        delay, result = search_results[url]
+        time.sleep(delay)
+        return result
+
+    get_mock_connection(mocker, [])
+    mocker.patch.object(_search, 'INDEX_NODE_DELAY', 0.01)
+    mocker.patch.object(_search,
+                        '_search_index_node',
+                        side_effect=search_index_node)
+
+    result = _search._search_index_nodes(facets={})
+
+    second_index_node = 'https://esgf-index2.example.com/esg-search'
+    assert _search.FIRST_ONLINE_INDEX_NODE == second_index_node
+    assert result == ['fast']
+
+
 def test_esgf_search_fails(mocker):
     """Test that FileNotFoundError is raised if all index nodes are offline."""
     search_results = [
@@ -297,6 +331,76 @@ def test_esgf_search_fails(mocker):
     assert str(excinfo.value) == error_message
 
 
+def test_search_with_cache(mocker, search_cache):
+    """Test that search results are stored on disk."""
+    result = FileResult({'title': 'tas_1850-1899.nc'}, None)
+    SearchConnection, context = get_mock_connection(  # noqa: N806
+        mocker, search_results=[[result]])
+    facets = {'project': 'CMIP6', 'variable_id': 'tas'}
+
+    results = _search._search_with_cache(facets)
+    assert [r.json for r in results] == [result.json]
+    assert search_cache.exists()
+
+    # Results are read from the cache instead of searching again.
+    results = _search._search_with_cache(dict(reversed(facets.items())))
+    assert [r.json for r in results] == [result.json]
+    context.search.assert_called_once()
+
+
+def test_search_with_cache_expired(mocker, search_cache):
+    """Test that expired search results are refreshed."""
+    results = [
+        [FileResult({'title': 'tas_1850-1899.nc'}, None)],
+        [FileResult({'title': 'tas_1850-1949.nc'}, None)],
+    ]
+    SearchConnection, context = get_mock_connection(  # noqa: N806
+        mocker, search_results=results)
+    facets = {'project': 'CMIP6', 'variable_id': 'tas'}
+
+    _search._search_with_cache(facets)
+    _search.expire_search_cache()
+    found = _search._search_with_cache(facets)
+    assert [r.json for r in found] == [results[1][0].json]
+    assert context.search.call_count == 2
+
+
+def test_search_with_cache_offline(mocker, search_cache):
+    """Test that expired search results are used if ESGF is offline."""
+    result = FileResult({'title': 'tas_1850-1899.nc'}, None)
+    search_results = [
+        [result],
+        requests.exceptions.ConnectTimeout("Timeout error message 1"),
+        requests.exceptions.ConnectTimeout("Timeout error message 2"),
+    ]
+    SearchConnection, context = get_mock_connection(  # noqa: N806
+        mocker, search_results)
+    mocker.patch.object(_search, '_get_expire_after', return_value=0)
+    facets = {'project': 'CMIP6', 'variable_id': 'tas'}
+
+    _search._search_with_cache(facets)
+    found = _search._search_with_cache(facets)
+    assert [r.json for r in found] == [result.json]
+    assert context.search.call_count == 3
+
+
+def test_find_files_concurrently(mocker):
+    """Test that results are returned in the order of the facets."""
+
+    def find_files(**facets):
+        time.sleep(0.1 if facets['dataset'] == 'a' else 0)
+        return [facets['dataset']]
+
+    mocker.patch.object(_search, 'find_files', side_effect=find_files)
+
+    facet_sets = [
+        {'project': 'CMIP6', 'short_name': 'tas', 'dataset': 'a'},
+        {'project': 'CMIP6', 'short_name': 'tas', 'dataset': 'b'},
+    ]
+    result = _search.find_files_concurrently(facet_sets, max_workers=2)
+    assert result == [['a'], ['b']]
+
+
 def test_select_latest_versions_filenotfound(mocker):
     """Test `select_latest_versions` raises FileNotFoundError."""
     file = mocker.create_autospec(ESGFFile, instance=True)
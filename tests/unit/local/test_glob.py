@@ -0,0 +1,132 @@
+import glob
+import os
+from pathlib import Path
+
+import pytest
+
+from esmvalcore.local import _glob, _list_directory, _prefetch_directories
+
+
+def create_files(rootpath, *filenames):
+    for filename in filenames:
+        path = rootpath / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+@pytest.fixture
+def rootpath(tmp_path):
+    rootpath = tmp_path / 'climate_data'
+    create_files(
+        rootpath,
+        'CMIP6/MPI-ESM1-2-LR/historical/tas_Amon_1850-1869.nc',
+        'CMIP6/MPI-ESM1-2-LR/historical/tas_Amon_1870-1889.nc',
+        'CMIP6/MPI-ESM1-2-LR/historical/.tas_Amon_1870-1889.nc',
+        'CMIP6/MPI-ESM1-2-LR/ssp585/tas_Amon_2015-2100.nc',
+        'CMIP6/MPI-ESM1-2-LR/.hidden/tas_Amon_2015-2100.nc',
+        'CMIP6/CanESM5/historical/pr_Amon_1850-2014.nc',
+        'CMIP6/CanESM5/historical/v1/pr_Amon_1850-2014.nc',
+    )
+    return rootpath
+
+
+@pytest.mark.parametrize('pattern', [
+    'CMIP6/*/historical/tas_Amon_*.nc',
+    'CMIP6/*/*/*.nc',
+    'CMIP6/*/*/.*.nc',
+    'CMIP6/*/.hidden/*.nc',
+    'CMIP6/MPI-ESM1-2-LR/*',
+    'CMIP6/Can*/historical/v1/pr_Amon_1850-2014.nc',
+    'CMIP6/MPI-ESM1-2-LR/historical/tas_Amon_1850-1869.nc',
+    'CMIP6/MPI-ESM1-2-LR/historical/tas_Amon_1850-2014.nc',
+    'CMIP6/*/piControl/*.nc',
+    'CMIP7/*/*/*.nc',
+])
+def test_glob_same_as_stdlib(rootpath, pattern):
+    pattern = rootpath / pattern
+    result = _glob([pattern])
+    assert list(result) == [pattern]
+    assert sorted(result[pattern]) == sorted(
+        Path(p) for p in glob.glob(str(pattern)))
+
+
+def test_glob_multiple_patterns(rootpath):
+    patterns = [
+        rootpath / 'CMIP6' / '*' / 'historical' / 'tas_*.nc',
+        rootpath / 'CMIP6' / '*' / 'historical' / 'pr_*.nc',
+    ]
+    result = _glob(patterns)
+    assert sorted(result[patterns[0]]) == [
+        rootpath / 'CMIP6/MPI-ESM1-2-LR/historical/tas_Amon_1850-1869.nc',
+        rootpath / 'CMIP6/MPI-ESM1-2-LR/historical/tas_Amon_1870-1889.nc',
+    ]
+    assert result[patterns[1]] == [
+        rootpath / 'CMIP6/CanESM5/historical/pr_Amon_1850-2014.nc',
+    ]
+
+
+def test_list_directory_cached(tmp_path):
+    create_files(tmp_path, 'a.nc', 'b/c.nc')
+    listings = {}
+    assert _list_directory(str(tmp_path), listings) == (['a.nc'], ['b'])
+    assert str(tmp_path) in listings
+
+    # A cached listing is used as long as the directory is not modified.
+    mtime = os.stat(tmp_path).st_mtime_ns
+    listings[str(tmp_path)] = (mtime, ['x.nc'], [])
+    assert _list_directory(str(tmp_path), listings) == (['x.nc'], [])
+
+    # The directory is listed again after it was modified.
+    listings[str(tmp_path)] = (mtime - 1, ['x.nc'], [])
+    files, subdirs = _list_directory(str(tmp_path), listings)
+    assert files == ['a.nc']
+    assert subdirs == ['b']
+
+
+def test_list_directory_missing(tmp_path):
+    listings = {}
+    assert _list_directory(str(tmp_path / 'missing'), listings) == ([], [])
+    assert not listings
+
+
+def test_prefetch_directories(mocker, rootpath):
+    mocker.patch.dict(
+        'esmvalcore.local.CFG',
+        {
+            'rootpath': {
+                'CMIP6': [rootpath]
+            },
+            'drs': {
+                'CMIP6': 'default'
+            },
+            'local_file_index': None,
+        },
+    )
+    mocker.patch(
+        'esmvalcore.local._select_drs',
+        side_effect=lambda key, _: {
+            'input_dir': '{project}/{dataset}/{exp}',
+            'input_file': '{short_name}_{mip}_*.nc',
+        }[key],
+    )
+    facets = {
+        'project': 'CMIP6',
+        'dataset': '*',
+        'exp': 'historical',
+        'mip': 'Amon',
+    }
+    listings = {}
+    _prefetch_directories(
+        [
+            dict(facets, short_name='tas'),
+            dict(facets, short_name='pr'),
+            # Facets that are not sufficient to find files are skipped
+            {'project': 'CMIP6'},
+        ],
+        listings,
+    )
+    assert sorted(listings) == [
+        str(rootpath / 'CMIP6'),
+        str(rootpath / 'CMIP6' / 'CanESM5' / 'historical'),
+        str(rootpath / 'CMIP6' / 'MPI-ESM1-2-LR' / 'historical'),
+    ]
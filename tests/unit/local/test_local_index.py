@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from esmvalcore._local_index import LocalIndex, _match
+
+
+@pytest.mark.parametrize('path,pattern,expected', [
+    ('/a/b/c.nc', '/a/*/*.nc', True),
+    ('/a/b/c.nc', '/a/*.nc', False),
+    ('/a/b/d/c.nc', '/a/*/c.nc', False),
+    ('/a/.b/c.nc', '/a/*/c.nc', False),
+    ('/a/.b/c.nc', '/a/.b/c.nc', True),
+    ('/a/b/c.nc', '/a/[bc]/c.n?', True),
+])
+def test_match(path, pattern, expected):
+    assert _match(path, pattern) is expected
+
+
+def create_files(rootpath, *filenames):
+    for filename in filenames:
+        path = rootpath / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+@pytest.fixture
+def rootpath(tmp_path):
+    rootpath = tmp_path / 'climate_data'
+    create_files(
+        rootpath,
+        'CMIP6/CanESM5/tas/v1/tas_CanESM5_185001-201412.nc',
+        'CMIP6/CanESM5/tas/v2/tas_CanESM5_185001-201412.nc',
+        'CMIP6/CanESM5/pr/v1/pr_CanESM5_185001-201412.nc',
+        'CMIP6/MIROC6/tas/v1/tas_MIROC6.nc',
+    )
+    return rootpath
+
+
+@pytest.fixture
+def index(tmp_path, rootpath):
+    index = LocalIndex(tmp_path / 'index.sqlite')
+    index.update([rootpath])
+    return index
+
+
+def test_glob(index, rootpath):
+    files = index.glob(rootpath / 'CMIP6' / '*' / 'tas' / '*' / 'tas_*.nc')
+    assert sorted(files) == [
+        rootpath / 'CMIP6/CanESM5/tas/v1/tas_CanESM5_185001-201412.nc',
+        rootpath / 'CMIP6/CanESM5/tas/v2/tas_CanESM5_185001-201412.nc',
+        rootpath / 'CMIP6/MIROC6/tas/v1/tas_MIROC6.nc',
+    ]
+
+
+def test_glob_with_dates(index, rootpath):
+    files = index.glob_with_dates(rootpath / 'CMIP6' / '*' / 'tas' / 'v1' /
+                                  '*.nc')
+    assert files == {
+        rootpath / 'CMIP6/CanESM5/tas/v1/tas_CanESM5_185001-201412.nc':
+        ('185001', '201412'),
+        rootpath / 'CMIP6/MIROC6/tas/v1/tas_MIROC6.nc': (None, None),
+    }
+
+
+def test_covers(index, rootpath, tmp_path):
+    assert index.roots() == [str(rootpath)]
+    assert index.covers(rootpath / '*' / '*.nc')
+    assert not index.covers(tmp_path / 'other_data' / '*.nc')
+
+
+def test_update(index, rootpath):
+    # Add a file and remove a directory
+    create_files(rootpath, 'CMIP6/MIROC6/tas/v2/tas_MIROC6.nc')
+    for file in (rootpath / 'CMIP6/CanESM5/tas/v1').iterdir():
+        file.unlink()
+    (rootpath / 'CMIP6/CanESM5/tas/v1').rmdir()
+
+    index.update([rootpath])
+
+    files = index.glob(rootpath / 'CMIP6' / '*' / 'tas' / '*' / '*.nc')
+    assert sorted(files) == [
+        rootpath / 'CMIP6/CanESM5/tas/v2/tas_CanESM5_185001-201412.nc',
+        rootpath / 'CMIP6/MIROC6/tas/v1/tas_MIROC6.nc',
+        rootpath / 'CMIP6/MIROC6/tas/v2/tas_MIROC6.nc',
+    ]
+
+
+def test_update_unchanged_directories_not_listed(mocker, index, rootpath):
+    scandir = mocker.spy(os, 'scandir')
+    create_files(rootpath, 'CMIP6/MIROC6/tas/v1/tas_MIROC6_2.nc')
+
+    index.update([rootpath])
+
+    assert scandir.call_count == 1
+    assert Path(scandir.call_args[0][0]) == rootpath / 'CMIP6/MIROC6/tas/v1'
+
+
+def test_symlink_to_parent(tmp_path, rootpath):
+    (rootpath / 'CMIP6' / 'loop').symlink_to(rootpath)
+    index = LocalIndex(tmp_path / 'index.sqlite')
+    index.update([rootpath])
+    assert index.glob(rootpath / 'CMIP6' / 'loop' / '*') == []
@@ -1,16 +1,31 @@
 """Unit tests for time related functions in `esmvalcore.local`."""
+import os
+
+import cf_units
 import iris
 import pytest
 
+import esmvalcore.local
+from esmvalcore.config import CFG
 from esmvalcore.local import (
     LocalFile,
     _dates_to_timerange,
     _get_start_end_date,
+    _get_start_end_date_from_file,
     _get_start_end_year,
     _replace_years_with_timerange,
     _truncate_dates,
 )
 
+
+@pytest.fixture(autouse=True)
+def file_dates_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setitem(CFG, 'file_dates_cache_dir', cache_dir)
+    _get_start_end_date_from_file.cache_clear()
+    return cache_dir / 'file-dates.sqlite'
+
+
 FILENAME_CASES = [
     ['var_whatever_1980-1981', 1980, 1981],
     ['var_whatever_1980.nc', 1980, 1980],
@@ -125,6 +140,68 @@ def test_read_datetime_from_cube(monkeypatch, tmp_path):
     assert end == '19910102'
 
 
+def test_read_datetime_from_cube_cached(mocker, tmp_path, file_dates_cache):
+    """Test that dates read from a file are cached."""
+    temp_file = tmp_path / 'test.nc'
+    cube = iris.cube.Cube([0, 0], var_name='var')
+    time = iris.coords.DimCoord([0, 59],
+                                'time',
+                                units='days since 1990-01-01')
+    cube.add_dim_coord(time, 0)
+    iris.save(cube, temp_file)
+
+    read = mocker.spy(esmvalcore.local, '_read_start_end_date')
+    assert _get_start_end_date(temp_file) == ('19900101', '19900301')
+    assert read.call_count == 1
+    assert file_dates_cache.exists()
+
+    # The dates are read from the cache in memory or on disk
+    assert _get_start_end_date(temp_file) == ('19900101', '19900301')
+    _get_start_end_date_from_file.cache_clear()
+    assert _get_start_end_date(temp_file) == ('19900101', '19900301')
+    assert read.call_count == 1
+
+    # The file is read again after it is modified
+    cube.coord('time').units = 'days since 1991-01-01'
+    iris.save(cube, temp_file)
+    stat = os.stat(temp_file)
+    os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert _get_start_end_date(temp_file) == ('19910101', '19910301')
+    assert read.call_count == 2
+
+
+def test_read_datetime_from_cube_no_cache(monkeypatch, tmp_path,
+                                          file_dates_cache):
+    """Test that no cache is written if ``file_dates_cache_dir`` is unset."""
+    monkeypatch.setitem(CFG, 'file_dates_cache_dir', None)
+    temp_file = tmp_path / 'test.nc'
+    cube = iris.cube.Cube([0, 0], var_name='var')
+    time = iris.coords.DimCoord([0, 59],
+                                'time',
+                                units='days since 1990-01-01')
+    cube.add_dim_coord(time, 0)
+    iris.save(cube, temp_file)
+
+    assert _get_start_end_date(temp_file) == ('19900101', '19900301')
+    assert not file_dates_cache.exists()
+
+
+def test_read_datetime_from_cube_noleap(tmp_path):
+    """Test reading dates from a file with a non-standard calendar."""
+    temp_file = tmp_path / 'test.nc'
+    cube = iris.cube.Cube([0, 0], var_name='var')
+    time = iris.coords.DimCoord(
+        [0, 365],
+        standard_name='time',
+        var_name='t',
+        units=cf_units.Unit('days since 1990-01-01', calendar='noleap'),
+    )
+    cube.add_dim_coord(time, 0)
+    iris.save(cube, temp_file)
+    assert _get_start_end_date(temp_file) == ('19900101', '19910101')
+    assert _get_start_end_year(temp_file) == (1990, 1991)
+
+
 def test_raises_if_unable_to_deduce(monkeypatch, tmp_path):
     """Try to get time from cube if no date in filename."""
     monkeypatch.chdir(tmp_path)
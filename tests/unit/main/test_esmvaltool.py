@@ -50,6 +50,7 @@ def session(cfg):
     ('search_esgf', 'when_missing'),
     ('diagnostics', 'diagnostic_name/group_name'),
     ('check_level', 'strict'),
+    ('refresh_esgf_cache', True),
 ])
 def test_run_command_line_config(mocker, cfg, argument, value):
     """Check that the configuration is updated from the command line."""
@@ -77,9 +78,11 @@ def test_run_command_line_config(mocker, cfg, argument, value):
     assert session[argument] == value
 
 
+@pytest.mark.parametrize('refresh_esgf_cache', [True, False])
 @pytest.mark.parametrize('search_esgf', ['never', 'when_missing', 'always'])
-def test_run(mocker, session, search_esgf):
+def test_run(mocker, session, search_esgf, refresh_esgf_cache):
     session['search_esgf'] = search_esgf
+    session['refresh_esgf_cache'] = refresh_esgf_cache
     session['log_level'] = 'default'
     session['config_file'] = '/path/to/config-user.yml'
     session['remove_preproc_dir'] = True
@@ -108,6 +111,11 @@ def test_run(mocker, session, search_esgf):
         'logon',
         create_autospec=True,
     )
+    mocker.patch.object(
+        esmvalcore.esgf._search,
+        'expire_search_cache',
+        create_autospec=True,
+    )
     mocker.patch.object(
         esmvalcore._main,
         'process_recipe',
@@ -127,6 +135,11 @@ def test_run(mocker, session, search_esgf):
     else:
         esmvalcore.esgf._logon.logon.assert_called_once()
 
+    if search_esgf != 'never' and refresh_esgf_cache:
+        esmvalcore.esgf._search.expire_search_cache.assert_called_once()
+    else:
+        esmvalcore.esgf._search.expire_search_cache.assert_not_called()
+
     esmvalcore._task.resource_usage_logger.assert_called_once_with(
         pid=os.getpid(),
         filename=session.run_dir / 'resource_usage.txt',
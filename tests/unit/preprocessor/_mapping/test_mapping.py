@@ -2,12 +2,17 @@
 from unittest import mock
 
 import cf_units
+import dask.array as da
 import iris
 import numpy as np
 
 import tests
-from esmvalcore.preprocessor._mapping import (get_empty_data, map_slices,
-                                              ref_to_dims_index)
+from esmvalcore.preprocessor._mapping import (
+    get_empty_data,
+    map_blocks,
+    map_slices,
+    ref_to_dims_index,
+)
 
 
 class TestHelpers(tests.Test):
@@ -262,3 +267,39 @@ class Test(tests.Test):
             dim_coords_and_dims=dim_coords_and_dims,
             aux_coords_and_dims=[],
         )
+
+
+def test_map_blocks():
+    """Test map_blocks."""
+    time = iris.coords.DimCoord([0., 1., 2.], standard_name='time',
+                                units='days since 2000-01-01')
+    lat = iris.coords.DimCoord([0., 1.], standard_name='latitude',
+                               units='degrees')
+    lon = iris.coords.DimCoord([0., 1., 2.], standard_name='longitude',
+                               units='degrees')
+    data = da.arange(18, dtype=np.float32, chunks=4).reshape(2, 3, 3)
+    src = iris.cube.Cube(data, var_name='tas', units='K',
+                         dim_coords_and_dims=[(lat, 0), (time, 1), (lon, 2)])
+    src_rep = src[:, 0, :]
+    dst_lat = iris.coords.DimCoord([.5], standard_name='latitude',
+                                   units='degrees')
+    dst_lon = iris.coords.DimCoord([1.], standard_name='longitude',
+                                   units='degrees')
+    dst_rep = iris.cube.Cube(np.zeros((1, 1)),
+                             dim_coords_and_dims=[(dst_lat, 0),
+                                                  (dst_lon, 1)])
+
+    def func(block):
+        """Compute the mean over the horizontal dimensions."""
+        assert block.shape[-2:] == (2, 3)
+        return block.mean(axis=(-2, -1), keepdims=True)
+
+    dst = map_blocks(src, func, src_rep, dst_rep)
+
+    assert dst.has_lazy_data()
+    assert dst.shape == (3, 1, 1)
+    assert dst.coord_dims('time') == (0, )
+    assert dst.coord_dims('latitude') == (1, )
+    assert dst.coord_dims('longitude') == (2, )
+    assert dst.var_name == 'tas'
+    np.testing.assert_allclose(dst.data[:, 0, 0], [5.5, 8.5, 11.5])
@@ -340,7 +340,87 @@ def test_multimodel_statistics(frequency, span, statistics, expected):
         assert_array_allclose(result_cube.data, expected_data)
 
 
-@pytest.mark.xfail(reason='Lazy data not (yet) supported.')
+def test_eager_statistics_combine_once_per_slice():
+    """Test that all statistics are computed from a single combined slice."""
+    cubes = get_cubes_for_validation_test('monthly')
+    statistics = ['mean', 'std_dev', 'min', 'max', 'p10', 'p90', 'rms']
+    with mock.patch.object(mm, '_combine', wraps=mm._combine) as combine:
+        result = multi_model_statistics(cubes, 'full', statistics)
+    n_slices = len(list(mm._compute_slices(cubes)))
+    assert combine.call_count == n_slices
+    assert set(result) == set(statistics)
+    for statistic in statistics:
+        assert not result[statistic].has_lazy_data()
+        assert result[statistic].dtype == np.float32
+
+
+@pytest.mark.parametrize('frequency', FREQUENCY_OPTIONS)
+@pytest.mark.parametrize('span, statistics, expected', VALIDATION_DATA_SUCCESS)
+def test_multimodel_statistics_lazy(frequency, span, statistics, expected):
+    """High level test for lazy multicube statistics function."""
+    cubes = get_cubes_for_validation_test(frequency, lazy=True)
+
+    if isinstance(statistics, str):
+        statistics = (statistics, )
+        expected = (expected, )
+
+    result = multi_model_statistics(cubes, span, statistics)
+
+    assert isinstance(result, dict)
+    assert set(result.keys()) == set(statistics)
+
+    for i, statistic in enumerate(statistics):
+        result_cube = result[statistic]
+        # make sure that temporary coord has been removed
+        with pytest.raises(iris.exceptions.CoordinateNotFoundError):
+            result_cube.coord('multi-model')
+        # test that lazy data in => lazy data out
+        assert result_cube.has_lazy_data()
+        expected_data = np.ma.array(expected[i], mask=False)
+        assert_array_allclose(result_cube.data, expected_data)
+
+
+@pytest.mark.parametrize(
+    'statistic',
+    ['mean', 'std_dev', 'variance', 'sum', 'min', 'max', 'median', 'p10',
+     'rms'],
+)
+def test_lazy_statistics_metadata_equal_eager(statistic):
+    """Test that lazy and eager statistics produce identical cubes."""
+    cubes = get_cubes_for_validation_test('monthly', lazy=True)
+    lazy_result = multi_model_statistics(cubes, 'full', [statistic])
+
+    cubes = get_cubes_for_validation_test('monthly')
+    eager_result = multi_model_statistics(cubes, 'full', [statistic])
+
+    assert lazy_result[statistic].has_lazy_data()
+    assert lazy_result[statistic] == eager_result[statistic]
+
+
+def test_compute_statistics_block_masked():
+    """Test that fully masked points are masked in all statistics."""
+    data = np.ma.array(
+        [[1., 2.], [3., 4.], [5., 6.]],
+        mask=[[False, True], [False, True], [True, True]],
+    )
+    statistics = [
+        ('mean', {}),
+        ('std_dev', {}),
+        ('min', {}),
+        ('percentile', {'percent': 75.}),
+    ]
+
+    result = mm._compute_statistics_block(data, statistics)
+
+    assert result.dtype == np.float32
+    expected = np.ma.array(
+        [[2., 0.], [np.sqrt(2.), 0.], [1., 0.], [2.5, 0.]],
+        mask=[[False, True], [False, True], [False, True], [False, True]],
+    )
+    assert_array_allclose(result, expected)
+    np.testing.assert_array_equal(result.mask, expected.mask)
+
+
 @pytest.mark.parametrize('span', SPAN_OPTIONS)
 def test_lazy_data_consistent_times(span):
     """Test laziness of multimodel statistics with consistent time axis."""
@@ -362,7 +442,6 @@ def test_lazy_data_consistent_times(span):
     assert result_cube.has_lazy_data()
 
 
-@pytest.mark.xfail(reason='Lazy data not (yet) supported.')
 @pytest.mark.parametrize('span', SPAN_OPTIONS)
 def test_lazy_data_inconsistent_times(span):
     """Test laziness of multimodel statistics with inconsistent time axis.
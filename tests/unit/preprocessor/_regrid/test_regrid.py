@@ -12,6 +12,7 @@ import tests
 from esmvalcore.preprocessor import regrid
 from esmvalcore.preprocessor._regrid import (
     _CACHE,
+    _REGRIDDER_CACHE,
     HORIZONTAL_SCHEMES,
     _horizontal_grid_is_close,
 )
@@ -89,6 +90,12 @@ class Test(tests.Test):
         self.mock_stock = self.patch(
             'esmvalcore.preprocessor._regrid._global_stock_cube',
             side_effect=_return_mock_global_stock_cube)
+
+        def _mock_get_regridder(src_cube, tgt_grid, scheme, scheme_key):
+            return lambda cube: cube.regrid(tgt_grid, scheme)
+
+        self.patch('esmvalcore.preprocessor._regrid._get_regridder',
+                   side_effect=_mock_get_regridder)
         self.mocks = [
             self.coord_system, self.coords, self.regrid, self.src_cube,
             self.tgt_grid_coord, self.tgt_grid, self.mock_stock
@@ -262,5 +269,51 @@ def test_regrid_is_skipped_if_grids_are_the_same():
     assert expected_different_cube is not cube
 
 
+@pytest.mark.parametrize('scheme', ['linear', 'nearest', 'area_weighted'])
+def test_regrid_reuses_regridder(scheme):
+    """Test that regridders are re-used for cubes on the same grid."""
+    _REGRIDDER_CACHE.clear()
+    cube1 = _make_cube(lat=LAT_SPEC1, lon=LON_SPEC1)
+    cube1.data = np.arange(cube1.data.size, dtype=float).reshape(cube1.shape)
+    cube2 = cube1.copy(cube1.data * 2.)
+    target_grid = _make_cube(lat=LAT_SPEC2, lon=LON_SPEC2)
+
+    loaded_scheme = HORIZONTAL_SCHEMES[scheme]
+    with mock.patch.object(type(loaded_scheme),
+                           'regridder',
+                           autospec=True,
+                           side_effect=type(loaded_scheme).regridder) as mck:
+        result1 = regrid(cube1, target_grid, scheme)
+        result2 = regrid(cube2, target_grid, scheme)
+    mck.assert_called_once()
+    assert len(_REGRIDDER_CACHE) == 1
+    np.testing.assert_allclose(result2.data, 2. * result1.data)
+    assert result1 == cube1.regrid(target_grid, loaded_scheme)
+
+    # A different target grid requires a new regridder
+    other_grid = _make_cube(lat=LAT_SPEC3, lon=LON_SPEC2)
+    regrid(cube1, other_grid, scheme)
+    assert len(_REGRIDDER_CACHE) == 2
+    _REGRIDDER_CACHE.clear()
+
+
+@pytest.mark.parametrize('name', ['long_name', 'var_name'])
+def test_regrid_regridder_coord_metadata(name):
+    """Test that cubes with different coordinate metadata are regridded."""
+    _REGRIDDER_CACHE.clear()
+    cube1 = _make_cube(lat=LAT_SPEC1, lon=LON_SPEC1)
+    cube2 = cube1.copy()
+    for coord in cube2.coords(axis='x') + cube2.coords(axis='y'):
+        setattr(coord, name, 'other')
+    target_grid = _make_cube(lat=LAT_SPEC2, lon=LON_SPEC2)
+
+    result1 = regrid(cube1, target_grid, 'linear')
+    result2 = regrid(cube2, target_grid, 'linear')
+
+    assert len(_REGRIDDER_CACHE) == 2
+    np.testing.assert_allclose(result2.data, result1.data)
+    _REGRIDDER_CACHE.clear()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,12 +6,15 @@ import cf_units
 import iris
 import numpy as np
 import pytest
+import scipy.sparse
 from iris.exceptions import CoordinateNotFoundError
 
+import esmvalcore.preprocessor._regrid_esmpy as esmpy_module
 import tests
+from esmvalcore.preprocessor._regrid_cache import LRUCache
 from esmvalcore.preprocessor._regrid_esmpy import (
     build_regridder,
-    build_regridder_2d,
+    compute_regridding_weights,
     coords_iris_to_esmpy,
     cube_to_empty_field,
     get_grid,
@@ -20,6 +23,7 @@ from esmvalcore.preprocessor._regrid_esmpy import (
     get_representant,
     is_lon_circular,
     regrid,
+    regrid_block,
 )
 
 
@@ -79,15 +83,7 @@ ESMF_REGRID_METHODS = {
     'nearest': MockRegridMethod.NEAREST_STOD,
 }
 
-MASK_REGRIDDING_MASK_VALUE = {
-    mock.sentinel.rm_bilinear: np.array([1]),
-    mock.sentinel.rm_conserve: np.array([1]),
-    mock.sentinel.rm_nearest_stod: np.array([]),
-}
-
 
-@mock.patch('esmvalcore.preprocessor._regrid_esmpy.MASK_REGRIDDING_MASK_VALUE',
-            MASK_REGRIDDING_MASK_VALUE)
 @mock.patch('esmvalcore.preprocessor._regrid_esmpy.ESMF_REGRID_METHODS',
             ESMF_REGRID_METHODS)
 @mock.patch('esmvalcore.preprocessor._regrid_esmpy.esmpy.Manager', mock.Mock)
@@ -485,96 +481,62 @@ class TestHelpers(tests.Test):
     @mock.patch('esmvalcore.preprocessor._regrid_esmpy.cube_to_empty_field',
                 mock_cube_to_empty_field)
     @mock.patch('esmvalcore.preprocessor._regrid_esmpy.esmpy.Regrid')
-    def test_build_regridder_2d_masked_data(self, mock_regrid):
-        """Test building of 2d regridder for masked data."""
-        mock_regrid.return_value = mock.Mock(return_value=mock.Mock(
-            data=self.data.T))
+    def test_compute_regridding_weights(self, mock_regrid):
+        """Test computation of 2d regridding weights."""
+        mock_regrid.return_value = mock.Mock(
+            get_weights_dict=mock.Mock(return_value={
+                'row_dst': np.array([1, 2, 16]),
+                'col_src': np.array([3, 2, 1]),
+                'weights': np.array([.5, 1., .25]),
+            }),
+        )
         regrid_method = mock.sentinel.rm_bilinear
         src_rep = mock.MagicMock(data=self.data)
         dst_rep = mock.MagicMock()
         src_rep.field = mock.MagicMock(data=self.data.copy())
-        dst_rep.field = mock.MagicMock()
-        build_regridder_2d(src_rep, dst_rep, regrid_method, .99)
-        expected_calls = [
-            mock.call(src_mask_values=np.array([]),
-                      dst_mask_values=np.array([]),
-                      srcfield=src_rep.field,
-                      dstfield=dst_rep.field,
-                      unmapped_action=mock.sentinel.ua_ignore,
-                      ignore_degenerate=True,
-                      regrid_method=regrid_method),
-            mock.call(src_mask_values=np.array([1]),
-                      dst_mask_values=np.array([1]),
-                      regrid_method=regrid_method,
-                      srcfield=src_rep.field,
-                      dstfield=dst_rep.field,
-                      unmapped_action=mock.sentinel.ua_ignore,
-                      ignore_degenerate=True),
-        ]
-        kwargs = mock_regrid.call_args_list[0][-1]
-        expected_kwargs = expected_calls[0][-1]
-        self.assertEqual(expected_kwargs.keys(), kwargs.keys())
-        array_keys = set(['src_mask_values', 'dst_mask_values'])
-        for key in kwargs.keys():
-            if key in array_keys:
-                self.assertTrue((expected_kwargs[key] == kwargs[key]).all())
-            else:
-                self.assertEqual(expected_kwargs[key], kwargs[key])
-        self.assertTrue(mock_regrid.call_args_list[1] == expected_calls[1])
-
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.cube_to_empty_field',
-                mock_cube_to_empty_field)
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.esmpy.Regrid')
-    def test_regridder_2d_unmasked_data(self, mock_regrid):
-        """Test regridder for unmasked 2d data."""
-        field_regridder = mock.Mock(return_value=mock.Mock(data=self.data.T))
-        mock_regrid.return_value = field_regridder
-        regrid_method = mock.sentinel.rm_bilinear
-        src_rep = mock.MagicMock(data=self.data, dtype=np.float32)
-        dst_rep = mock.MagicMock(shape=(4, 4))
-        regridder = build_regridder_2d(src_rep, dst_rep, regrid_method, .99)
-        field_regridder.reset_mock()
-        regridder(src_rep)
-        field_regridder.assert_called_once_with(src_rep.field, dst_rep.field)
-
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.cube_to_empty_field',
-                mock_cube_to_empty_field)
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.esmpy.Regrid')
-    def test_regridder_2d_masked_data(self, mock_regrid):
-        """Test regridder for masked 2d data."""
-        field_regridder = mock.Mock(return_value=mock.Mock(data=self.data.T))
-        mock_regrid.return_value = field_regridder
-        regrid_method = mock.sentinel.rm_bilinear
-        src_rep = mock.MagicMock(data=self.data)
-        dst_rep = mock.MagicMock(shape=(4, 4))
-        regridder = build_regridder_2d(src_rep, dst_rep, regrid_method, .99)
-        field_regridder.reset_mock()
-        regridder(self.cube)
-        field_regridder.assert_called_once_with(src_rep.field, dst_rep.field)
-
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.build_regridder_3d')
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.build_regridder_2d')
-    def test_build_regridder_2(self, mock_regridder_2d, mock_regridder_3d):
+        dst_rep.field = mock.MagicMock(data=self.data.copy())
+        weights = compute_regridding_weights(src_rep, dst_rep, regrid_method)
+        mock_regrid.assert_called_once_with(
+            srcfield=src_rep.field,
+            dstfield=dst_rep.field,
+            regrid_method=regrid_method,
+            unmapped_action=mock.sentinel.ua_ignore,
+            ignore_degenerate=True,
+            factors=True,
+        )
+        mock_regrid.return_value.destroy.assert_called_once_with()
+        self.assertEqual(weights.shape, (16, 16))
+        self.assertEqual(weights[0, 2], .5)
+        self.assertEqual(weights[1, 1], 1.)
+        self.assertEqual(weights[15, 0], .25)
+        self.assertEqual(weights.nnz, 3)
+
+    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.get_regridding_weights')
+    def test_build_regridder_2(self, mock_get_weights):
         """Test build regridder for 2d data."""
-        # pylint: disable=no-self-use
+        mock_get_weights.return_value = mock.sentinel.weights
         src_rep = mock.Mock(ndim=2)
-        dst_rep = mock.Mock(ndim=2)
-        build_regridder(src_rep, dst_rep, 'nearest')
-        mock_regridder_2d.assert_called_once_with(
-            src_rep, dst_rep, mock.sentinel.rm_nearest_stod, .99)
-        mock_regridder_3d.assert_not_called()
-
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.build_regridder_3d')
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.build_regridder_2d')
-    def test_build_regridder_3(self, mock_regridder_2d, mock_regridder_3d):
+        dst_rep = mock.Mock(ndim=2, shape=(4, 4))
+        regridder = build_regridder(src_rep, dst_rep, 'nearest')
+        mock_get_weights.assert_called_once_with(
+            src_rep, dst_rep, mock.sentinel.rm_nearest_stod)
+        self.assertEqual(regridder.keywords, {
+            'weights': mock.sentinel.weights,
+            'mask_threshold': .99,
+            'dst_shape': (4, 4),
+        })
+
+    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.get_regridding_weights')
+    def test_build_regridder_3(self, mock_get_weights):
         """Test build regridder for 3d data."""
-        # pylint: disable=no-self-use
-        src_rep = mock.Mock(ndim=3)
-        dst_rep = mock.Mock(ndim=3)
-        build_regridder(src_rep, dst_rep, 'nearest')
-        mock_regridder_3d.assert_called_once_with(
-            src_rep, dst_rep, mock.sentinel.rm_nearest_stod, .99)
-        mock_regridder_2d.assert_not_called()
+        mock_get_weights.return_value = mock.sentinel.weights
+        src_rep = mock.MagicMock(ndim=3)
+        dst_rep = mock.MagicMock(ndim=3)
+        dst_rep[0].shape = (4, 4)
+        regridder = build_regridder(src_rep, dst_rep, 'nearest')
+        mock_get_weights.assert_called_once_with(
+            src_rep[0], dst_rep[0], mock.sentinel.rm_nearest_stod)
+        self.assertEqual(regridder.keywords['dst_shape'], (4, 4))
 
     @mock.patch('esmvalcore.preprocessor._regrid_esmpy.get_representant')
     def test_get_grid_representant_2d(self, mock_get_representant):
@@ -660,17 +622,93 @@ class TestHelpers(tests.Test):
             aux_coords_and_dims=[(self.scalar_coord, ())],
         )
 
-    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.map_slices')
+    @mock.patch('esmvalcore.preprocessor._regrid_esmpy.map_blocks')
     @mock.patch('esmvalcore.preprocessor._regrid_esmpy.build_regridder')
     @mock.patch('esmvalcore.preprocessor._regrid_esmpy.get_grid_representants',
                 mock.Mock(side_effect=identity))
-    def test_regrid(self, mock_build_regridder, mock_map_slices):
+    def test_regrid(self, mock_build_regridder, mock_map_blocks):
         """Test full regrid method."""
         mock_build_regridder.return_value = mock.sentinel.regridder
-        mock_map_slices.return_value = mock.sentinel.regridded
-        regrid(self.cube_3d, self.cube)
+        mock_map_blocks.return_value = mock.sentinel.regridded
+        self.cube_3d.has_lazy_data.return_value = True
+        result = regrid(self.cube_3d, self.cube)
+        self.assertEqual(result, mock.sentinel.regridded)
         mock_build_regridder.assert_called_once_with(self.cube_3d, self.cube,
                                                      'linear')
-        mock_map_slices.assert_called_once_with(self.cube_3d,
+        mock_map_blocks.assert_called_once_with(self.cube_3d,
                                                 mock.sentinel.regridder,
                                                 self.cube_3d, self.cube)
+
+
+def test_regrid_block_unmasked():
+    """Test regridding a block of unmasked data."""
+    weights = scipy.sparse.csr_matrix(
+        np.array([[.5, .5, 0., 0.], [0., 0., .5, .5], [0., 0., 0., .5]]))
+    block = np.arange(8, dtype=np.float32).reshape(2, 2, 2)
+
+    result = regrid_block(block, weights, .99, (3, 1))
+
+    assert result.dtype == np.float32
+    assert result.shape == (2, 3, 1)
+    expected = np.ma.masked_array(
+        [[[.5], [2.5], [1.5]], [[4.5], [6.5], [3.5]]],
+        mask=[[[False], [False], [True]], [[False], [False], [True]]],
+    )
+    np.testing.assert_array_equal(result.mask, expected.mask)
+    np.testing.assert_allclose(result.compressed(), expected.compressed())
+
+
+def test_regrid_block_masked():
+    """Test regridding a block of data with a mask that varies in time."""
+    weights = scipy.sparse.csr_matrix(
+        np.array([[.995, .005, 0., 0.], [0., 0., .5, .5]]))
+    block = np.ma.masked_array(
+        np.arange(8, dtype=np.float64).reshape(2, 2, 2),
+        mask=[
+            [[False, True], [False, False]],
+            [[False, False], [True, False]],
+        ],
+    )
+
+    result = regrid_block(block, weights, .99, (2, ))
+
+    expected = np.ma.masked_array(
+        [[0., 2.5], [4. * .995 + 5. * .005, 0.]],
+        mask=[[False, False], [False, True]],
+    )
+    np.testing.assert_array_equal(result.mask, expected.mask)
+    np.testing.assert_allclose(result.compressed(), expected.compressed())
+
+
+@pytest.mark.parametrize('cache_dir', [False, True])
+def test_get_regridding_weights_cached(tmp_path, monkeypatch, cache_dir):
+    """Test that regridding weights are only computed once."""
+    module = 'esmvalcore.preprocessor._regrid_esmpy'
+    weights = scipy.sparse.csr_matrix(np.array([[0., .5], [1., 0.]]))
+    monkeypatch.setitem(esmpy_module.CFG, 'regrid_weights_cache_dir',
+                        tmp_path if cache_dir else None)
+    monkeypatch.setattr(esmpy_module, '_WEIGHTS_CACHE', LRUCache())
+    with mock.patch(f'{module}._get_weights_key',
+                    return_value=('key', )), \
+            mock.patch(f'{module}.compute_regridding_weights',
+                       return_value=weights) as compute:
+        result1 = esmpy_module.get_regridding_weights(
+            mock.sentinel.src_rep, mock.sentinel.dst_rep,
+            mock.sentinel.regrid_method)
+        result2 = esmpy_module.get_regridding_weights(
+            mock.sentinel.src_rep, mock.sentinel.dst_rep,
+            mock.sentinel.regrid_method)
+        compute.assert_called_once_with(
+            mock.sentinel.src_rep, mock.sentinel.dst_rep,
+            mock.sentinel.regrid_method)
+        assert result1 is result2
+        assert len(list(tmp_path.glob('*.npz'))) == int(cache_dir)
+
+        # Clear the in-memory cache, the weights are loaded from disk if
+        # available.
+        esmpy_module._WEIGHTS_CACHE.clear()
+        result3 = esmpy_module.get_regridding_weights(
+            mock.sentinel.src_rep, mock.sentinel.dst_rep,
+            mock.sentinel.regrid_method)
+        assert compute.call_count == 2 - int(cache_dir)
+    np.testing.assert_array_equal(result3.toarray(), weights.toarray())
@@ -3,9 +3,12 @@
 from pathlib import Path
 from unittest import mock
 
+import dask
+import numpy as np
 import pytest
 from iris.cube import Cube, CubeList
 
+from esmvalcore.dataset import Dataset
 from esmvalcore.preprocessor import PreprocessorFile
 
 ATTRIBUTES = {
@@ -139,8 +142,9 @@ def test_close():
     product = mock.create_autospec(PreprocessorFile, instance=True)
     product._cubes = CubeList([Cube(0)])
 
-    PreprocessorFile.close(product)
+    result = PreprocessorFile.close(product)
 
+    assert result == product.save.return_value
     product._update_attributes.assert_called_once_with()
     product.save.assert_called_once_with()
     product.save_provenance.assert_called_once_with()
@@ -154,8 +158,9 @@ def test_save_no_cleanup(mock_preprocess):
     product.settings = {'save': {}}
     product._cubes = mock.sentinel.cubes
     product._input_files = mock.sentinel.input_files
+    mock_preprocess.return_value = [mock.sentinel.filename]
 
-    PreprocessorFile.save(product)
+    assert PreprocessorFile.save(product) == []
 
     assert mock_preprocess.mock_calls == [
         mock.call(
@@ -164,6 +169,43 @@ def test_save_no_cleanup(mock_preprocess):
     ]
 
 
+@mock.patch('esmvalcore.preprocessor.preprocess', autospec=True)
+def test_save_delayed(mock_preprocess):
+    """Test ``save`` returns the objects that write the data."""
+    product = mock.create_autospec(PreprocessorFile, instance=True)
+    product.settings = {'save': {'compute': False}}
+    product._cubes = mock.sentinel.cubes
+    product._input_files = mock.sentinel.input_files
+    delayed = dask.delayed(lambda: None)()
+    mock_preprocess.return_value = [delayed]
+
+    assert PreprocessorFile.save(product) == [delayed]
+
+
+@mock.patch('esmvalcore.preprocessor.preprocess', autospec=True)
+def test_save_data_checks(mock_preprocess):
+    """Test ``save`` returns the deferred checks of the data values."""
+    product = mock.create_autospec(PreprocessorFile, instance=True)
+    product.settings = {'save': {'compute': False}}
+    product._cubes = mock.sentinel.cubes
+    product._input_files = mock.sentinel.input_files
+    delayed = dask.delayed(lambda: None)()
+    check = dask.delayed(lambda: None)()
+    mock_preprocess.return_value = [delayed]
+    product.pop_data_checks.return_value = [check]
+
+    assert PreprocessorFile.save(product) == [delayed, check]
+
+
+def test_pop_data_checks(product):
+    """Test ``pop_data_checks``."""
+    check = dask.delayed(lambda: None)()
+    product._data_checks.append(check)
+
+    assert product.pop_data_checks() == [check]
+    assert product.pop_data_checks() == []
+
+
 @mock.patch('esmvalcore.preprocessor.preprocess', autospec=True)
 def test_save_cleanup(mock_preprocess):
     """Test ``save``."""
@@ -171,8 +213,9 @@ def test_save_cleanup(mock_preprocess):
     product.settings = {'save': {}, 'cleanup': {}}
     product._cubes = mock.sentinel.cubes
     product._input_files = mock.sentinel.input_files
+    mock_preprocess.return_value = [mock.sentinel.filename]
 
-    PreprocessorFile.save(product)
+    assert PreprocessorFile.save(product) == []
 
     assert mock_preprocess.mock_calls == [
         mock.call(
@@ -180,3 +223,83 @@ def test_save_cleanup(mock_preprocess):
         ),
         mock.call([], 'cleanup', input_files=mock.sentinel.input_files),
     ]
+
+
+def test_apply_steps_cache(mocker, session, tmp_path):
+    """Test that ``apply_steps`` re-uses cached results."""
+    session['preprocessor_cache_dir'] = tmp_path / 'cache'
+    session['preprocessor_cache_dir'].mkdir()
+    dataset = Dataset(
+        short_name='ta',
+        mip='Amon',
+        project='CMIP6',
+        dataset='CanESM5',
+        exp='historical',
+        ensemble='r1i1p1f1',
+        grid='gn',
+    )
+    dataset.session = session
+    dataset.files = [tmp_path / 'ta.nc']
+    dataset.files[0].write_text('data')
+    cube = Cube(np.arange(3.), var_name='ta', units='K')
+    load = mocker.patch.object(
+        Dataset, '_load_with_callback', return_value=cube)
+
+    applied = []
+
+    def mock_preprocess(cubes, step, **kwargs):
+        applied.append(step)
+        return cubes
+
+    mocker.patch('esmvalcore.preprocessor.preprocess', mock_preprocess)
+
+    steps = ['extract_levels', 'regrid', 'area_statistics']
+
+    def apply_steps(settings):
+        product = PreprocessorFile(
+            filename=tmp_path / 'output.nc',
+            settings=settings,
+            datasets=[dataset],
+        )
+        applied.clear()
+        load.reset_mock()
+        product.apply_steps(steps)
+        return product
+
+    settings = {
+        'extract_levels': {'levels': 85000, 'scheme': 'linear'},
+        'regrid': {'target_grid': '1x1', 'scheme': 'linear'},
+        'area_statistics': {'operator': 'mean'},
+    }
+    apply_steps(settings)
+    assert applied == steps
+    assert len(list(session['preprocessor_cache_dir'].glob('*.nc'))) == 2
+
+    # Only the step after the last checkpoint is re-run.
+    settings['area_statistics'] = {'operator': 'max'}
+    product = apply_steps(settings)
+    assert applied == ['area_statistics']
+    load.assert_not_called()
+    np.testing.assert_array_equal(product.cubes[0].data, cube.data)
+
+    # The steps after the first checkpoint are re-run.
+    settings['regrid'] = {'target_grid': '2x2', 'scheme': 'linear'}
+    apply_steps(settings)
+    assert applied == ['regrid', 'area_statistics']
+    load.assert_not_called()
+
+
+def test_apply_steps_no_cache(mocker, tmp_path):
+    """Test ``apply_steps`` without cache."""
+    product = PreprocessorFile(
+        filename=tmp_path / 'output.nc',
+        settings={'regrid': {}, 'area_statistics': {}},
+    )
+    apply = mocker.patch.object(product, 'apply')
+
+    product.apply_steps(['regrid', 'area_statistics'], debug=True)
+
+    assert apply.mock_calls == [
+        mock.call('regrid', True),
+        mock.call('area_statistics', True),
+    ]
@@ -0,0 +1,67 @@
+"""Unit tests for :mod:`esmvalcore.preprocessor._regrid_cache`."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from esmvalcore.preprocessor._regrid_cache import LRUCache
+
+
+def test_lru_cache():
+    """Test that the least recently used item is discarded."""
+    cache = LRUCache(maxsize=2)
+    assert cache.get('a', lambda: 1) == 1
+    assert cache.get('b', lambda: 2) == 2
+    assert cache.get('a', lambda: 3) == 1
+    assert cache.get('c', lambda: 4) == 4
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_factory_fails():
+    """Test that an item is not cached if it cannot be created."""
+    cache = LRUCache()
+
+    def factory():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        cache.get('a', factory)
+    assert 'a' not in cache
+    assert cache.get('a', lambda: 1) == 1
+
+
+def test_lru_cache_creates_item_once():
+    """Test that concurrent requests for an item only create it once."""
+    cache = LRUCache()
+    calls = []
+
+    def factory():
+        calls.append(threading.get_ident())
+        time.sleep(0.1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        items = list(executor.map(lambda _: cache.get('a', factory),
+                                  range(8)))
+    assert len(calls) == 1
+    assert all(item is items[0] for item in items)
+
+
+def test_lru_cache_concurrent_eviction():
+    """Test that items can be retrieved while others are being discarded."""
+    cache = LRUCache(maxsize=4)
+
+    def get_items(offset):
+        return [cache.get(i % 10, lambda i=i: i % 10)
+                for i in range(offset, offset + 1000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get_items, range(8)))
+    for offset, items in enumerate(results):
+        assert items == [i % 10 for i in range(offset, offset + 1000)]
+    assert len(cache) == 4
@@ -570,7 +570,7 @@ def test_get_default_settings(mocker):
     assert settings == {
         'load': {'callback': 'default'},
         'remove_supplementary_variables': {},
-        'save': {'compress': False, 'alias': 'sic'},
+        'save': {'compress': False, 'compute': False, 'alias': 'sic'},
     }
 
 
@@ -663,3 +663,46 @@ def test_extract_preprocessor_order():
     order = _recipe._extract_preprocessor_order(profile)
     assert any(order[i:i + 2] == ('regrid', 'derive')
                for i in range(len(order) - 1))
+
+
+def test_get_download_order(mocker, tmp_path):
+    """Test that files are downloaded in the order the tasks will run."""
+    files = [
+        mocker.create_autospec(ESGFFile, instance=True) for _ in range(3)
+    ]
+    for i, file in enumerate(files):
+        file.local_file.return_value = tmp_path / f'file{i}.nc'
+        file.__lt__.side_effect = lambda other, i=i: i < files.index(other)
+
+    tasks = []
+    for priority, i in enumerate([2, 0]):
+        task = _recipe.BaseTask(name=f'task{priority}')
+        task.priority = priority
+        product = mock.Mock(_input_files=[tmp_path / f'file{i}.nc'])
+        task.products = {product}
+        tasks.append(task)
+
+    recipe = MockRecipe({'download_dir': tmp_path}, {})
+    recipe._download_files = set(files)
+    recipe.tasks = _recipe.TaskSet(tasks)
+    assert recipe._get_download_order() == [files[2], files[0], files[1]]
+
+
+def test_background_download_is_available(mocker, tmp_path):
+    """Test that tasks are available once their files are downloaded."""
+    input_file = tmp_path / 'file.nc'
+    task = _recipe.BaseTask(name='task')
+    task.products = {mock.Mock(_input_files=[input_file])}
+
+    download = _recipe._BackgroundDownload([], tmp_path)
+    mocker.patch.object(download, 'is_alive', return_value=True)
+    assert not download.is_available(task)
+
+    input_file.touch()
+    assert download.is_available(task)
+
+    input_file.unlink()
+    download.is_alive.return_value = False
+    download.error = _recipe.DownloadError('Failed to download file.nc')
+    with pytest.raises(_recipe.DownloadError, match='file.nc'):
+        download.is_available(task)
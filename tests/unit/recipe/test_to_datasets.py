@@ -384,3 +384,53 @@ def test_append_missing_supplementaries():
 
     short_names = {f['short_name'] for f in supplementaries}
     assert short_names == {'areacella', 'sftlf'}
+
+
+@pytest.mark.parametrize('search_esgf', ['never', 'when_missing', 'always'])
+def test_prefetch_esgf_searches(mocker, session, search_esgf):
+    session['search_esgf'] = search_esgf
+    find_files = mocker.patch.object(to_datasets.esgf,
+                                     'find_files_concurrently',
+                                     autospec=True)
+
+    def find_local_files(self):
+        if self['short_name'] == 'tas':
+            self.files = [LocalFile('tas_Amon_2000-2001.nc')]
+        else:
+            self.files = []
+
+    mocker.patch.object(Dataset,
+                        '_find_local_files',
+                        autospec=True,
+                        side_effect=find_local_files)
+
+    facets = {
+        'project': 'CMIP6',
+        'mip': 'Amon',
+        'dataset': 'CanESM5',
+        'exp': 'historical',
+        'ensemble': 'r1i1p1f1',
+        'timerange': '*',
+    }
+    datasets = [
+        Dataset(short_name='tas', **facets),
+        Dataset(short_name='pr', **facets),
+        Dataset(short_name='tas', project='OBS', dataset='ERA5', mip='Amon'),
+    ]
+    for dataset in datasets:
+        dataset.session = session
+
+    to_datasets._prefetch_esgf_searches(datasets, session)
+
+    if search_esgf == 'never':
+        find_files.assert_not_called()
+    else:
+        facet_sets = find_files.call_args.args[0]
+        short_names = [f['short_name'] for f in facet_sets]
+        if search_esgf == 'when_missing':
+            assert short_names == ['pr']
+        else:
+            assert short_names == ['tas', 'pr']
+        assert all('timerange' not in f for f in facet_sets)
+    # The datasets themselves are not modified
+    assert datasets[0].facets['timerange'] == '*'
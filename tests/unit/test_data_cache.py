@@ -0,0 +1,99 @@
+import os
+
+import dask
+import iris.cube
+import numpy as np
+import pytest
+
+from esmvalcore._data_cache import (
+    DataCache,
+    get_file_fingerprint,
+    get_key,
+    get_source_fingerprint,
+)
+from esmvalcore.cmor._fixes.fix import Fix
+
+
+@pytest.fixture
+def cube():
+    return iris.cube.Cube(np.arange(10000.), var_name='tas', units='K')
+
+
+def test_get_file_fingerprint(tmp_path):
+    path = tmp_path / 'file.nc'
+    path.write_text('data')
+    fingerprint = get_file_fingerprint(path)
+    assert fingerprint[:2] == (str(path), 4)
+
+    path.write_text('more data')
+    assert get_file_fingerprint(path) != fingerprint
+
+
+def test_get_source_fingerprint():
+    fingerprint = get_source_fingerprint([Fix(None)])
+    assert fingerprint == get_source_fingerprint([Fix(None), Fix(None)])
+    assert fingerprint != get_source_fingerprint([])
+
+
+def test_get_key():
+    assert get_key('a', 1) == get_key('a', 1)
+    assert get_key('a', 1) != get_key('a', 2)
+
+
+def test_load_missing(tmp_path):
+    cache = DataCache(tmp_path)
+    assert cache.load('key') is None
+
+
+def test_save_load(tmp_path, cube):
+    cache = DataCache(tmp_path)
+    saved = cache.save('key', cube)
+    assert saved.has_lazy_data()
+    assert cache.path('key').exists()
+    assert not list(tmp_path.glob('.*'))
+
+    loaded = cache.load('key')
+    assert loaded.has_lazy_data()
+    assert loaded.var_name == 'tas'
+    np.testing.assert_array_equal(loaded.data, cube.data)
+
+
+def test_save_with_delayeds(tmp_path, cube):
+    cache = DataCache(tmp_path)
+    called = []
+    delayed = dask.delayed(called.append)(1)
+    cache.save('key', cube, [delayed])
+    assert called == [1]
+    assert cache.path('key').exists()
+
+
+def test_save_with_failing_delayeds(tmp_path, cube):
+    cache = DataCache(tmp_path)
+
+    def fail():
+        raise ValueError('check failed')
+
+    with pytest.raises(ValueError, match='check failed'):
+        cache.save('key', cube, [dask.delayed(fail)()])
+    assert not list(tmp_path.iterdir())
+
+
+def test_evict(tmp_path, cube):
+    cache = DataCache(tmp_path)
+    cache.save('key1', cube)
+    cache.save('key2', cube)
+    size = cache.path('key1').stat().st_size
+    # Make sure key1 is the least recently used item.
+    os.utime(cache.path('key1'), ns=(0, 0))
+
+    cache.max_size = 2.5 * size
+    cache.save('key3', cube)
+    assert not cache.path('key1').exists()
+    assert cache.path('key2').exists()
+    assert cache.path('key3').exists()
+
+
+def test_evict_keeps_new_file(tmp_path, cube):
+    cache = DataCache(tmp_path, max_size=1)
+    cache.save('key', cube)
+    assert cache.path('key').exists()
@@ -3,6 +3,8 @@ from collections import defaultdict
 from pathlib import Path
 from unittest import mock
 
+import iris.cube
+import numpy as np
 import pyesgf
 import pytest
 
@@ -1376,7 +1378,7 @@ def test_find_files(mocker, dataset, local_availability):
 
     mocker.patch.object(
         esmvalcore.dataset.local,
-        'find_files',
+        '_find_files',
         autospec=True,
         return_value=(list(local_files), []),
     )
@@ -1413,7 +1415,7 @@ def test_find_files_wildcard_timerange(mocker, dataset):
 
     mocker.patch.object(
         esmvalcore.dataset.local,
-        'find_files',
+        '_find_files',
         autospec=True,
         return_value=(local_files, []),
     )
@@ -1449,7 +1451,7 @@ def test_find_files_outdated_local(mocker, dataset):
 
     mocker.patch.object(
         esmvalcore.dataset.local,
-        'find_files',
+        '_find_files',
         autospec=True,
         return_value=(local_files, []),
     )
@@ -1472,7 +1474,7 @@ def test_find_files_non_esgf_projects(mocker, project, monkeypatch):
     monkeypatch.setitem(CFG, 'search_esgf', 'always')
     mock_local_find_files = mocker.patch.object(
         esmvalcore.dataset.local,
-        'find_files',
+        '_find_files',
         autospec=True,
         return_value=(mock.sentinel.files, mock.sentinel.file_globs),
     )
@@ -1688,6 +1690,7 @@ def test_load(mocker, session):
         },
         'fix_file': {
             'add_unique_suffix': True,
+            'allow_overlay': True,
             'dataset': 'CanESM2',
             'ensemble': 'r1i1p1',
             'exp': 'historical',
@@ -1748,6 +1751,59 @@ def test_load(mocker, session):
     _get_output_file.assert_called_with(dataset.facets, session.preproc_dir)
 
 
+def test_load_data_cache(mocker, session, tmp_path):
+    dataset = Dataset(
+        short_name='tas',
+        mip='Amon',
+        project='CMIP6',
+        dataset='CanESM5',
+        exp='historical',
+        ensemble='r1i1p1f1',
+        grid='gn',
+        frequency='mon',
+        diagnostic='diag1',
+    )
+    session['fixed_data_cache_dir'] = tmp_path / 'cache'
+    session['fixed_data_cache_dir'].mkdir()
+    dataset.session = session
+    input_file = tmp_path / 'tas.nc'
+    input_file.write_text('data')
+    dataset.files = [input_file]
+    mocker.patch.object(
+        esmvalcore.dataset,
+        '_get_output_file',
+        return_value=tmp_path / 'output.nc',
+    )
+    cube = iris.cube.Cube([1., 2.], var_name='tas', units='K')
+    steps = []
+
+    def mock_preprocess(items, step, input_files, output_file, debug,
+                        **kwargs):
+        steps.append(step)
+        return [cube] if step == 'load' else items
+
+    mocker.patch.object(esmvalcore.dataset, 'preprocess', mock_preprocess)
+
+    result1 = dataset.load()
+    assert steps[-2:] == ['cmor_check_data', 'add_supplementary_variables']
+    assert len(list(session['fixed_data_cache_dir'].glob('*.nc'))) == 1
+
+    # The second time, the data is loaded from the cache.
+    steps.clear()
+    dataset2 = dataset.copy(diagnostic='diag2')
+    dataset2.files = dataset.files
+    result2 = dataset2.load()
+    assert steps == ['add_supplementary_variables']
+    assert result2.var_name == result1.var_name
+    np.testing.assert_array_equal(result2.data, cube.data)
+
+    # The cache is invalidated if the input files change.
+    steps.clear()
+    input_file.write_text('new data')
+    dataset.load()
+    assert 'cmor_check_data' in steps
+
+
 def test_load_fail(session):
     dataset = Dataset()
     dataset.session = session